@@ -0,0 +1,49 @@
+import os
+
+from click import command, option, IntRange, Path
+
+from app.config.logging_config import set_logging_config
+
+
+@command()
+@option('--filepath', help='Path of the edge list, one "source<delimiter>sink" edge per line, optionally gzipped',
+        type=Path(), default=os.path.join(os.path.dirname(os.path.dirname(__file__)), 'tmp', 'edges.tsv'))
+@option('--delimiter', help='Delimiter between the source and the sink of an edge', type=str, default='\t')
+@option('--skip-header', help='Skip the first line of the file', is_flag=True, default=False)
+@option('--use-csr-backend', help='Compact the graph to the CSR backend once loaded', is_flag=True, default=False)
+@option('--output-dir', help='Directory the graph is serialized to as a pickle', type=Path(), default=None)
+@option('--summary-only', help='Only print the number of vertices and edges, and the top k degrees with --top-k',
+        is_flag=True, default=False)
+@option('--top-k', help='Only print the k vertices of highest in and out degrees', type=IntRange(min=1),
+        default=None)
+@option('--output', help='Path of a NumPy .npz file the degrees are written to instead of the standard output',
+        type=Path(), default=None)
+def build_graph_from_edge_list_file(filepath: str, delimiter: str, skip_header: bool, use_csr_backend: bool,
+                                    output_dir: str, summary_only: bool, top_k: int, output: str) -> None:
+    # Imported once the arguments are parsed, so that --help and argument errors do not wait for NumPy
+    from app.degrees import VertexDegrees
+    from app.degrees_output import output_degrees
+    from app.directed_graph import DirectedGraph
+    from app.edge_list_loader import EdgeListReport
+
+    directed_graph: DirectedGraph = DirectedGraph(use_csr_backend=use_csr_backend)
+    report: EdgeListReport = directed_graph.build_graph_from_edge_list_file(filepath, delimiter=delimiter,
+                                                                            skip_header=skip_header)
+
+    print("Summary of the graph you entered: ")
+    print(f'# Number of vertices is {directed_graph.compute_number_of_vertices()}')
+    print(f'# Number of edges is {directed_graph.compute_number_of_edges()}')
+    print(f'# Number of skipped malformed lines is {report.number_of_malformed_lines}')
+    if not summary_only or top_k is not None or output is not None:
+        in_degrees: VertexDegrees = directed_graph.compute_in_degrees_array()
+        out_degrees: VertexDegrees = directed_graph.compute_out_degrees_array()
+        output_degrees(in_degrees.vertices, in_degrees.degrees, out_degrees.degrees, top_k=top_k,
+                       output_filepath=output)
+
+    if output_dir is not None:
+        print(f'# Serialized to {directed_graph.serialize_graph(output_dir)}')
+
+
+if __name__ == '__main__':
+    set_logging_config()
+    build_graph_from_edge_list_file()
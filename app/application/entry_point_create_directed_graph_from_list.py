@@ -1,10 +1,9 @@
 import os
-from typing import List, Tuple, Dict
+from typing import List, Tuple
 
-from click import command, option
+from click import command, option, IntRange, Path
 
 from app.config.logging_config import set_logging_config
-from app.directed_graph import DirectedGraph
 
 
 @command()
@@ -12,21 +11,33 @@ from app.directed_graph import DirectedGraph
 @option('--edges-list', help='List of edges', type=(str, str), multiple=True,
         default=[('a', 'b'), ('a', 'b'), ('d', 'c'), ('b', 'd'), ('a', 'd'), ('c', 'a'),
                  ('b', 'b')])
-def build_graph_from_lists(vertices_list: List[str], edges_list: List[Tuple[str, str]]) -> None:
+@option('--summary-only', help='Only print the number of vertices and edges, and the top k degrees with --top-k',
+        is_flag=True, default=False)
+@option('--top-k', help='Only print the k vertices of highest in and out degrees', type=IntRange(min=1),
+        default=None)
+@option('--output', help='Path of a NumPy .npz file the degrees are written to instead of the standard output',
+        type=Path(), default=None)
+def build_graph_from_lists(vertices_list: List[str], edges_list: List[Tuple[str, str]], summary_only: bool,
+                           top_k: int, output: str) -> None:
+    # Imported once the arguments are parsed, so that --help and argument errors do not wait for NumPy
+    from app.degrees import VertexDegrees
+    from app.degrees_output import output_degrees
+    from app.directed_graph import DirectedGraph
+
     directed_graph: DirectedGraph = DirectedGraph()
     directed_graph.build_graph_from_vertices_and_edges(vertices_list=vertices_list, edges_list=edges_list)
 
     vertices_number: int = directed_graph.compute_number_of_vertices()
     edges_number: int = directed_graph.compute_number_of_edges()
 
-    in_degrees: Dict[str, int] = directed_graph.compute_in_degrees_per_vertex()
-    out_degrees: Dict[str, int] = directed_graph.compute_out_degrees_per_vertex()
-
     print("Summary of the graph you entered: ")
     print(f'# Number of vertices is {vertices_number}')
     print(f'# Number of edges is {edges_number}')
-    print(f'# in degrees are {in_degrees}')
-    print(f'# out degrees are {out_degrees}')
+    if not summary_only or top_k is not None or output is not None:
+        in_degrees: VertexDegrees = directed_graph.compute_in_degrees_array()
+        out_degrees: VertexDegrees = directed_graph.compute_out_degrees_array()
+        output_degrees(in_degrees.vertices, in_degrees.degrees, out_degrees.degrees, top_k=top_k,
+                       output_filepath=output)
 
     directed_graph.serialize_graph(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'tmp'))
 
@@ -0,0 +1,51 @@
+import os
+import time
+from typing import Dict, List, Tuple
+
+from click import command, option, Choice, Path
+
+from app.config.benchmark_config import DEFAULT_REPEAT, DEFAULT_SIZES, DEFAULT_WORKERS, GENERATOR_NAMES
+from app.config.logging_config import set_logging_config
+from app.utils import create_dir_if_not_exist
+
+
+@command()
+@option('--generators', help='Synthetic graph generators', type=Choice(list(GENERATOR_NAMES)), multiple=True,
+        default=list(GENERATOR_NAMES))
+@option('--sizes', help='Numbers of edges of the generated graphs', type=int, multiple=True,
+        default=list(DEFAULT_SIZES))
+@option('--repeat', help='Number of runs of every operation, the fastest one being kept', type=int,
+        default=DEFAULT_REPEAT)
+@option('--workers', help='Number of processes of the parallel streaming benchmark', type=int,
+        default=DEFAULT_WORKERS)
+@option('--output', help='Path of the JSON report', type=Path(), default=None)
+@option('--baseline', help='JSON report of a previous run to compare wall times with', type=Path(exists=True),
+        default=None)
+def run_benchmarks(generators: List[str], sizes: List[int], repeat: int, workers: int, output: str,
+                   baseline: str) -> None:
+    # Imported once the arguments are parsed, so that --help and argument errors do not wait for NumPy
+    from app.benchmark import BenchmarkResult, BenchmarkRunner, compare_results, read_results, write_results
+
+    tmp_dir: str = create_dir_if_not_exist(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'tmp'))
+    if output is None:
+        output = os.path.join(tmp_dir, f'benchmarks_{time.strftime("%Y%m%d-%H%M%S")}.json')
+
+    results: List[BenchmarkResult] = BenchmarkRunner(work_dir=tmp_dir, repeat=repeat, workers=workers).run(
+        generator_names=generators, sizes=sizes)
+    write_results(results, output)
+
+    for result in results:
+        print(f'{result.generator}\t{result.number_of_edges}\t{result.operation}\t{result.wall_time_seconds:.4f}s\t'
+              f'{result.edges_per_second:.0f} edges/s\t{result.peak_rss_bytes} bytes')
+    print(f'# Report written to {output}')
+
+    if baseline is not None:
+        ratios: Dict[Tuple[str, int, str], float] = compare_results(read_results(baseline), results)
+        print(f'# Wall time compared to {baseline}')
+        for (generator, number_of_edges, operation), ratio in ratios.items():
+            print(f'{generator}\t{number_of_edges}\t{operation}\t{ratio:.2f}x')
+
+
+if __name__ == '__main__':
+    set_logging_config()
+    run_benchmarks()
@@ -1,29 +1,76 @@
 import os
-from typing import Dict
+import sys
+from typing import Any, Dict, List
 
-from click import command, option, Path
+from click import command, option, IntRange, Path
 
 from app.config.logging_config import set_logging_config
-from app.directed_graph import DirectedGraph
 
 
 @command()
 @option('--filepath', help='Path of the serialized graph', type=Path(),
         default=os.path.join(os.path.dirname(os.path.dirname(__file__)), 'tmp', 'graph.pickle'))
-def work_on_graph_from_pickle_file_streaming(filepath: str) -> None:
-    directed_graph: DirectedGraph = DirectedGraph()
+@option('--max-vertices-in-memory', help='Spill degrees to sorted runs on disk above this number of vertices',
+        type=int, default=None)
+@option('--workers', help='Number of processes reading the chunks of an indexed file in parallel', type=int,
+        default=1)
+@option('--metrics-file', help='Path of a file the metrics of the computation are written to, in Prometheus text format',
+        type=Path(), default=None)
+@option('--summary-only', help='Only print the number of vertices and edges, and the top k degrees with --top-k',
+        is_flag=True, default=False)
+@option('--top-k', help='Only print the k vertices of highest in and out degrees', type=IntRange(min=1),
+        default=None)
+@option('--output', help='Path of a NumPy .npz file the degrees are written to instead of the standard output',
+        type=Path(), default=None)
+def work_on_graph_from_pickle_file_streaming(filepath: str, max_vertices_in_memory: int, workers: int,
+                                             metrics_file: str, summary_only: bool, top_k: int, output: str) -> None:
+    # Imported once the arguments are parsed, so that --help and argument errors do not wait for NumPy
+    from app.degrees_output import align_degrees, collect_degree_columns, output_degrees, write_degree_rows
+    from app.directed_graph import DirectedGraph
+    from app.external_merge import MergedDegrees
+    from app.metrics import PrometheusTextExporter
+    from app.stream_accumulators import NumberOfEdgesAccumulator, NumberOfVerticesAccumulator, StreamAccumulator
 
-    vertices_number: int = directed_graph.stream_compute_number_of_vertices(pickle_filepath=filepath)
-    edges_number: int = directed_graph.stream_compute_number_of_edges(pickle_filepath=filepath)
+    metrics_exporter: PrometheusTextExporter = PrometheusTextExporter(metrics_file) if metrics_file else None
+    directed_graph: DirectedGraph = DirectedGraph(metrics_hook=metrics_exporter)
+    print_degrees: bool = not summary_only or top_k is not None or output is not None
 
-    in_degrees: Dict[str, int] = directed_graph.stream_compute_in_degrees_per_vertex(pickle_filepath=filepath)
-    out_degrees: Dict[str, int] = directed_graph.stream_compute_out_degrees_per_vertex(pickle_filepath=filepath)
+    if max_vertices_in_memory is not None:
+        merged_degrees: MergedDegrees = directed_graph.stream_compute_merged_degrees(
+            pickle_filepath=filepath, max_vertices_in_memory=max_vertices_in_memory)
+        print("Summary of the graph you entered: ")
+        print(f'# Number of vertices is {merged_degrees.number_of_vertices}')
+        print(f'# Number of edges is {merged_degrees.number_of_edges}')
+        if print_degrees and top_k is None and output is None:
+            # Streamed from the merged run on disk, the degrees are never all held in memory
+            print('# in and out degrees are')
+            write_degree_rows(merged_degrees, sys.stdout)
+        elif print_degrees:
+            output_degrees(*collect_degree_columns(merged_degrees), top_k=top_k, output_filepath=output)
+        if metrics_exporter is not None:
+            metrics_exporter.export()
+        return
+
+    # Without degrees to print, only the counts are accumulated and no degree table is built
+    accumulators: List[StreamAccumulator] = None if print_degrees else [NumberOfVerticesAccumulator(),
+                                                                        NumberOfEdgesAccumulator()]
+    if workers > 1:
+        statistics: Dict[str, Any] = directed_graph.stream_compute_statistics_in_parallel(
+            pickle_filepath=filepath, accumulators=accumulators, workers=workers)
+    else:
+        statistics = directed_graph.stream_compute_statistics(pickle_filepath=filepath, accumulators=accumulators)
+    if metrics_exporter is not None:
+        metrics_exporter.export()
+
+    vertices_number: int = statistics['number_of_vertices']
+    edges_number: int = statistics['number_of_edges']
 
     print("Summary of the graph you entered: ")
     print(f'# Number of vertices is {vertices_number}')
     print(f'# Number of edges is {edges_number}')
-    print(f'# in degrees are {in_degrees}')
-    print(f'# out degrees are {out_degrees}')
+    if print_degrees:
+        output_degrees(*align_degrees(statistics['in_degrees'], statistics['out_degrees']), top_k=top_k,
+                       output_filepath=output)
 
 
 if __name__ == '__main__':
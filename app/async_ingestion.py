@@ -0,0 +1,145 @@
+import asyncio
+import contextlib
+from typing import AsyncIterable, AsyncIterator, Iterator, List, Optional, Tuple
+
+from app.config.logging_config import Logger
+from app.directed_graph import DirectedGraph
+
+DEFAULT_BATCH_SIZE = 10_000
+DEFAULT_MAX_PENDING_BATCHES = 8
+DEFAULT_FLUSH_INTERVAL = 0.1
+DEFAULT_READ_SIZE = 64 * 1024
+
+Edge = Tuple[str, str]
+
+
+class AsyncEdgeIngestor:
+
+    def __init__(self, directed_graph: DirectedGraph, batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_pending_batches: int = DEFAULT_MAX_PENDING_BATCHES, create_missing_vertices: bool = True):
+        if directed_graph.adjacency_list is None:
+            directed_graph.build_graph_from_vertices_and_edges(vertices_list=[], edges_list=[])
+        self.directed_graph: DirectedGraph = directed_graph
+        self.batch_size: int = batch_size
+        self.max_pending_batches: int = max_pending_batches
+        self.create_missing_vertices: bool = create_missing_vertices
+        self.number_of_ingested_edges: int = 0
+        self.number_of_malformed_lines: int = 0
+        self.logger = Logger(__class__.__name__).create()
+
+    async def ingest(self, edges: AsyncIterable[Edge]) -> int:
+        return await self._ingest_batches(self._batch_edges(edges))
+
+    async def ingest_queue(self, queue: asyncio.Queue, flush_interval: float = DEFAULT_FLUSH_INTERVAL) -> int:
+        # Consumes edges until a None sentinel is read from the queue
+        return await self._ingest_batches(self._batch_queue(queue, flush_interval))
+
+    async def ingest_stream(self, reader: asyncio.StreamReader, delimiter: str = '\t',
+                            read_size: int = DEFAULT_READ_SIZE) -> int:
+        # Consumes one "source<delimiter>sink" edge per line until the end of the stream
+        return await self._ingest_batches(self._batch_stream(reader, delimiter.encode('utf-8'), read_size))
+
+    async def _ingest_batches(self, batches: AsyncIterator[List[Edge]]) -> int:
+        # The bounded queue between the producer and the graph applies backpressure: when batches are produced faster
+        # than they are applied, the producer waits, and so does whatever feeds it (socket, queue, ...)
+        pending_batches: asyncio.Queue = asyncio.Queue(maxsize=self.max_pending_batches)
+        producer: asyncio.Future = asyncio.ensure_future(self._produce(batches, pending_batches))
+        number_of_edges_before: int = self.number_of_ingested_edges
+        try:
+            while True:
+                batch: Optional[List[Edge]] = await pending_batches.get()
+                if batch is None:
+                    break
+                self.number_of_ingested_edges += self.directed_graph.add_edges(
+                    batch, create_missing_vertices=self.create_missing_vertices)
+                # Lets other coroutines, e.g. statistics queries, run between two batches
+                await asyncio.sleep(0)
+        except BaseException:
+            producer.cancel()
+            # The producer is awaited so that it does not outlive the ingestion, its own error being superseded
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await producer
+            raise
+        await producer
+        self.logger.info(f'Ingested {self.number_of_ingested_edges - number_of_edges_before} edges')
+        return self.number_of_ingested_edges - number_of_edges_before
+
+    @staticmethod
+    async def _produce(batches: AsyncIterator[List[Edge]], pending_batches: asyncio.Queue) -> None:
+        try:
+            async for batch in batches:
+                await pending_batches.put(batch)
+        except asyncio.CancelledError:
+            # Cancelled when applying a batch failed: the queue may stay full since nobody reads it anymore
+            with contextlib.suppress(asyncio.QueueFull):
+                pending_batches.put_nowait(None)
+            raise
+        except BaseException:
+            await pending_batches.put(None)
+            raise
+        await pending_batches.put(None)
+
+    async def _batch_edges(self, edges: AsyncIterable[Edge]) -> AsyncIterator[List[Edge]]:
+        batch: List[Edge] = []
+        async for edge in edges:
+            batch.append(edge)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def _batch_queue(self, queue: asyncio.Queue, flush_interval: float) -> AsyncIterator[List[Edge]]:
+        batch: List[Edge] = []
+        while True:
+            try:
+                # A partial batch is flushed when no edge arrived during flush_interval
+                edge: Optional[Edge] = await asyncio.wait_for(queue.get(), flush_interval) if batch \
+                    else await queue.get()
+            except asyncio.TimeoutError:
+                yield batch
+                batch = []
+                continue
+            if edge is None:
+                break
+            batch.append(edge)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def _batch_stream(self, reader: asyncio.StreamReader, delimiter: bytes,
+                            read_size: int) -> AsyncIterator[List[Edge]]:
+        # Every read returns what is available on the stream, so batches follow the pace of the producer, up to
+        # batch_size edges
+        remainder: bytes = b''
+        while True:
+            block: bytes = await reader.read(read_size)
+            if not block:
+                break
+            lines: List[bytes] = (remainder + block).split(b'\n')
+            remainder = lines.pop()
+            for batch in self._split_batch(self._parse_lines(lines, delimiter)):
+                yield batch
+        for batch in self._split_batch(self._parse_lines([remainder], delimiter)):
+            yield batch
+
+    def _split_batch(self, edges: List[Edge]) -> Iterator[List[Edge]]:
+        # A read may hold more edges than batch_size, which is the maximum size of a batch
+        for start in range(0, len(edges), self.batch_size):
+            yield edges[start:start + self.batch_size]
+
+    def _parse_lines(self, lines: List[bytes], delimiter: bytes) -> List[Edge]:
+        edges: List[Edge] = []
+        for line in lines:
+            line = line.rstrip(b'\r')
+            if not line:
+                continue
+            fields: List[bytes] = line.split(delimiter)
+            if len(fields) != 2:
+                self.number_of_malformed_lines += 1
+                self.logger.warning(f'Skipped malformed edge line {line[:100]!r}')
+                continue
+            edges.append((fields[0].decode('utf-8'), fields[1].decode('utf-8')))
+        return edges
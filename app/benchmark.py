@@ -0,0 +1,170 @@
+import json
+import multiprocessing
+import os
+import platform
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Tuple
+
+import numpy as np
+
+from app.config.benchmark_config import DEFAULT_REPEAT, DEFAULT_SIZES, DEFAULT_WORKERS
+from app.config.logging_config import Logger
+from app.directed_graph import DirectedGraph
+from app.graph_generators import DEFAULT_SEED, GRAPH_GENERATORS, SyntheticGraph
+from app.metrics import get_peak_rss_bytes
+
+# A chunked file is split into this number of chunks at least, so that parallel reads have work to share
+CHUNKS_PER_FILE = 16
+
+COMPUTE_OPERATIONS = ('compute_number_of_vertices', 'compute_number_of_edges', 'compute_in_degrees_per_vertex',
+                      'compute_out_degrees_per_vertex', 'compute_in_degrees_array', 'compute_out_degrees_array')
+STREAM_OPERATIONS = ('stream_compute_statistics', 'stream_compute_number_of_vertices',
+                     'stream_compute_number_of_edges', 'stream_compute_in_degrees_per_vertex',
+                     'stream_compute_out_degrees_per_vertex', 'stream_compute_merged_degrees')
+
+
+class BenchmarkResult(NamedTuple):
+    generator: str
+    number_of_vertices: int
+    number_of_edges: int
+    operation: str
+    wall_time_seconds: float
+    edges_per_second: float
+    # High-water mark of the resident memory of the process after the operation, and how much the operation raised it
+    peak_rss_bytes: int
+    peak_rss_increase_bytes: int
+
+
+class BenchmarkRunner:
+
+    def __init__(self, work_dir: str = None, repeat: int = DEFAULT_REPEAT, workers: int = DEFAULT_WORKERS,
+                 seed: int = DEFAULT_SEED, isolate_cases: bool = True):
+        self.work_dir: str = work_dir
+        self.repeat: int = repeat
+        self.workers: int = workers
+        self.seed: int = seed
+        # Every (generator, size) case runs in a fresh process, so that the peak memory of a case is not the one of a
+        # bigger case which ran before it
+        self.isolate_cases: bool = isolate_cases
+        self.logger = Logger(__class__.__name__).create()
+
+    def run(self, generator_names: Iterable[str] = tuple(GRAPH_GENERATORS),
+            sizes: Iterable[int] = DEFAULT_SIZES) -> List[BenchmarkResult]:
+        results: List[BenchmarkResult] = []
+        for generator_name in generator_names:
+            for number_of_edges in sizes:
+                self.logger.info(f'Benchmarking {generator_name} graph with {number_of_edges} edges')
+                if self.isolate_cases:
+                    with ProcessPoolExecutor(max_workers=1,
+                                             mp_context=multiprocessing.get_context('spawn')) as executor:
+                        results.extend(executor.submit(self.run_case, generator_name, number_of_edges).result())
+                else:
+                    results.extend(self.run_case(generator_name, number_of_edges))
+        return results
+
+    def run_case(self, generator_name: str, number_of_edges: int) -> List[BenchmarkResult]:
+        synthetic_graph: SyntheticGraph = GRAPH_GENERATORS[generator_name](number_of_edges, seed=self.seed)
+        with tempfile.TemporaryDirectory(dir=self.work_dir) as dir_path:
+            return list(self._run_operations(synthetic_graph, dir_path))
+
+    def _run_operations(self, synthetic_graph: SyntheticGraph, dir_path: str) -> Iterable[BenchmarkResult]:
+        directed_graph: DirectedGraph = DirectedGraph()
+        yield self._measure(synthetic_graph, 'build_graph_from_vertices_and_edges',
+                            lambda: directed_graph.build_graph_from_vertices_and_edges(synthetic_graph.vertices,
+                                                                                       synthetic_graph.edges()))
+
+        def drop_cached_statistics() -> None:
+            # Reassigning the adjacency list resets the statistics and memoized results, so every method is measured
+            # from a cold start
+            directed_graph.adjacency_list = directed_graph.adjacency_list
+
+        for operation in COMPUTE_OPERATIONS:
+            yield self._measure(synthetic_graph, operation, getattr(directed_graph, operation),
+                                setup=drop_cached_statistics)
+
+        filepaths: Dict[str, str] = {}
+        yield self._measure(synthetic_graph, 'serialize_graph',
+                            lambda: filepaths.update(pickle=directed_graph.serialize_graph(dir_path)))
+        yield self._measure(synthetic_graph, 'build_graph_from_pickle_file',
+                            lambda: DirectedGraph().build_graph_from_pickle_file(filepaths['pickle']))
+        yield self._measure(synthetic_graph, 'serialize_graph_to_binary_file',
+                            lambda: filepaths.update(binary=directed_graph.serialize_graph_to_binary_file(dir_path)))
+        yield self._measure(synthetic_graph, 'build_graph_from_binary_file',
+                            lambda: DirectedGraph().build_graph_from_binary_file(filepaths['binary']))
+        filepaths['edge_list'] = os.path.join(dir_path, 'edges.tsv')
+        self._write_edge_list(synthetic_graph, filepaths['edge_list'])
+        yield self._measure(synthetic_graph, 'build_graph_from_edge_list_file',
+                            lambda: DirectedGraph().build_graph_from_edge_list_file(filepaths['edge_list']))
+        vertices_per_chunk: int = max(1, len(synthetic_graph.vertices) // CHUNKS_PER_FILE)
+        yield self._measure(synthetic_graph, 'serialize_graph_in_chunks',
+                            lambda: filepaths.update(chunked=directed_graph.serialize_graph_in_chunks(
+                                dir_path, vertices_per_chunk=vertices_per_chunk)))
+
+        for operation in STREAM_OPERATIONS:
+            yield self._measure(synthetic_graph, operation,
+                                lambda: getattr(DirectedGraph(), operation)(filepaths['chunked']))
+        yield self._measure(synthetic_graph, 'stream_compute_statistics_in_parallel',
+                            lambda: DirectedGraph().stream_compute_statistics_in_parallel(filepaths['chunked'],
+                                                                                          workers=self.workers))
+
+    @staticmethod
+    def _write_edge_list(synthetic_graph: SyntheticGraph, filepath: str) -> None:
+        # The edge list file is an input of the benchmark, its writing is not measured
+        with open(filepath, 'w', encoding='utf-8') as out_file:
+            out_file.writelines(f'{source}\t{sink}\n' for source, sink in synthetic_graph.edges())
+
+    def _measure(self, synthetic_graph: SyntheticGraph, operation: str, function: Callable[[], Any],
+                 setup: Callable[[], None] = None) -> BenchmarkResult:
+        peak_rss_before: int = get_peak_rss_bytes()
+        wall_time: float = float('inf')
+        for _ in range(self.repeat):
+            if setup is not None:
+                setup()
+            start: float = time.perf_counter()
+            function()
+            wall_time = min(wall_time, time.perf_counter() - start)
+        peak_rss: int = get_peak_rss_bytes()
+        result: BenchmarkResult = BenchmarkResult(synthetic_graph.name, len(synthetic_graph.vertices),
+                                                  synthetic_graph.number_of_edges, operation, wall_time,
+                                                  synthetic_graph.number_of_edges / max(wall_time, 1e-9), peak_rss,
+                                                  peak_rss - peak_rss_before)
+        self.logger.info(f'{operation} on {synthetic_graph.name} graph with {synthetic_graph.number_of_edges} edges: '
+                         f'{wall_time:.4f}s, {result.edges_per_second:.0f} edges/s, peak RSS {peak_rss} bytes')
+        return result
+
+
+def write_results(results: List[BenchmarkResult], output_filepath: str) -> None:
+    report: Dict[str, Any] = {
+        'metadata': {
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python_version': platform.python_version(),
+            'numpy_version': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count(),
+        },
+        'results': [result._asdict() for result in results],
+    }
+    with open(output_filepath, 'w') as out_file:
+        json.dump(report, out_file, indent=2)
+
+
+def read_results(input_filepath: str) -> List[BenchmarkResult]:
+    with open(input_filepath) as in_file:
+        return [BenchmarkResult(**result) for result in json.load(in_file)['results']]
+
+
+def compare_results(baseline_results: List[BenchmarkResult],
+                    results: List[BenchmarkResult]) -> Dict[Tuple[str, int, str], float]:
+    # Ratio of the wall time of every operation to the one of the baseline, above 1 meaning slower
+    baseline_wall_times: Dict[Tuple[str, int, str], float] = {
+        (result.generator, result.number_of_edges, result.operation): result.wall_time_seconds
+        for result in baseline_results}
+    ratios: Dict[Tuple[str, int, str], float] = {}
+    for result in results:
+        key: Tuple[str, int, str] = (result.generator, result.number_of_edges, result.operation)
+        if key in baseline_wall_times:
+            ratios[key] = result.wall_time_seconds / max(baseline_wall_times[key], 1e-9)
+    return ratios
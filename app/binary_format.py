@@ -0,0 +1,170 @@
+import mmap
+import struct
+from typing import BinaryIO, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from app.csr_graph import CSRGraph, MULTIPLICITIES_DTYPE, OFFSETS_DTYPE, TARGETS_DTYPE
+from app.exceptions import InvalidGraphFileException, SerializedGraphFilePathNotFound
+
+MAGIC = b'DGRAPH\x00\x00'
+FORMAT_VERSION = 3
+PREAMBLE_STRUCT = struct.Struct('<8sI')
+# magic, format version, flags, number of vertices, number of CSR entries and the byte offsets of the sections: vertex
+# name offsets, vertex name data, CSR offsets, CSR targets, since version 2 the offsets and sources of the transposed CSR
+# (predecessors), which are 0 unless FLAG_TRANSPOSED is set, and since version 3 the multiplicities of the CSR and
+# transposed CSR entries, which are 0 unless FLAG_MULTIPLICITIES is set
+HEADER_STRUCTS = {
+    1: struct.Struct('<8sIIQQQQQQ'),
+    2: struct.Struct('<8sIIQQQQQQQQ'),
+    3: struct.Struct('<8sIIQQQQQQQQQQ'),
+}
+HEADER_STRUCT = HEADER_STRUCTS[FORMAT_VERSION]
+HEADER_LENGTH = len(HEADER_STRUCT.unpack(bytes(HEADER_STRUCT.size)))
+FLAG_TRANSPOSED = 1
+FLAG_MULTIPLICITIES = 2
+ALIGNMENT = 8
+
+NAME_OFFSETS_DTYPE = np.dtype('<u8')
+FILE_OFFSETS_DTYPE = np.dtype(OFFSETS_DTYPE).newbyteorder('<')
+FILE_TARGETS_DTYPE = np.dtype(TARGETS_DTYPE).newbyteorder('<')
+FILE_MULTIPLICITIES_DTYPE = np.dtype(MULTIPLICITIES_DTYPE).newbyteorder('<')
+
+
+class StringTable(Sequence):
+
+    def __init__(self, buffer: mmap.mmap, name_offsets: np.ndarray, data_offset: int):
+        self.buffer: mmap.mmap = buffer
+        self.name_offsets: np.ndarray = name_offsets
+        self.data_offset: int = data_offset
+
+    def __getitem__(self, index: int) -> str:
+        if not -len(self) <= index < len(self):
+            raise IndexError(index)
+        index %= len(self)
+        start: int = self.data_offset + int(self.name_offsets[index])
+        end: int = self.data_offset + int(self.name_offsets[index + 1])
+        return self.buffer[start:end].decode('utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        bounds: List[int] = (self.name_offsets + self.data_offset).tolist()
+        for start, end in zip(bounds, bounds[1:]):
+            yield self.buffer[start:end].decode('utf-8')
+
+    def __len__(self) -> int:
+        return len(self.name_offsets) - 1
+
+
+def _pad(out_file: BinaryIO) -> int:
+    position: int = out_file.tell()
+    padding: int = -position % ALIGNMENT
+    out_file.write(b'\x00' * padding)
+    return position + padding
+
+
+def encode_vertex_names(vertices: Sequence[str]) -> Tuple[np.ndarray, bytes]:
+    # Vertex names as one UTF-8 string and the offsets of every name in it, the last offset being its length
+    encoded_names: List[bytes] = [vertex.encode('utf-8') for vertex in vertices]
+    name_offsets: np.ndarray = np.zeros(len(encoded_names) + 1, dtype=NAME_OFFSETS_DTYPE)
+    np.cumsum(np.fromiter(map(len, encoded_names), dtype=NAME_OFFSETS_DTYPE, count=len(encoded_names)),
+              out=name_offsets[1:])
+    return name_offsets, b''.join(encoded_names)
+
+
+def decode_vertex_names(name_offsets: np.ndarray, names_data: bytes) -> List[str]:
+    bounds: List[int] = name_offsets.tolist()
+    return [names_data[start:end].decode('utf-8') for start, end in zip(bounds, bounds[1:])]
+
+
+def write_binary_graph(csr_graph: CSRGraph, filepath: str, include_transposed: bool = False) -> None:
+    name_offsets, names_data = encode_vertex_names(csr_graph.vertices)
+    with open(filepath, 'wb') as out_file:
+        out_file.write(b'\x00' * HEADER_STRUCT.size)
+        name_offsets_offset: int = _pad(out_file)
+        out_file.write(name_offsets.tobytes())
+        names_data_offset: int = _pad(out_file)
+        out_file.write(names_data)
+        offsets_offset: int = _pad(out_file)
+        out_file.write(csr_graph.offsets.astype(FILE_OFFSETS_DTYPE, copy=False).tobytes())
+        targets_offset: int = _pad(out_file)
+        out_file.write(csr_graph.targets.astype(FILE_TARGETS_DTYPE, copy=False).tobytes())
+        flags: int = 0
+        transposed_offsets_offset: int = 0
+        transposed_targets_offset: int = 0
+        multiplicities_offset: int = 0
+        transposed_multiplicities_offset: int = 0
+        if include_transposed:
+            flags |= FLAG_TRANSPOSED
+            transposed: CSRGraph = csr_graph.transpose()
+            transposed_offsets_offset = _pad(out_file)
+            out_file.write(transposed.offsets.astype(FILE_OFFSETS_DTYPE, copy=False).tobytes())
+            transposed_targets_offset = _pad(out_file)
+            out_file.write(transposed.targets.astype(FILE_TARGETS_DTYPE, copy=False).tobytes())
+        if csr_graph.multiplicities is not None:
+            flags |= FLAG_MULTIPLICITIES
+            multiplicities_offset = _pad(out_file)
+            out_file.write(csr_graph.multiplicities.astype(FILE_MULTIPLICITIES_DTYPE, copy=False).tobytes())
+            if include_transposed:
+                transposed_multiplicities_offset = _pad(out_file)
+                out_file.write(transposed.multiplicities.astype(FILE_MULTIPLICITIES_DTYPE, copy=False).tobytes())
+        out_file.seek(0)
+        out_file.write(HEADER_STRUCT.pack(MAGIC, FORMAT_VERSION, flags, csr_graph.number_of_vertices(),
+                                          len(csr_graph.targets), name_offsets_offset, names_data_offset,
+                                          offsets_offset, targets_offset, transposed_offsets_offset,
+                                          transposed_targets_offset, multiplicities_offset,
+                                          transposed_multiplicities_offset))
+
+
+def _read_header(buffer: mmap.mmap, filepath: str) -> Tuple:
+    if len(buffer) < PREAMBLE_STRUCT.size or PREAMBLE_STRUCT.unpack_from(buffer, 0)[0] != MAGIC:
+        raise InvalidGraphFileException(f'{filepath} is not a binary graph file !')
+    format_version: int = PREAMBLE_STRUCT.unpack_from(buffer, 0)[1]
+    if format_version not in HEADER_STRUCTS:
+        raise InvalidGraphFileException(f'{filepath} has unsupported format version {format_version} !')
+    header_struct: struct.Struct = HEADER_STRUCTS[format_version]
+    if len(buffer) < header_struct.size:
+        raise InvalidGraphFileException(f'{filepath} is truncated !')
+    header: Tuple = header_struct.unpack_from(buffer, 0)
+    # Sections added by later versions are absent from older files
+    return header + (0,) * (HEADER_LENGTH - len(header))
+
+
+def _map_array(buffer: mmap.mmap, dtype: np.dtype, count: int, offset: int, filepath: str) -> np.ndarray:
+    if offset + count * dtype.itemsize > len(buffer):
+        raise InvalidGraphFileException(f'{filepath} is truncated !')
+    return np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+
+
+def load_binary_graph(filepath: str) -> CSRGraph:
+    try:
+        with open(filepath, 'rb') as in_file:
+            buffer: mmap.mmap = mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        raise SerializedGraphFilePathNotFound(f'{filepath} not found !')
+    except ValueError:
+        raise InvalidGraphFileException(f'{filepath} is not a binary graph file !')
+    _, _, flags, number_of_vertices, number_of_entries, name_offsets_offset, names_data_offset, offsets_offset, \
+        targets_offset, transposed_offsets_offset, transposed_targets_offset, multiplicities_offset, \
+        transposed_multiplicities_offset = _read_header(buffer, filepath)
+    name_offsets: np.ndarray = _map_array(buffer, NAME_OFFSETS_DTYPE, number_of_vertices + 1, name_offsets_offset,
+                                          filepath)
+    offsets: np.ndarray = _map_array(buffer, FILE_OFFSETS_DTYPE, number_of_vertices + 1, offsets_offset, filepath)
+    targets: np.ndarray = _map_array(buffer, FILE_TARGETS_DTYPE, number_of_entries, targets_offset, filepath)
+    multiplicities: np.ndarray = None
+    if flags & FLAG_MULTIPLICITIES:
+        multiplicities = _map_array(buffer, FILE_MULTIPLICITIES_DTYPE, number_of_entries, multiplicities_offset,
+                                    filepath)
+    csr_graph: CSRGraph = CSRGraph(StringTable(buffer, name_offsets, names_data_offset), offsets, targets,
+                                   multiplicities=multiplicities)
+    if flags & FLAG_TRANSPOSED:
+        transposed_offsets: np.ndarray = _map_array(buffer, FILE_OFFSETS_DTYPE, number_of_vertices + 1,
+                                                    transposed_offsets_offset, filepath)
+        transposed_targets: np.ndarray = _map_array(buffer, FILE_TARGETS_DTYPE, number_of_entries,
+                                                    transposed_targets_offset, filepath)
+        transposed_multiplicities: np.ndarray = None
+        if flags & FLAG_MULTIPLICITIES:
+            transposed_multiplicities = _map_array(buffer, FILE_MULTIPLICITIES_DTYPE, number_of_entries,
+                                                   transposed_multiplicities_offset, filepath)
+        csr_graph.transposed = CSRGraph(csr_graph.vertices, transposed_offsets, transposed_targets,
+                                        transposed=csr_graph, multiplicities=transposed_multiplicities)
+    return csr_graph
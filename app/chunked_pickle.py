@@ -0,0 +1,102 @@
+import os
+import pickle
+import struct
+from typing import BinaryIO, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+from app.exceptions import InvalidGraphFileException
+
+# The chunk index is pickled after the last chunk as a tuple of builtins, so that reading it never requires importing
+# project classes. It is followed by a fixed size trailer giving its byte offset, so readers can find it from the end
+# of the file without reading the chunks.
+CHUNK_INDEX_MARKER = 'directed_graph_chunk_index'
+CHUNK_INDEX_VERSION = 1
+TRAILER_MAGIC = b'DGCHUNKS'
+TRAILER_STRUCT = struct.Struct('<8sQ')
+
+DEFAULT_VERTICES_PER_CHUNK = 100_000
+# Rough number of bytes pickle spends on a string besides its characters, used to estimate the size of a chunk
+ESTIMATED_STRING_OVERHEAD = 4
+
+
+class ChunkInfo(NamedTuple):
+    offset: int
+    length: int
+    number_of_vertices: int
+    number_of_edges: int
+
+
+def iter_adjacency_chunks(adjacency_list: Mapping[str, List[str]], vertices_per_chunk: int = None,
+                          bytes_per_chunk: int = None) -> Iterator[Dict[str, List[str]]]:
+    if vertices_per_chunk is None and bytes_per_chunk is None:
+        vertices_per_chunk = DEFAULT_VERTICES_PER_CHUNK
+    chunk: Dict[str, List[str]] = {}
+    chunk_bytes: int = 0
+    for vertex, sinks in adjacency_list.items():
+        chunk[vertex] = sinks
+        if bytes_per_chunk is not None:
+            chunk_bytes += len(vertex) + sum(map(len, sinks)) + ESTIMATED_STRING_OVERHEAD * (len(sinks) + 1)
+        if (vertices_per_chunk is not None and len(chunk) >= vertices_per_chunk) or \
+                (bytes_per_chunk is not None and chunk_bytes >= bytes_per_chunk):
+            yield chunk
+            chunk = {}
+            chunk_bytes = 0
+    if chunk:
+        yield chunk
+
+
+def write_chunked_graph(adjacency_list: Mapping[str, List[str]], filepath: str, vertices_per_chunk: int = None,
+                        bytes_per_chunk: int = None) -> List[ChunkInfo]:
+    chunk_infos: List[ChunkInfo] = []
+    with open(filepath, 'wb') as out_file:
+        for chunk in iter_adjacency_chunks(adjacency_list, vertices_per_chunk, bytes_per_chunk):
+            offset: int = out_file.tell()
+            pickle.dump(chunk, out_file, protocol=pickle.HIGHEST_PROTOCOL)
+            chunk_infos.append(ChunkInfo(offset, out_file.tell() - offset, len(chunk),
+                                         sum(map(len, chunk.values()))))
+        index_offset: int = out_file.tell()
+        pickle.dump((CHUNK_INDEX_MARKER, CHUNK_INDEX_VERSION, [tuple(chunk_info) for chunk_info in chunk_infos]),
+                    out_file, protocol=pickle.HIGHEST_PROTOCOL)
+        out_file.write(TRAILER_STRUCT.pack(TRAILER_MAGIC, index_offset))
+    return chunk_infos
+
+
+def is_chunk_index_record(record: object) -> bool:
+    return isinstance(record, tuple) and len(record) == 3 and record[0] == CHUNK_INDEX_MARKER
+
+
+def read_chunk_index(in_file: BinaryIO) -> Optional[List[ChunkInfo]]:
+    file_size: int = in_file.seek(0, os.SEEK_END)
+    chunk_infos: Optional[List[ChunkInfo]] = None
+    if file_size >= TRAILER_STRUCT.size:
+        in_file.seek(file_size - TRAILER_STRUCT.size)
+        magic, index_offset = TRAILER_STRUCT.unpack(in_file.read(TRAILER_STRUCT.size))
+        if magic == TRAILER_MAGIC:
+            in_file.seek(index_offset)
+            record: Tuple = pickle.load(in_file)
+            if not is_chunk_index_record(record):
+                raise InvalidGraphFileException(f'{in_file.name} has a corrupted chunk index !')
+            if record[1] != CHUNK_INDEX_VERSION:
+                raise InvalidGraphFileException(f'{in_file.name} has unsupported chunk index version {record[1]} !')
+            chunk_infos = [ChunkInfo(*chunk_info) for chunk_info in record[2]]
+    in_file.seek(0)
+    return chunk_infos
+
+
+def iter_pickled_chunks(in_file: BinaryIO, chunk_infos: List[ChunkInfo] = None
+                        ) -> Iterator[Tuple[Dict[str, List[str]], int]]:
+    # Yields every adjacency list chunk with its size in bytes. When chunk_infos is given, only these chunks are read,
+    # seeking straight to their offsets; otherwise the file is read sequentially until its end or its chunk index.
+    if chunk_infos is not None:
+        for chunk_info in chunk_infos:
+            in_file.seek(chunk_info.offset)
+            yield pickle.load(in_file), chunk_info.length
+        return
+    while True:
+        offset: int = in_file.tell()
+        try:
+            record = pickle.load(in_file)
+        except EOFError:
+            return
+        if is_chunk_index_record(record):
+            return
+        yield record, in_file.tell() - offset
@@ -0,0 +1,6 @@
+# Settings of the benchmarks, kept apart from app.benchmark so that the entry point can build its options without
+# importing NumPy and the library
+GENERATOR_NAMES = ('power_law', 'uniform_random', 'dense_multi_edge')
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+DEFAULT_REPEAT = 1
+DEFAULT_WORKERS = 2
@@ -1,5 +1,4 @@
 import logging
-import logging.config
 import os
 from datetime import datetime
 
@@ -7,6 +6,9 @@ from app.utils import create_dir_if_not_exist
 
 
 def set_logging_config() -> None:
+    # logging.config is only needed by the entry points, importing it lazily keeps it off the import of the library
+    import logging.config
+
     config = {
         'version': 1,
         'formatters': {
@@ -26,6 +28,14 @@ def set_logging_config() -> None:
             'DirectedGraph': {
                 'level': 'INFO',
                 'handlers': ['directed_graph_handler']
+            },
+            'AsyncEdgeIngestor': {
+                'level': 'INFO',
+                'handlers': ['directed_graph_handler']
+            },
+            'BenchmarkRunner': {
+                'level': 'INFO',
+                'handlers': ['directed_graph_handler']
             }
         }
     }
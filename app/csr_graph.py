@@ -0,0 +1,184 @@
+from typing import Dict, Iterator, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from app.exceptions import UnknownVertexException
+
+OFFSETS_DTYPE = np.int64
+TARGETS_DTYPE = np.int32
+MULTIPLICITIES_DTYPE = np.int32
+
+
+class CSRGraph:
+
+    def __init__(self, vertices: Sequence[str], offsets: np.ndarray, targets: np.ndarray,
+                 transposed: 'CSRGraph' = None, multiplicities: np.ndarray = None):
+        self.vertices: Sequence[str] = vertices
+        self.offsets: np.ndarray = offsets
+        self.targets: np.ndarray = targets
+        # When set, every (vertex, target) entry stands for multiplicities[entry] parallel edges and targets are unique
+        # within a row, in order of first occurrence
+        self.multiplicities: np.ndarray = multiplicities
+        # CSR graph of the reversed edges, whose targets are the predecessors of every vertex
+        self.transposed: CSRGraph = transposed
+        self._vertex_ids: Dict[str, int] = None
+
+    @classmethod
+    def from_adjacency_list(cls, adjacency_list: Mapping[str, List[str]],
+                            compress_multiplicities: bool = False) -> 'CSRGraph':
+        vertices: List[str] = list(adjacency_list)
+        vertex_ids: Dict[str, int] = {vertex: vertex_id for vertex_id, vertex in enumerate(vertices)}
+        offsets: np.ndarray = np.zeros(len(vertices) + 1, dtype=OFFSETS_DTYPE)
+        np.cumsum(np.fromiter(map(len, adjacency_list.values()), dtype=OFFSETS_DTYPE, count=len(vertices)),
+                  out=offsets[1:])
+        sink_ids: Iterator[int] = (vertex_ids.get(sink, -1) for sinks in adjacency_list.values() for sink in sinks)
+        targets: np.ndarray = np.fromiter(sink_ids, dtype=TARGETS_DTYPE, count=int(offsets[-1]))
+        is_vertex: np.ndarray = targets >= 0
+        if not is_vertex.all():
+            # Like in degrees, edges to sinks which are not vertices of the graph are left out, a CSR row only holds
+            # vertex ids
+            sources: np.ndarray = np.repeat(np.arange(len(vertices)), np.diff(offsets))
+            np.cumsum(np.bincount(sources[is_vertex], minlength=len(vertices)), out=offsets[1:])
+            targets = targets[is_vertex]
+        csr_graph: CSRGraph = cls(vertices, offsets, targets)
+        csr_graph._vertex_ids = vertex_ids
+        return csr_graph.compress() if compress_multiplicities else csr_graph
+
+    def _entry_sources(self) -> np.ndarray:
+        return np.repeat(np.arange(self.number_of_vertices(), dtype=TARGETS_DTYPE), np.diff(self.offsets))
+
+    def compress(self) -> 'CSRGraph':
+        # Merges the parallel edges of every row into a single (target, multiplicity) entry
+        if self.multiplicities is not None:
+            return self
+        number_of_vertices: int = self.number_of_vertices()
+        sources: np.ndarray = self._entry_sources()
+        _, first_entries, multiplicities = np.unique(sources.astype(np.int64) * number_of_vertices + self.targets,
+                                                     return_index=True, return_counts=True)
+        # Entries are sorted by (source, target), sorting them by first entry keeps the order of first occurrence
+        order: np.ndarray = np.argsort(first_entries, kind='stable')
+        first_entries = first_entries[order]
+        offsets: np.ndarray = np.zeros(number_of_vertices + 1, dtype=OFFSETS_DTYPE)
+        np.cumsum(np.bincount(sources[first_entries], minlength=number_of_vertices), out=offsets[1:])
+        csr_graph: CSRGraph = CSRGraph(self.vertices, offsets, self.targets[first_entries],
+                                       multiplicities=multiplicities[order].astype(MULTIPLICITIES_DTYPE))
+        csr_graph._vertex_ids = self._vertex_ids
+        return csr_graph
+
+    def expand(self) -> 'CSRGraph':
+        # Inverse of compress, parallel edges are repeated next to each other
+        if self.multiplicities is None:
+            return self
+        offsets: np.ndarray = np.zeros(self.number_of_vertices() + 1, dtype=OFFSETS_DTYPE)
+        np.cumsum(self.out_degrees(), out=offsets[1:])
+        csr_graph: CSRGraph = CSRGraph(self.vertices, offsets, np.repeat(self.targets, self.multiplicities))
+        csr_graph._vertex_ids = self._vertex_ids
+        return csr_graph
+
+    @property
+    def vertex_ids(self) -> Dict[str, int]:
+        if self._vertex_ids is None:
+            self._vertex_ids = {vertex: vertex_id for vertex_id, vertex in enumerate(self.vertices)}
+        return self._vertex_ids
+
+    def vertex_id(self, vertex: str) -> int:
+        try:
+            return self.vertex_ids[vertex]
+        except KeyError:
+            raise UnknownVertexException(f'{vertex} is not a vertex of the graph !')
+
+    def number_of_vertices(self) -> int:
+        return len(self.vertices)
+
+    def number_of_edges(self) -> int:
+        if self.multiplicities is not None:
+            return int(self.multiplicities.sum())
+        return len(self.targets)
+
+    def out_degrees(self) -> np.ndarray:
+        if self.multiplicities is not None:
+            cumulated_multiplicities: np.ndarray = np.zeros(len(self.multiplicities) + 1, dtype=OFFSETS_DTYPE)
+            np.cumsum(self.multiplicities, out=cumulated_multiplicities[1:])
+            return np.diff(cumulated_multiplicities[self.offsets])
+        return np.diff(self.offsets)
+
+    def out_degree(self, vertex_id: int) -> int:
+        start, end = self.offsets[vertex_id], self.offsets[vertex_id + 1]
+        if self.multiplicities is not None:
+            return int(self.multiplicities[start:end].sum())
+        return int(end - start)
+
+    def in_degrees(self) -> np.ndarray:
+        if self.multiplicities is not None:
+            # Weights are summed as floats, which are exact below 2 ** 53 edges
+            return np.bincount(self.targets, weights=self.multiplicities,
+                               minlength=len(self.vertices)).astype(OFFSETS_DTYPE)
+        return np.bincount(self.targets, minlength=len(self.vertices))
+
+    def successor_ids(self, vertex_id: int) -> np.ndarray:
+        # Unique targets of the vertex when multiplicities are compressed
+        return self.targets[self.offsets[vertex_id]:self.offsets[vertex_id + 1]]
+
+    def successors(self, vertex: str) -> List[str]:
+        vertex_id: int = self.vertex_id(vertex)
+        sink_ids: np.ndarray = self.successor_ids(vertex_id)
+        if self.multiplicities is not None:
+            sink_ids = np.repeat(sink_ids, self.multiplicities[self.offsets[vertex_id]:self.offsets[vertex_id + 1]])
+        return [self.vertices[sink_id] for sink_id in sink_ids.tolist()]
+
+    def weighted_successors(self, vertex: str) -> List[Tuple[str, int]]:
+        vertex_id: int = self.vertex_id(vertex)
+        sink_ids: np.ndarray = self.successor_ids(vertex_id)
+        if self.multiplicities is None:
+            return [(self.vertices[sink_id], 1) for sink_id in sink_ids.tolist()]
+        multiplicities: List[int] = self.multiplicities[self.offsets[vertex_id]:self.offsets[vertex_id + 1]].tolist()
+        return [(self.vertices[sink_id], multiplicity)
+                for sink_id, multiplicity in zip(sink_ids.tolist(), multiplicities)]
+
+    def transpose(self) -> 'CSRGraph':
+        if self.transposed is None:
+            number_of_vertices: int = self.number_of_vertices()
+            # A stable sort keeps the predecessors of every vertex in adjacency order
+            order: np.ndarray = np.argsort(self.targets, kind='stable')
+            offsets: np.ndarray = np.zeros(number_of_vertices + 1, dtype=OFFSETS_DTYPE)
+            np.cumsum(np.bincount(self.targets, minlength=number_of_vertices), out=offsets[1:])
+            self.transposed = CSRGraph(self.vertices, offsets, self._entry_sources()[order], transposed=self,
+                                       multiplicities=None if self.multiplicities is None
+                                       else self.multiplicities[order])
+            self.transposed._vertex_ids = self._vertex_ids
+        return self.transposed
+
+    def predecessors(self, vertex: str) -> List[str]:
+        return self.transpose().successors(vertex)
+
+    def in_degree(self, vertex: str) -> int:
+        return self.transpose().out_degree(self.vertex_id(vertex))
+
+    def to_adjacency_list(self) -> Dict[str, List[str]]:
+        return {vertex: self.successors(vertex) for vertex in self.vertices}
+
+    def to_weighted_adjacency_list(self) -> Dict[str, List[Tuple[str, int]]]:
+        return {vertex: self.weighted_successors(vertex) for vertex in self.vertices}
+
+    def adjacency_view(self) -> 'CSRAdjacencyView':
+        return CSRAdjacencyView(self)
+
+
+class CSRAdjacencyView(Mapping):
+
+    def __init__(self, csr_graph: CSRGraph):
+        self.csr_graph: CSRGraph = csr_graph
+
+    def __getitem__(self, vertex: str) -> List[str]:
+        if vertex not in self.csr_graph.vertex_ids:
+            raise KeyError(vertex)
+        return self.csr_graph.successors(vertex)
+
+    def __contains__(self, vertex: object) -> bool:
+        return vertex in self.csr_graph.vertex_ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.csr_graph.vertices)
+
+    def __len__(self) -> int:
+        return self.csr_graph.number_of_vertices()
@@ -0,0 +1,55 @@
+from itertools import chain, repeat
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence
+
+import numpy as np
+
+DEGREES_DTYPE = np.int64
+VERTEX_IDS_DTYPE = np.int32
+
+
+class VertexDegrees:
+
+    def __init__(self, vertices: Sequence[str], degrees: np.ndarray):
+        self.vertices: Sequence[str] = vertices
+        self.degrees: np.ndarray = degrees
+
+    def to_dict(self) -> Dict[str, int]:
+        return dict(zip(self.vertices, self.degrees.tolist()))
+
+
+def iter_sinks(adjacency_list: Mapping[str, List[str]]) -> Iterator[str]:
+    return chain.from_iterable(adjacency_list.values())
+
+
+def intern_vertices(vertices: Iterable[str], vertex_ids: Dict[str, int]) -> None:
+    new_vertices: List[str] = [vertex for vertex in dict.fromkeys(vertices) if vertex not in vertex_ids]
+    vertex_ids.update(zip(new_vertices, range(len(vertex_ids), len(vertex_ids) + len(new_vertices))))
+
+
+def encode_vertices(vertices: Iterable[str], vertex_ids: Dict[str, int], count: int = -1) -> np.ndarray:
+    # Vertices missing from vertex_ids are all encoded with the first free id, len(vertex_ids)
+    return np.fromiter(map(vertex_ids.get, vertices, repeat(len(vertex_ids))), dtype=VERTEX_IDS_DTYPE, count=count)
+
+
+def compute_in_degrees(adjacency_list: Mapping[str, List[str]]) -> VertexDegrees:
+    vertices: List[str] = list(adjacency_list)
+    vertex_ids: Dict[str, int] = {vertex: vertex_id for vertex_id, vertex in enumerate(vertices)}
+    number_of_edges: int = sum(map(len, adjacency_list.values()))
+    sink_ids: np.ndarray = encode_vertices(iter_sinks(adjacency_list), vertex_ids, count=number_of_edges)
+    # Sinks which are not vertices of the graph all fall in the extra last bin, which is cut off
+    in_degrees: np.ndarray = np.bincount(sink_ids, minlength=len(vertices) + 1)[:len(vertices)]
+    return VertexDegrees(vertices, in_degrees.astype(DEGREES_DTYPE, copy=False))
+
+
+def compute_out_degrees(adjacency_list: Mapping[str, List[str]]) -> VertexDegrees:
+    vertices: List[str] = list(adjacency_list)
+    out_degrees: np.ndarray = np.fromiter(map(len, adjacency_list.values()), dtype=DEGREES_DTYPE, count=len(vertices))
+    return VertexDegrees(vertices, out_degrees)
+
+
+def grow_degrees(degrees: np.ndarray, number_of_vertices: int) -> np.ndarray:
+    if number_of_vertices <= len(degrees):
+        return degrees
+    grown_degrees: np.ndarray = np.zeros(max(number_of_vertices, 2 * len(degrees)), dtype=degrees.dtype)
+    grown_degrees[:len(degrees)] = degrees
+    return grown_degrees
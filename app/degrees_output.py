@@ -0,0 +1,106 @@
+import sys
+from array import array
+from itertools import repeat
+from typing import Dict, Iterable, Iterator, List, Sequence, TextIO, Tuple
+
+import numpy as np
+
+from app.binary_format import decode_vertex_names, encode_vertex_names
+from app.degrees import DEGREES_DTYPE
+from app.exceptions import InvalidGraphFileException, SerializedGraphFilePathNotFound
+
+ROWS_PER_WRITE = 10_000
+# Columns of the degrees files written by write_degrees_file, a NumPy .npz archive
+DEGREES_FILE_COLUMNS = ('vertex_name_offsets', 'vertex_names', 'in_degrees', 'out_degrees')
+
+DegreeRow = Tuple[str, int, int]
+
+
+def iter_degree_rows(vertices: Sequence[str], in_degrees: np.ndarray, out_degrees: np.ndarray) -> Iterator[DegreeRow]:
+    return zip(vertices, in_degrees.tolist(), out_degrees.tolist())
+
+
+def align_degrees(in_degrees: Dict[str, int], out_degrees: Dict[str, int]
+                  ) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    # Degree dicts of the stream computations as columns over the vertices, in the order of out_degrees
+    vertices: List[str] = list(out_degrees)
+    return vertices, np.fromiter(map(in_degrees.get, vertices, repeat(0)), dtype=DEGREES_DTYPE, count=len(vertices)), \
+        np.fromiter(out_degrees.values(), dtype=DEGREES_DTYPE, count=len(vertices))
+
+
+def collect_degree_columns(rows: Iterable[DegreeRow]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    vertices: List[str] = []
+    in_degrees: array = array('q')
+    out_degrees: array = array('q')
+    for vertex, in_degree, out_degree in rows:
+        vertices.append(vertex)
+        in_degrees.append(in_degree)
+        out_degrees.append(out_degree)
+    return vertices, np.frombuffer(in_degrees, dtype=DEGREES_DTYPE), np.frombuffer(out_degrees, dtype=DEGREES_DTYPE)
+
+
+def write_degree_rows(rows: Iterable[DegreeRow], out_file: TextIO, rows_per_write: int = ROWS_PER_WRITE) -> int:
+    # Rows are written as tab separated lines in batches, so that neither a whole output string nor one write per
+    # vertex is needed
+    number_of_rows: int = 0
+    lines: List[str] = []
+    for vertex, in_degree, out_degree in rows:
+        lines.append(f'{vertex}\t{in_degree}\t{out_degree}\n')
+        if len(lines) >= rows_per_write:
+            out_file.write(''.join(lines))
+            number_of_rows += len(lines)
+            lines = []
+    out_file.write(''.join(lines))
+    return number_of_rows + len(lines)
+
+
+def top_k_degrees(vertices: Sequence[str], degrees: np.ndarray, k: int) -> List[Tuple[str, int]]:
+    # Partial selection of the k largest degrees in O(V), only these k being sorted. Ties are broken by vertex order:
+    # every vertex above the k-th degree is kept, then the first vertices tied at the k-th degree
+    k = min(k, len(degrees))
+    if k <= 0:
+        return []
+    kth_degree: int = degrees[np.argpartition(-degrees, k - 1)[k - 1]]
+    above_indices: np.ndarray = np.flatnonzero(degrees > kth_degree)
+    tied_indices: np.ndarray = np.flatnonzero(degrees == kth_degree)[:k - len(above_indices)]
+    top_indices: np.ndarray = np.concatenate((above_indices, tied_indices))
+    top_indices = top_indices[np.lexsort((top_indices, -degrees[top_indices]))]
+    return [(vertices[index], degree) for index, degree in zip(top_indices.tolist(), degrees[top_indices].tolist())]
+
+
+def write_degrees_file(filepath: str, vertices: Sequence[str], in_degrees: np.ndarray,
+                       out_degrees: np.ndarray) -> None:
+    name_offsets, names_data = encode_vertex_names(vertices)
+    # The file object keeps np.savez from appending a .npz extension to the given path
+    with open(filepath, 'wb') as out_file:
+        np.savez(out_file, vertex_name_offsets=name_offsets, vertex_names=np.frombuffer(names_data, dtype=np.uint8),
+                 in_degrees=in_degrees, out_degrees=out_degrees)
+
+
+def read_degrees_file(filepath: str) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    try:
+        with np.load(filepath) as columns:
+            if not set(DEGREES_FILE_COLUMNS) <= set(columns.files):
+                raise InvalidGraphFileException(f'{filepath} is not a degrees file !')
+            return decode_vertex_names(columns['vertex_name_offsets'], columns['vertex_names'].tobytes()), \
+                columns['in_degrees'], columns['out_degrees']
+    except FileNotFoundError:
+        raise SerializedGraphFilePathNotFound(f'{filepath} not found !')
+    except ValueError:
+        raise InvalidGraphFileException(f'{filepath} is not a degrees file !')
+
+
+def output_degrees(vertices: Sequence[str], in_degrees: np.ndarray, out_degrees: np.ndarray, top_k: int = None,
+                   output_filepath: str = None, out_file: TextIO = None) -> None:
+    # Degrees are written to output_filepath when given instead of being printed, unless only the top k are asked for
+    out_file = out_file if out_file is not None else sys.stdout
+    if output_filepath is not None:
+        write_degrees_file(output_filepath, vertices, in_degrees, out_degrees)
+        out_file.write(f'# Degrees written to {output_filepath}\n')
+    if top_k is not None:
+        for label, degrees in (('in', in_degrees), ('out', out_degrees)):
+            out_file.write(f'# top {top_k} {label} degrees are\n')
+            out_file.write(''.join(f'{vertex}\t{degree}\n' for vertex, degree in top_k_degrees(vertices, degrees, top_k)))
+    elif output_filepath is None:
+        out_file.write('# in and out degrees are\n')
+        write_degree_rows(iter_degree_rows(vertices, in_degrees, out_degrees), out_file)
@@ -0,0 +1,63 @@
+import json
+import os
+from typing import Iterable, Iterator, List, Tuple
+
+from app.exceptions import InvalidGraphFileException
+
+DELTA_LOG_SUFFIX = '.delta.jsonl'
+
+ADD_VERTEX = 'add_vertex'
+REMOVE_VERTEX = 'remove_vertex'
+ADD_EDGE = 'add_edge'
+REMOVE_EDGE = 'remove_edge'
+# Number of vertex names following every operation
+OPERATION_ARITIES = {ADD_VERTEX: 1, REMOVE_VERTEX: 1, ADD_EDGE: 2, REMOVE_EDGE: 2}
+
+
+def delta_log_filepath(pickle_filepath: str) -> str:
+    return os.path.splitext(pickle_filepath)[0] + DELTA_LOG_SUFFIX
+
+
+class DeltaLog:
+    # Append-only log of the mutations applied to a graph since it was serialized to pickle_filepath, one JSON array
+    # per line, e.g. ["add_edge", "a", "b"]. Appending a batch of operations costs one write of their size, whatever
+    # the size of the graph.
+
+    def __init__(self, pickle_filepath: str):
+        self.pickle_filepath: str = pickle_filepath
+        self.filepath: str = delta_log_filepath(pickle_filepath)
+        self._truncate_torn_line()
+
+    def _truncate_torn_line(self) -> None:
+        # A line interrupted by a crash is dropped, so that the next append does not glue an operation to it
+        if not os.path.exists(self.filepath):
+            return
+        with open(self.filepath, 'rb+') as log_file:
+            content: bytes = log_file.read()
+            if content and not content.endswith(b'\n'):
+                log_file.truncate(content.rfind(b'\n') + 1)
+
+    def append(self, operations: Iterable[Tuple[str, ...]]) -> None:
+        lines: str = ''.join(json.dumps(operation, ensure_ascii=False) + '\n' for operation in operations)
+        if lines:
+            with open(self.filepath, 'a', encoding='utf-8') as log_file:
+                log_file.write(lines)
+
+    def number_of_bytes(self) -> int:
+        return os.path.getsize(self.filepath) if os.path.exists(self.filepath) else 0
+
+
+def read_delta_log(filepath: str) -> Iterator[List[str]]:
+    with open(filepath, encoding='utf-8') as log_file:
+        for line_number, line in enumerate(log_file, start=1):
+            if not line.endswith('\n'):
+                # Torn last line of an interrupted append, the operation was never acknowledged
+                return
+            try:
+                operation: List[str] = json.loads(line)
+            except ValueError:
+                operation = None
+            if not isinstance(operation, list) or not operation or \
+                    OPERATION_ARITIES.get(operation[0]) != len(operation) - 1:
+                raise InvalidGraphFileException(f'{filepath} has an invalid operation at line {line_number} !')
+            yield operation
@@ -2,24 +2,288 @@ import os
 import pickle
 import time
 from collections import Counter
-from typing import List, Dict, Tuple
+from enum import Enum
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, BinaryIO, Callable, List, Dict, Hashable, Iterable, Iterator, Mapping, Optional, Sequence, Set, \
+    Tuple
 
+import numpy as np
+
+from app.binary_format import load_binary_graph, write_binary_graph
+from app.chunked_pickle import ChunkInfo, iter_pickled_chunks, read_chunk_index, write_chunked_graph
 from app.config.logging_config import Logger
-from app.exceptions import SerializedGraphFilePathNotFound, GraphNotBuiltException
-from app.utils import create_dir_if_not_exist
+from app.csr_graph import CSRGraph
+from app.degrees import DEGREES_DTYPE, VertexDegrees
+from app.delta_log import ADD_EDGE, ADD_VERTEX, REMOVE_EDGE, REMOVE_VERTEX, DeltaLog, delta_log_filepath, \
+    read_delta_log
+from app.edge_list_loader import DEFAULT_BLOCK_SIZE, EdgeListReport, load_edge_list
+from app.exceptions import SerializedGraphFilePathNotFound, GraphNotBuiltException, DuplicateVertexException, \
+    ReadOnlyGraphException, UnknownEdgeException, UnknownVertexException, InvalidGraphFileException, \
+    DeltaLogNotOpenedException
+from app.external_merge import DEFAULT_MAX_VERTICES_IN_MEMORY, MergedDegrees
+from app.graph_statistics import GraphStatistics
+from app.metrics import AGGREGATION_SECONDS, BYTES_READ, CHUNKS_READ, DESERIALIZATION_SECONDS, EDGES_PER_SECOND, \
+    EDGES_READ, PEAK_MEMORY_BYTES, VERTICES_READ, MetricsHook, RateLimitedThroughputLogger, get_peak_rss_bytes
+from app.parallel_streaming import DEFAULT_MAX_BYTES_PER_TASK, DEFAULT_MAX_CHUNKS_PER_TASK, \
+    parallel_compute_statistics
+from app.partitioned_graph import DEFAULT_MAX_CACHED_BYTES, DEFAULT_NUMBER_OF_PARTITIONS, \
+    PartitionedAdjacencyList, PartitionInfo, write_partitioned_graph
+from app.stream_accumulators import StreamAccumulator, NumberOfVerticesAccumulator, NumberOfEdgesAccumulator, \
+    InDegreesAccumulator, OutDegreesAccumulator, ExternalMergeAccumulator, create_default_accumulators
+from app.subgraph import InducedSubgraphView, SortedVertexIndex, VertexSelection
+from app.traversal import breadth_first_search, depth_first_search, is_acyclic, strongly_connected_components, \
+    topological_sort
+from app.utils import cached_on_version, create_dir_if_not_exist
+
+
+DEFAULT_LOG_INTERVAL_SECONDS = 5.0
+
+
+class DuplicateVertexPolicy(Enum):
+    IGNORE = 'ignore'
+    RAISE = 'raise'
 
 
 class DirectedGraph:
 
-    def __init__(self):
-        self.adjacency_list: Dict[str, List[str]] = None
+    def __init__(self, use_csr_backend: bool = False, with_reverse_index: bool = False,
+                 compress_multiplicities: bool = False, metrics_hook: MetricsHook = None,
+                 log_interval_seconds: float = DEFAULT_LOG_INTERVAL_SECONDS):
+        self._adjacency_list: Mapping[str, List[str]] = None
+        self.csr_graph: CSRGraph = None
+        self.use_csr_backend: bool = use_csr_backend
+        # Parallel edges are stored as a single (sink, multiplicity) entry by the CSR backend and binary files
+        self.compress_multiplicities: bool = compress_multiplicities
+        # The reverse index (predecessors of every vertex) is built eagerly and serialized when with_reverse_index is
+        # set, and lazily on the first predecessor query otherwise. It is then maintained by every mutation.
+        self.with_reverse_index: bool = with_reverse_index
+        self._reverse_adjacency_list: Dict[str, List[str]] = None
+        # Records the mutations applied since the graph was loaded from or serialized to a pickle file
+        self.delta_log: DeltaLog = None
+        self.version: int = 0
+        # Receives the counters and timings of the stream computations
+        self.metrics_hook: MetricsHook = metrics_hook
+        # Chunk throughput is logged at most once per interval
+        self.log_interval_seconds: float = log_interval_seconds
+        self._statistics: GraphStatistics = None
+        # Sources of the sinks which are not vertices of the graph, indexed on the first creation of a vertex while the
+        # statistics or the reverse index are maintained, so that a sink becoming a vertex keeps its incoming edges
+        self._dangling_sink_sources: Dict[str, List[str]] = None
+        self._version_cache: Dict[Hashable, Tuple[int, Any]] = {}
         self.logger = Logger(__class__.__name__).create()
 
-    def build_graph_from_vertices_and_edges(self, vertices_list: List[str], edges_list: List[Tuple[str, str]]) -> None:
-        self.adjacency_list = {vertex: [] for vertex in vertices_list}
-        [self.adjacency_list[source].append(sink) for source, sink in edges_list if
-         source in vertices_list and sink in vertices_list]
+    @property
+    def adjacency_list(self) -> Mapping[str, List[str]]:
+        return self._adjacency_list
+
+    @adjacency_list.setter
+    def adjacency_list(self, adjacency_list: Mapping[str, List[str]]) -> None:
+        self._adjacency_list = adjacency_list
+        self.csr_graph = None
+        self._reverse_adjacency_list = None
+        self._statistics = None
+        self._dangling_sink_sources = None
+        # The log describes changes to the previous graph, it cannot follow a new one
+        self.delta_log = None
+        self.version += 1
+
+    def to_csr_backend(self) -> None:
+        if self.adjacency_list is None:
+            raise GraphNotBuiltException('You have to build a graph before compacting it!')
+        if self.csr_graph is not None:
+            return
+        csr_graph: CSRGraph = CSRGraph.from_adjacency_list(self.adjacency_list,
+                                                           compress_multiplicities=self.compress_multiplicities)
+        self._set_csr_graph(csr_graph)
+        self.logger.info(f'Compacted directed graph to CSR backend ({csr_graph.number_of_vertices()} vertices, '
+                         f'{csr_graph.number_of_edges()} edges)')
+
+    def _set_csr_graph(self, csr_graph: CSRGraph) -> None:
+        self.adjacency_list = csr_graph.adjacency_view()
+        self.csr_graph = csr_graph
+        if self.with_reverse_index:
+            csr_graph.transpose()
+
+    def build_reverse_index(self) -> None:
+        if self.adjacency_list is None:
+            raise GraphNotBuiltException('You have to build a graph before indexing it!')
+        if self.csr_graph is not None:
+            self.csr_graph.transpose()
+        elif self._reverse_adjacency_list is None:
+            self._reverse_adjacency_list = self._build_reverse_adjacency_list(self.adjacency_list)
+            self.logger.info('Built reverse index of the directed graph')
+
+    @staticmethod
+    def _build_reverse_adjacency_list(adjacency_list: Mapping[str, List[str]]) -> Dict[str, List[str]]:
+        reverse_adjacency_list: Dict[str, List[str]] = {vertex: [] for vertex in adjacency_list}
+        for source, sinks in adjacency_list.items():
+            for sink in sinks:
+                # Like in degrees, sinks which are not vertices of the graph are not indexed
+                sources: List[str] = reverse_adjacency_list.get(sink)
+                if sources is not None:
+                    sources.append(source)
+        return reverse_adjacency_list
+
+    def build_graph_from_vertices_and_edges(self, vertices_list: Iterable[str], edges_list: Iterable[Tuple[str, str]],
+                                            duplicate_vertex_policy: DuplicateVertexPolicy = DuplicateVertexPolicy.IGNORE
+                                            ) -> None:
+        self.adjacency_list = {}
+        if self.with_reverse_index:
+            self._reverse_adjacency_list = {}
+        self.add_vertices(vertices_list, duplicate_vertex_policy=duplicate_vertex_policy)
+        self.add_edges(edges_list)
         self.logger.info('Created directed graph from list of vertices and edges')
+        if self.use_csr_backend:
+            self.to_csr_backend()
+
+    def add_vertices(self, vertices: Iterable[str],
+                     duplicate_vertex_policy: DuplicateVertexPolicy = DuplicateVertexPolicy.IGNORE) -> int:
+        adjacency_list: Dict[str, List[str]] = self._get_mutable_adjacency_list()
+        added_vertices: List[Tuple[str, str]] = [] if self.delta_log is not None else None
+        number_of_added_vertices: int = 0
+        try:
+            for vertex in vertices:
+                if vertex in adjacency_list:
+                    if duplicate_vertex_policy is DuplicateVertexPolicy.RAISE:
+                        raise DuplicateVertexException(f'{vertex} is already a vertex of the graph !')
+                    continue
+                self._create_vertex(adjacency_list, vertex)
+                number_of_added_vertices += 1
+                if added_vertices is not None:
+                    added_vertices.append((ADD_VERTEX, vertex))
+        finally:
+            if number_of_added_vertices:
+                self.version += 1
+            if added_vertices:
+                self.delta_log.append(added_vertices)
+        return number_of_added_vertices
+
+    def add_edges(self, edges: Iterable[Tuple[str, str]], create_missing_vertices: bool = False) -> int:
+        adjacency_list: Dict[str, List[str]] = self._get_mutable_adjacency_list()
+        reverse_adjacency_list: Dict[str, List[str]] = self._reverse_adjacency_list
+        statistics: GraphStatistics = self._statistics
+        added_edges: List[Tuple[str, str, str]] = [] if self.delta_log is not None else None
+        number_of_added_edges: int = 0
+        try:
+            for source, sink in edges:
+                if create_missing_vertices:
+                    if sink not in adjacency_list:
+                        self._create_vertex(adjacency_list, sink)
+                    sinks: List[str] = adjacency_list.get(source)
+                    if sinks is None:
+                        sinks = self._create_vertex(adjacency_list, source)
+                else:
+                    sinks = adjacency_list.get(source)
+                    if sinks is None or sink not in adjacency_list:
+                        continue
+                sinks.append(sink)
+                if reverse_adjacency_list is not None:
+                    reverse_adjacency_list[sink].append(source)
+                number_of_added_edges += 1
+                if statistics is not None:
+                    statistics.add_edge(source, sink)
+                if added_edges is not None:
+                    # Replayed with create_missing_vertices, which creates the same vertices in the same order
+                    added_edges.append((ADD_EDGE, source, sink))
+        finally:
+            if number_of_added_edges:
+                self.version += 1
+            if added_edges:
+                self.delta_log.append(added_edges)
+        return number_of_added_edges
+
+    def _create_vertex(self, adjacency_list: Dict[str, List[str]], vertex: str) -> List[str]:
+        sources: List[str] = []
+        if self._reverse_adjacency_list is not None or self._statistics is not None:
+            # A sink which was not a vertex of the graph becomes one along with the edges already pointing to it
+            sources = self._get_dangling_sink_sources().pop(vertex, sources)
+        sinks: List[str] = []
+        adjacency_list[vertex] = sinks
+        if self._reverse_adjacency_list is not None:
+            self._reverse_adjacency_list[vertex] = sources
+        if self._statistics is not None:
+            self._statistics.add_vertex(vertex, in_degree=len(sources))
+        return sinks
+
+    def _get_dangling_sink_sources(self) -> Dict[str, List[str]]:
+        if self._dangling_sink_sources is None:
+            adjacency_list: Mapping[str, List[str]] = self.adjacency_list
+            dangling_sink_sources: Dict[str, List[str]] = {}
+            for source, sinks in adjacency_list.items():
+                for sink in sinks:
+                    if sink not in adjacency_list:
+                        dangling_sink_sources.setdefault(sink, []).append(source)
+            self._dangling_sink_sources = dangling_sink_sources
+        return self._dangling_sink_sources
+
+    def remove_edge(self, source: str, sink: str) -> None:
+        adjacency_list: Dict[str, List[str]] = self._get_mutable_adjacency_list()
+        try:
+            adjacency_list[source].remove(sink)
+        except (KeyError, ValueError):
+            raise UnknownEdgeException(f'({source}, {sink}) is not an edge of the graph !')
+        if self._reverse_adjacency_list is not None and sink in self._reverse_adjacency_list:
+            self._reverse_adjacency_list[sink].remove(source)
+        if self._statistics is not None:
+            self._statistics.remove_edges(source, sink)
+        if self._dangling_sink_sources is not None and sink not in adjacency_list:
+            self._remove_dangling_sources(sink, [source])
+        if self.delta_log is not None:
+            self.delta_log.append([(REMOVE_EDGE, source, sink)])
+        self.version += 1
+
+    def remove_vertex(self, vertex: str) -> None:
+        adjacency_list: Dict[str, List[str]] = self._get_mutable_adjacency_list()
+        if vertex not in adjacency_list:
+            raise UnknownVertexException(f'{vertex} is not a vertex of the graph !')
+        statistics: GraphStatistics = self._statistics
+        reverse_adjacency_list: Dict[str, List[str]] = self._reverse_adjacency_list
+        out_multiplicities: Counter = Counter(adjacency_list.pop(vertex))
+        if statistics is not None:
+            for sink, multiplicity in out_multiplicities.items():
+                statistics.remove_edges(vertex, sink, multiplicity)
+        if self._dangling_sink_sources is not None:
+            for sink, multiplicity in out_multiplicities.items():
+                if sink != vertex and sink not in adjacency_list:
+                    self._remove_dangling_sources(sink, [vertex] * multiplicity)
+        if reverse_adjacency_list is not None:
+            # Only the in and out neighbours of the vertex are visited, instead of every sink list of the graph
+            in_neighbours: Set[str] = set(reverse_adjacency_list.pop(vertex))
+            in_neighbours.discard(vertex)
+            for sink in out_multiplicities:
+                sink_sources: List[str] = reverse_adjacency_list.get(sink)
+                if sink_sources is not None:
+                    sink_sources[:] = [source for source in sink_sources if source != vertex]
+            sources: Iterable[str] = in_neighbours
+        else:
+            sources = adjacency_list
+        for source in sources:
+            sinks: List[str] = adjacency_list[source]
+            multiplicity: int = sinks.count(vertex)
+            if multiplicity:
+                sinks[:] = [sink for sink in sinks if sink != vertex]
+                if statistics is not None:
+                    statistics.remove_edges(source, vertex, multiplicity)
+        if statistics is not None:
+            statistics.remove_vertex(vertex)
+        if self.delta_log is not None:
+            self.delta_log.append([(REMOVE_VERTEX, vertex)])
+        self.version += 1
+
+    def _remove_dangling_sources(self, sink: str, sources: List[str]) -> None:
+        sink_sources: List[str] = self._dangling_sink_sources[sink]
+        for source in sources:
+            sink_sources.remove(source)
+        if not sink_sources:
+            del self._dangling_sink_sources[sink]
+
+    def _get_mutable_adjacency_list(self) -> Dict[str, List[str]]:
+        if self.adjacency_list is None:
+            raise GraphNotBuiltException('You have to build a graph before modifying it!')
+        if not isinstance(self.adjacency_list, dict):
+            raise ReadOnlyGraphException('This graph backend is read-only, it cannot be modified!')
+        return self.adjacency_list
 
     def build_graph_from_pickle_file(self, pickle_filepath: str) -> None:
         try:
@@ -28,6 +292,145 @@ class DirectedGraph:
                 self.logger.info(f'Created directed graph from serialized adjacency list in  {pickle_filepath}')
         except FileNotFoundError:
             raise SerializedGraphFilePathNotFound(f'{pickle_filepath} not found !')
+        if self.with_reverse_index and not self.use_csr_backend:
+            reverse_index_filepath: str = self._reverse_index_filepath(pickle_filepath)
+            if os.path.exists(reverse_index_filepath):
+                with open(reverse_index_filepath, 'rb') as in_file:
+                    self._reverse_adjacency_list = pickle.load(in_file)
+                    self.logger.info(f'Loaded reverse index of the directed graph from {reverse_index_filepath}')
+            else:
+                self.build_reverse_index()
+        # Mutations logged since the snapshot was written are replayed on top of it, keeping the reverse index up to date
+        if os.path.exists(delta_log_filepath(pickle_filepath)):
+            self._replay_delta_log(delta_log_filepath(pickle_filepath))
+        if self.use_csr_backend:
+            self.to_csr_backend()
+
+    def _replay_delta_log(self, log_filepath: str) -> None:
+        # Consecutive operations of the same kind are applied as one batch
+        logged_operations: List[List[str]] = list(read_delta_log(log_filepath))
+        for operation_name, operations in groupby(logged_operations, key=itemgetter(0)):
+            if operation_name == ADD_VERTEX:
+                self.add_vertices(vertex for _, vertex in operations)
+            elif operation_name == ADD_EDGE:
+                self.add_edges(((source, sink) for _, source, sink in operations), create_missing_vertices=True)
+            elif operation_name == REMOVE_EDGE:
+                for _, source, sink in operations:
+                    self.remove_edge(source, sink)
+            else:
+                for _, vertex in operations:
+                    self.remove_vertex(vertex)
+        self.logger.info(f'Replayed {len(logged_operations)} operations of delta log {log_filepath}')
+
+    def open_delta_log(self, pickle_filepath: str) -> None:
+        # The graph must be the one of pickle_filepath and its delta log, i.e. have just been loaded from or serialized
+        # to it. Its next mutations are then appended to the log instead of requiring a full serialization.
+        if self.adjacency_list is None:
+            raise GraphNotBuiltException('You have to build a graph before logging its changes!')
+        self._get_mutable_adjacency_list()
+        self.delta_log = DeltaLog(pickle_filepath)
+        self.logger.info(f'Logging changes of the directed graph to {self.delta_log.filepath}')
+
+    def compact_delta_log(self) -> str:
+        # The whole graph is written to a new snapshot before the previous snapshot and its log are removed, so that a
+        # crash at any point leaves a snapshot consistent with its log
+        if self.delta_log is None:
+            raise DeltaLogNotOpenedException('You have to open a delta log before compacting it!')
+        previous_pickle_filepath: str = self.delta_log.pickle_filepath
+        if not self.delta_log.number_of_bytes():
+            return previous_pickle_filepath
+        pickle_filepath: str = self._new_snapshot_filepath(os.path.dirname(previous_pickle_filepath))
+        self._write_snapshot(pickle_filepath)
+        for filepath in (self.delta_log.filepath, self._reverse_index_filepath(previous_pickle_filepath),
+                         previous_pickle_filepath):
+            if os.path.exists(filepath):
+                os.remove(filepath)
+        self.delta_log = DeltaLog(pickle_filepath)
+        self.logger.info(f'Compacted {previous_pickle_filepath} and its delta log into {pickle_filepath}')
+        return pickle_filepath
+
+    @classmethod
+    def _new_snapshot_filepath(cls, dir_path: str) -> str:
+        # A snapshot never reuses the path of another one, nor of a delta log or reverse index left next to it, which
+        # would otherwise be applied to the new snapshot when it is loaded
+        timestr: str = time.strftime("%Y%m%d-%H%M%S")
+        pickle_filepath: str = os.path.join(dir_path, 'graph_' + timestr + '.pickle')
+        suffix: int = 1
+        while any(map(os.path.exists, (pickle_filepath, delta_log_filepath(pickle_filepath),
+                                       cls._reverse_index_filepath(pickle_filepath)))):
+            pickle_filepath = os.path.join(dir_path, f'graph_{timestr}_{suffix}.pickle')
+            suffix += 1
+        return pickle_filepath
+
+    @staticmethod
+    def _reverse_index_filepath(pickle_filepath: str) -> str:
+        return os.path.splitext(pickle_filepath)[0] + '.reverse.pickle'
+
+    def build_graph_from_edge_list_file(self, edge_list_filepath: str, delimiter: str = '\t',
+                                        skip_header: bool = False,
+                                        block_size: int = DEFAULT_BLOCK_SIZE) -> EdgeListReport:
+        start: float = time.perf_counter()
+        adjacency_list, report = load_edge_list(edge_list_filepath, delimiter=delimiter, skip_header=skip_header,
+                                                block_size=block_size)
+        self.adjacency_list = adjacency_list
+        elapsed_seconds: float = max(time.perf_counter() - start, 1e-9)
+        self.logger.info(f'Created directed graph from edge list {edge_list_filepath}: {len(adjacency_list)} vertices, '
+                         f'{report.number_of_edges} edges, {report.number_of_bytes} bytes in {elapsed_seconds:.3f}s '
+                         f'({report.number_of_edges / elapsed_seconds:.0f} edges/s)')
+        if report.number_of_malformed_lines:
+            self.logger.warning(f'Skipped {report.number_of_malformed_lines} malformed lines of {edge_list_filepath}')
+        if self.use_csr_backend:
+            self.to_csr_backend()
+        elif self.with_reverse_index:
+            self.build_reverse_index()
+        return report
+
+    def build_graph_from_partitioned_directory(self, dir_path: str,
+                                               max_cached_bytes: int = DEFAULT_MAX_CACHED_BYTES) -> None:
+        # Lazy and read-only: shards are loaded on demand, on lookups of their vertices and on full scans
+        adjacency_list: PartitionedAdjacencyList = PartitionedAdjacencyList(dir_path, max_cached_bytes=max_cached_bytes)
+        self.adjacency_list = adjacency_list
+        self.logger.info(f'Opened partitioned directed graph {dir_path}: {len(adjacency_list.partition_infos)} '
+                         f'partitions, {adjacency_list.number_of_vertices} vertices, '
+                         f'{adjacency_list.number_of_edges} edges')
+        if self.use_csr_backend:
+            self.to_csr_backend()
+        elif self.with_reverse_index:
+            self.build_reverse_index()
+
+    def build_graph_from_binary_file(self, binary_filepath: str) -> None:
+        self._set_csr_graph(load_binary_graph(binary_filepath))
+        self.logger.info(f'Mapped directed graph from binary file {binary_filepath}')
+
+    def predecessors(self, vertex: str) -> List[str]:
+        if self.adjacency_list is None:
+            raise GraphNotBuiltException('You have to build a graph before making computations on it!')
+        if self.csr_graph is not None:
+            return self.csr_graph.predecessors(vertex)
+        return list(self._get_vertex_sources(vertex))
+
+    def compute_in_degree(self, vertex: str) -> int:
+        if self.adjacency_list is None:
+            raise GraphNotBuiltException('You have to build a graph before making computations on it!')
+        if self.csr_graph is not None:
+            return self.csr_graph.in_degree(vertex)
+        return len(self._get_vertex_sources(vertex))
+
+    def weighted_successors(self, vertex: str) -> List[Tuple[str, int]]:
+        if self.adjacency_list is None:
+            raise GraphNotBuiltException('You have to build a graph before making computations on it!')
+        if self.csr_graph is not None:
+            return self.csr_graph.weighted_successors(vertex)
+        if vertex not in self.adjacency_list:
+            raise UnknownVertexException(f'{vertex} is not a vertex of the graph !')
+        return list(Counter(self.adjacency_list[vertex]).items())
+
+    def _get_vertex_sources(self, vertex: str) -> List[str]:
+        self.build_reverse_index()
+        try:
+            return self._reverse_adjacency_list[vertex]
+        except KeyError:
+            raise UnknownVertexException(f'{vertex} is not a vertex of the graph !')
 
     def compute_number_of_vertices(self) -> int:
         if self.adjacency_list is None:
@@ -37,99 +440,293 @@ class DirectedGraph:
     def compute_number_of_edges(self) -> int:
         if self.adjacency_list is None:
             raise GraphNotBuiltException('You have to build a graph before making computations on it!')
-        number_of_edges: int = 0
-        for k in self.adjacency_list:
-            number_of_edges += len(self.adjacency_list[k])
-        return number_of_edges
+        if self.csr_graph is not None:
+            return self.csr_graph.number_of_edges()
+        if isinstance(self.adjacency_list, PartitionedAdjacencyList):
+            return self.adjacency_list.number_of_edges
+        if self._statistics is not None:
+            return self._statistics.number_of_edges
+        # Counting edges does not need the degree tables, they are only built when degrees are requested
+        return sum(map(len, self.adjacency_list.values()))
 
     def compute_in_degrees_per_vertex(self) -> Dict[str, int]:
         if self.adjacency_list is None:
             raise GraphNotBuiltException('You have to build a graph before making computations on it!')
-        list_of_sink_lists: List[List[str]] = list(self.adjacency_list.values())
-        flat_list_of_sinks: List[str] = [item for sublist in list_of_sink_lists for item in sublist]
-        in_degrees_counter: Dict[str, int] = dict(Counter(flat_list_of_sinks))
-        in_degrees: Dict[str, int] = {k: (in_degrees_counter[k] if k in in_degrees_counter else 0) for k in
-                                      self.adjacency_list}
-        return in_degrees
+        if self.csr_graph is not None:
+            return self.compute_in_degrees_array().to_dict()
+        return dict(self._get_statistics().in_degrees)
+
+    @cached_on_version
+    def compute_in_degrees_array(self) -> VertexDegrees:
+        if self.adjacency_list is None:
+            raise GraphNotBuiltException('You have to build a graph before making computations on it!')
+        if self.csr_graph is not None:
+            return VertexDegrees(self.csr_graph.vertices, self.csr_graph.in_degrees())
+        in_degrees: Dict[str, int] = self._get_statistics().in_degrees
+        return VertexDegrees(list(in_degrees), np.fromiter(in_degrees.values(), dtype=DEGREES_DTYPE,
+                                                           count=len(in_degrees)))
 
     def compute_out_degrees_per_vertex(self) -> Dict[str, int]:
         if self.adjacency_list is None:
             raise GraphNotBuiltException('You have to build a graph before making computations on it!')
-        return {k: len(self.adjacency_list[k]) for k in self.adjacency_list}
+        if self.csr_graph is not None:
+            return self.compute_out_degrees_array().to_dict()
+        return dict(self._get_statistics().out_degrees)
+
+    @cached_on_version
+    def compute_out_degrees_array(self) -> VertexDegrees:
+        if self.adjacency_list is None:
+            raise GraphNotBuiltException('You have to build a graph before making computations on it!')
+        if self.csr_graph is not None:
+            return VertexDegrees(self.csr_graph.vertices, self.csr_graph.out_degrees())
+        out_degrees: Dict[str, int] = self._get_statistics().out_degrees
+        return VertexDegrees(list(out_degrees), np.fromiter(out_degrees.values(), dtype=DEGREES_DTYPE,
+                                                            count=len(out_degrees)))
+
+    def breadth_first_search(self, source: str) -> List[str]:
+        csr_graph: CSRGraph = self._get_traversable_graph()
+        return self._to_vertex_names(csr_graph, breadth_first_search(csr_graph, csr_graph.vertex_id(source)))
+
+    def depth_first_search(self, source: str) -> List[str]:
+        csr_graph: CSRGraph = self._get_traversable_graph()
+        return self._to_vertex_names(csr_graph, depth_first_search(csr_graph, csr_graph.vertex_id(source)))
+
+    def compute_k_hop_reachable_vertices(self, source: str, k: int) -> List[str]:
+        csr_graph: CSRGraph = self._get_traversable_graph()
+        return self._to_vertex_names(csr_graph, breadth_first_search(csr_graph, csr_graph.vertex_id(source),
+                                                                     max_depth=k))
+
+    def compute_strongly_connected_components(self) -> List[List[str]]:
+        csr_graph: CSRGraph = self._get_traversable_graph()
+        labels: np.ndarray = strongly_connected_components(csr_graph)
+        vertex_ids_by_label: np.ndarray = np.argsort(labels, kind='stable')
+        component_ends: List[int] = np.cumsum(np.bincount(labels)).tolist()
+        return [self._to_vertex_names(csr_graph, vertex_ids_by_label[start:end].tolist())
+                for start, end in zip([0] + component_ends, component_ends)]
+
+    def topological_sort(self) -> List[str]:
+        csr_graph: CSRGraph = self._get_traversable_graph()
+        return self._to_vertex_names(csr_graph, topological_sort(csr_graph))
+
+    def is_acyclic(self) -> bool:
+        return is_acyclic(self._get_traversable_graph())
+
+    def subgraph(self, vertices: Iterable[str] = None, prefix: str = None,
+                 predicate: Callable[[str], bool] = None) -> 'DirectedGraph':
+        # Read-only graph induced by the vertices matching all the given criteria, sharing the sink lists of this graph
+        if self.adjacency_list is None:
+            raise GraphNotBuiltException('You have to build a graph before making computations on it!')
+        vertex_selection: VertexSelection = VertexSelection(vertices=vertices, prefix=prefix, predicate=predicate)
+        sorted_vertex_index: SortedVertexIndex = self._get_sorted_vertex_index() if prefix is not None else None
+        selected_vertices: List[str] = vertex_selection.select(self.adjacency_list, sorted_vertex_index)
+        subgraph: DirectedGraph = DirectedGraph(metrics_hook=self.metrics_hook,
+                                                log_interval_seconds=self.log_interval_seconds)
+        subgraph.adjacency_list = InducedSubgraphView(self.adjacency_list, selected_vertices)
+        self.logger.info(f'Extracted subgraph of {len(selected_vertices)} vertices')
+        return subgraph
+
+    @cached_on_version
+    def _get_sorted_vertex_index(self) -> SortedVertexIndex:
+        return SortedVertexIndex(self.adjacency_list)
+
+    @cached_on_version
+    def _get_traversable_graph(self) -> CSRGraph:
+        if self.adjacency_list is None:
+            raise GraphNotBuiltException('You have to build a graph before making computations on it!')
+        if self.csr_graph is not None:
+            return self.csr_graph
+        return CSRGraph.from_adjacency_list(self.adjacency_list)
+
+    @staticmethod
+    def _to_vertex_names(csr_graph: CSRGraph, vertex_ids: List[int]) -> List[str]:
+        vertices: Sequence[str] = csr_graph.vertices
+        return [vertices[vertex_id] for vertex_id in vertex_ids]
+
+    def _get_statistics(self) -> GraphStatistics:
+        if self._statistics is None:
+            self._statistics = GraphStatistics.from_adjacency_list(self.adjacency_list)
+        return self._statistics
+
+    def serialize_graph(self, dir_path: str) -> str:
+        if self.adjacency_list is None:
+            raise GraphNotBuiltException('You have to build a graph before serializing it!')
+        create_dir_if_not_exist(dir_path)
+        pickle_filepath: str = self._new_snapshot_filepath(dir_path)
+        self._write_snapshot(pickle_filepath)
+        return pickle_filepath
 
-    def serialize_graph(self, dir_path: str) -> None:
+    def _write_snapshot(self, pickle_filepath: str) -> None:
+        with open(pickle_filepath, 'wb') as out_file:
+            pickle.dump(self._serializable_adjacency_list(), out_file)
+            self.logger.info(f'Serialized directed graph to {pickle_filepath}')
+        if self.with_reverse_index:
+            # The reverse index is written next to the adjacency list, which stays readable by every other reader
+            with open(self._reverse_index_filepath(pickle_filepath), 'wb') as out_file:
+                pickle.dump(self._serializable_reverse_adjacency_list(), out_file)
+                self.logger.info(f'Serialized reverse index to {self._reverse_index_filepath(pickle_filepath)}')
+
+    def serialize_graph_to_binary_file(self, dir_path: str) -> str:
         if self.adjacency_list is None:
             raise GraphNotBuiltException('You have to build a graph before serializing it!')
         create_dir_if_not_exist(dir_path)
         timestr: str = time.strftime("%Y%m%d-%H%M%S")
-        with open(os.path.join(dir_path, 'graph_' + timestr + '.pickle'), 'wb') as out_file:
-            pickle.dump(self.adjacency_list, out_file)
-            self.logger.info(f'Serialized directed graph to {os.path.join(dir_path, "graph_" + timestr + ".pickle")}')
+        filepath: str = os.path.join(dir_path, 'graph_' + timestr + '.dgraph')
+        csr_graph: CSRGraph = self.csr_graph if self.csr_graph is not None else CSRGraph.from_adjacency_list(
+            self.adjacency_list, compress_multiplicities=self.compress_multiplicities)
+        write_binary_graph(csr_graph, filepath, include_transposed=self.with_reverse_index)
+        self.logger.info(f'Serialized directed graph to {filepath}')
+        return filepath
 
-    def stream_compute_number_of_vertices(self, pickle_filepath: str) -> int:
-        number_of_vertices: int = 0
-        try:
-            with open(pickle_filepath, 'rb') as in_file:
-                while True:
-                    try:
-                        self.adjacency_list = pickle.load(in_file)
-                        number_of_vertices += self.compute_number_of_vertices()
-                    except EOFError:
-                        break
-                    else:
-                        self.logger.info(f'Current number of vertices is {number_of_vertices}. Still reading data...')
-                self.logger.info(f'Read the full graph. Final number of vertices is  {number_of_vertices}')
-        except FileNotFoundError:
-            raise SerializedGraphFilePathNotFound(f'{pickle_filepath} not found !')
-        return number_of_vertices
+    def serialize_graph_in_chunks(self, dir_path: str, vertices_per_chunk: int = None,
+                                  bytes_per_chunk: int = None) -> str:
+        if self.adjacency_list is None:
+            raise GraphNotBuiltException('You have to build a graph before serializing it!')
+        create_dir_if_not_exist(dir_path)
+        timestr: str = time.strftime("%Y%m%d-%H%M%S")
+        filepath: str = os.path.join(dir_path, 'graph_' + timestr + '_chunked.pickle')
+        chunk_infos: List[ChunkInfo] = write_chunked_graph(self.adjacency_list, filepath,
+                                                           vertices_per_chunk=vertices_per_chunk,
+                                                           bytes_per_chunk=bytes_per_chunk)
+        self.logger.info(f'Serialized directed graph to {filepath} in {len(chunk_infos)} chunks')
+        return filepath
 
-    def stream_compute_number_of_edges(self, pickle_filepath: str) -> int:
+    def serialize_graph_in_partitions(self, dir_path: str,
+                                      number_of_partitions: int = DEFAULT_NUMBER_OF_PARTITIONS) -> str:
+        if self.adjacency_list is None:
+            raise GraphNotBuiltException('You have to build a graph before serializing it!')
+        timestr: str = time.strftime("%Y%m%d-%H%M%S")
+        partitioned_dir_path: str = create_dir_if_not_exist(os.path.join(dir_path, 'graph_' + timestr + '_partitioned'))
+        partition_infos: List[PartitionInfo] = write_partitioned_graph(self.adjacency_list, partitioned_dir_path,
+                                                                       number_of_partitions=number_of_partitions)
+        self.logger.info(f'Serialized directed graph to {partitioned_dir_path} in {len(partition_infos)} partitions')
+        return partitioned_dir_path
+
+    def _serializable_adjacency_list(self) -> Dict[str, List[str]]:
+        if self.csr_graph is not None:
+            return self.csr_graph.to_adjacency_list()
+        return self.adjacency_list
+
+    def _serializable_reverse_adjacency_list(self) -> Dict[str, List[str]]:
+        self.build_reverse_index()
+        if self.csr_graph is not None:
+            return self.csr_graph.transpose().to_adjacency_list()
+        return self._reverse_adjacency_list
+
+    def stream_compute_statistics(self, pickle_filepath: str, accumulators: List[StreamAccumulator] = None,
+                                  chunk_numbers: Iterable[int] = None,
+                                  vertex_selection: VertexSelection = None) -> Dict[str, Any]:
+        # With a vertex selection, the statistics are the ones of the induced subgraph, read and throughput metrics
+        # still counting the whole chunks
+        if accumulators is None:
+            accumulators = create_default_accumulators()
+        throughput_logger: RateLimitedThroughputLogger = RateLimitedThroughputLogger(self.logger,
+                                                                                     self.log_interval_seconds)
+        metrics_hook: MetricsHook = self.metrics_hook
         number_of_edges: int = 0
+        start: float = time.perf_counter()
         try:
             with open(pickle_filepath, 'rb') as in_file:
+                chunks: Iterator[Tuple[Dict[str, List[str]], int]] = iter_pickled_chunks(
+                    in_file, self._select_chunks(in_file, chunk_numbers))
                 while True:
+                    read_start: float = time.perf_counter()
                     try:
-                        self.adjacency_list = pickle.load(in_file)
-                        number_of_edges += self.compute_number_of_edges()
-                    except EOFError:
+                        adjacency_list, chunk_bytes = next(chunks)
+                    except StopIteration:
                         break
-                    else:
-                        self.logger.info(f'Current number of edges is {number_of_edges}. Still reading data...')
-                self.logger.info(f'Read the full graph. Final number of edges is  {number_of_edges}')
+                    aggregation_start: float = time.perf_counter()
+                    chunk_edges: int = sum(map(len, adjacency_list.values()))
+                    chunk_vertices: int = len(adjacency_list)
+                    if vertex_selection is not None:
+                        adjacency_list = vertex_selection.induced_chunk(adjacency_list)
+                    for accumulator in accumulators:
+                        accumulator.update(adjacency_list)
+                    aggregation_end: float = time.perf_counter()
+                    number_of_edges += chunk_edges
+                    throughput_logger.record(chunk_vertices, chunk_edges, chunk_bytes, aggregation_end - read_start)
+                    if metrics_hook is not None:
+                        metrics_hook.increment(CHUNKS_READ)
+                        metrics_hook.increment(BYTES_READ, chunk_bytes)
+                        metrics_hook.increment(VERTICES_READ, chunk_vertices)
+                        metrics_hook.increment(EDGES_READ, chunk_edges)
+                        metrics_hook.increment(DESERIALIZATION_SECONDS, aggregation_start - read_start)
+                        metrics_hook.increment(AGGREGATION_SECONDS, aggregation_end - aggregation_start)
+                throughput_logger.flush()
         except FileNotFoundError:
             raise SerializedGraphFilePathNotFound(f'{pickle_filepath} not found !')
-        return number_of_edges
+        self._record_pass(throughput_logger.number_of_chunks, number_of_edges, time.perf_counter() - start)
+        return {accumulator.name: accumulator.result() for accumulator in accumulators}
 
-    def stream_compute_in_degrees_per_vertex(self, pickle_filepath: str) -> Dict[str, int]:
-        in_degrees: Dict[str, int] = Counter()
+    def _record_pass(self, number_of_chunks: int, number_of_edges: int, elapsed_seconds: float,
+                     workers: int = None) -> None:
+        edges_per_second: float = number_of_edges / max(elapsed_seconds, 1e-9)
+        peak_memory: int = get_peak_rss_bytes()
+        workers_description: str = f' with {workers} workers' if workers else ''
+        self.logger.info(f'Read the full graph in {number_of_chunks} chunks{workers_description} in {elapsed_seconds:.3f}s '
+                         f'({number_of_edges} edges, {edges_per_second:.0f} edges/s, peak memory {peak_memory} '
+                         f'bytes).')
+        if self.metrics_hook is not None:
+            self.metrics_hook.set_gauge(EDGES_PER_SECOND, edges_per_second)
+            self.metrics_hook.set_gauge(PEAK_MEMORY_BYTES, peak_memory)
+
+    @staticmethod
+    def _select_chunks(in_file: BinaryIO, chunk_numbers: Iterable[int]) -> Optional[List[ChunkInfo]]:
+        if chunk_numbers is None:
+            return None
+        chunk_infos: Optional[List[ChunkInfo]] = read_chunk_index(in_file)
+        if chunk_infos is None:
+            raise InvalidGraphFileException(f'{in_file.name} has no chunk index, chunks cannot be selected !')
+        return [chunk_infos[chunk_number] for chunk_number in chunk_numbers]
+
+    def stream_compute_statistics_in_parallel(self, pickle_filepath: str,
+                                              accumulators: List[StreamAccumulator] = None, workers: int = None,
+                                              max_chunks_per_task: int = DEFAULT_MAX_CHUNKS_PER_TASK,
+                                              max_bytes_per_task: int = DEFAULT_MAX_BYTES_PER_TASK,
+                                              max_pending_results: int = None,
+                                              vertex_selection: VertexSelection = None) -> Dict[str, Any]:
+        if accumulators is None:
+            accumulators = create_default_accumulators()
         try:
             with open(pickle_filepath, 'rb') as in_file:
-                while True:
-                    try:
-                        self.adjacency_list = pickle.load(in_file)
-                        in_degrees = Counter(self.compute_in_degrees_per_vertex()) + Counter(in_degrees)
-                    except EOFError:
-                        break
-                    else:
-                        self.logger.info('Still reading data...')
-                self.logger.info('Read the full graph.')
+                chunk_infos: Optional[List[ChunkInfo]] = read_chunk_index(in_file)
         except FileNotFoundError:
             raise SerializedGraphFilePathNotFound(f'{pickle_filepath} not found !')
-        return dict(in_degrees)
+        if chunk_infos is None:
+            self.logger.warning(f'{pickle_filepath} has no chunk index, it is read sequentially')
+            return self.stream_compute_statistics(pickle_filepath, accumulators, vertex_selection=vertex_selection)
+        start: float = time.perf_counter()
+        accumulators = parallel_compute_statistics(pickle_filepath, chunk_infos, accumulators, workers=workers,
+                                                   max_chunks_per_task=max_chunks_per_task,
+                                                   max_bytes_per_task=max_bytes_per_task,
+                                                   max_pending_results=max_pending_results,
+                                                   metrics_hook=self.metrics_hook,
+                                                   vertex_selection=vertex_selection)
+        number_of_edges: int = sum(chunk_info.number_of_edges for chunk_info in chunk_infos)
+        if self.metrics_hook is not None:
+            self.metrics_hook.increment(CHUNKS_READ, len(chunk_infos))
+            self.metrics_hook.increment(BYTES_READ, sum(chunk_info.length for chunk_info in chunk_infos))
+            self.metrics_hook.increment(VERTICES_READ,
+                                        sum(chunk_info.number_of_vertices for chunk_info in chunk_infos))
+            self.metrics_hook.increment(EDGES_READ, number_of_edges)
+        # The peak memory is the one of this process, workers are not accounted for
+        self._record_pass(len(chunk_infos), number_of_edges, time.perf_counter() - start,
+                          workers=workers or os.cpu_count())
+        return {accumulator.name: accumulator.result() for accumulator in accumulators}
+
+    def stream_compute_merged_degrees(self, pickle_filepath: str,
+                                      max_vertices_in_memory: int = DEFAULT_MAX_VERTICES_IN_MEMORY,
+                                      spill_dir: str = None) -> MergedDegrees:
+        accumulator: ExternalMergeAccumulator = ExternalMergeAccumulator(max_vertices_in_memory, spill_dir)
+        return self.stream_compute_statistics(pickle_filepath, [accumulator])[accumulator.name]
+
+    def stream_compute_number_of_vertices(self, pickle_filepath: str) -> int:
+        return self.stream_compute_statistics(pickle_filepath, [NumberOfVerticesAccumulator()])['number_of_vertices']
+
+    def stream_compute_number_of_edges(self, pickle_filepath: str) -> int:
+        return self.stream_compute_statistics(pickle_filepath, [NumberOfEdgesAccumulator()])['number_of_edges']
+
+    def stream_compute_in_degrees_per_vertex(self, pickle_filepath: str) -> Dict[str, int]:
+        return self.stream_compute_statistics(pickle_filepath, [InDegreesAccumulator()])['in_degrees']
 
     def stream_compute_out_degrees_per_vertex(self, pickle_filepath: str) -> Dict[str, int]:
-        out_degrees: Dict[str, int] = Counter()
-        try:
-            with open(pickle_filepath, 'rb') as in_file:
-                while True:
-                    try:
-                        self.adjacency_list = pickle.load(in_file)
-                        out_degrees = Counter(self.compute_out_degrees_per_vertex()) + Counter(out_degrees)
-                    except EOFError:
-                        break
-                    else:
-                        self.logger.info('Still reading data...')
-                self.logger.info('Read the full graph.')
-        except FileNotFoundError:
-            raise SerializedGraphFilePathNotFound(f'{pickle_filepath} not found !')
-        return dict(out_degrees)
+        return self.stream_compute_statistics(pickle_filepath, [OutDegreesAccumulator()])['out_degrees']
@@ -0,0 +1,181 @@
+import gzip
+from collections import defaultdict
+from itertools import chain
+from typing import BinaryIO, DefaultDict, Dict, Iterator, List, NamedTuple, Tuple
+
+import numpy as np
+
+from app.exceptions import SerializedGraphFilePathNotFound
+from app.name_grouping import decode_name_keys, group_rows, name_keys
+from app.utils import garbage_collection_paused
+
+DEFAULT_BLOCK_SIZE = 16 * 1024 * 1024
+GZIP_MAGIC = b'\x1f\x8b'
+NEWLINE = ord('\n')
+COMMENT_PREFIX = ord('#')
+
+
+class EdgeListReport(NamedTuple):
+    number_of_edges: int
+    number_of_malformed_lines: int
+    number_of_bytes: int
+
+
+def open_edge_list_file(filepath: str) -> BinaryIO:
+    # Gzip files are recognized by their magic number rather than by their extension
+    try:
+        with open(filepath, 'rb') as in_file:
+            is_gzip: bool = in_file.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+    except FileNotFoundError:
+        raise SerializedGraphFilePathNotFound(f'{filepath} not found !')
+    return gzip.open(filepath, 'rb') if is_gzip else open(filepath, 'rb')
+
+
+def iter_line_blocks(in_file: BinaryIO, block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[bytes]:
+    # Yields blocks of whole lines, the partial last line of a block being carried over to the next one
+    remainder: bytes = b''
+    while True:
+        block: bytes = in_file.read(block_size)
+        if not block:
+            break
+        block = remainder + block
+        end: int = block.rfind(b'\n') + 1
+        remainder = block[end:]
+        if end:
+            yield block[:end]
+    if remainder:
+        yield remainder + b'\n'
+
+
+def is_well_formed_block(block: bytes, delimiter: bytes) -> bool:
+    # Checks on the raw bytes, with NumPy, that every line is made of two non empty fields separated by the delimiter
+    # and is not a comment. UTF-8 multibyte sequences never contain ASCII bytes, so the check is valid before decoding.
+    if len(delimiter) != 1:
+        return False
+    if not block:
+        return True
+    characters: np.ndarray = np.frombuffer(block, dtype=np.uint8)
+    delimiter_positions: np.ndarray = np.flatnonzero(characters == delimiter[0])
+    newline_positions: np.ndarray = np.flatnonzero(characters == NEWLINE)
+    if len(delimiter_positions) != len(newline_positions):
+        return False
+    line_starts: np.ndarray = np.concatenate(([0], newline_positions[:-1] + 1))
+    has_non_empty_sources: bool = bool((delimiter_positions > line_starts).all())
+    has_non_empty_sinks: bool = bool((newline_positions > delimiter_positions + 1).all())
+    return has_non_empty_sources and has_non_empty_sinks and bool((characters[line_starts] != COMMENT_PREFIX).all())
+
+
+def tokenize_block(block: bytes, delimiter: str) -> Tuple[List[str], List[str], int]:
+    # Vectorized path: once the block is known to be well formed, turning delimiters into newlines splits it into
+    # alternating sources and sinks with a single C-level split. Otherwise lines are split one by one, skipping blank
+    # lines, comments and malformed lines.
+    if b'\r' in block:
+        block = block.replace(b'\r', b'')
+    text: str = block.decode('utf-8')
+    if is_well_formed_block(block, delimiter.encode('utf-8')):
+        tokens: List[str] = text.replace(delimiter, '\n').split('\n')
+        # The block ends with a newline, so the split gives an empty last token
+        tokens.pop()
+        return tokens[0::2], tokens[1::2], 0
+    sources: List[str] = []
+    sinks: List[str] = []
+    number_of_malformed_lines: int = 0
+    for line in text.split('\n'):
+        if not line or line[0] == chr(COMMENT_PREFIX):
+            continue
+        fields: List[str] = line.split(delimiter)
+        if len(fields) != 2 or not fields[0] or not fields[1]:
+            number_of_malformed_lines += 1
+            continue
+        sources.append(fields[0])
+        sinks.append(fields[1])
+    return sources, sinks, number_of_malformed_lines
+
+
+def split_tokens(block: bytes, delimiter: str) -> Tuple[bytes, int]:
+    # Rewrites a block of lines with one vertex name per line, alternately a source and a sink. Well formed blocks are
+    # rewritten without being decoded, the others are tokenized line by line.
+    if b'\r' in block:
+        block = block.replace(b'\r', b'')
+    delimiter_bytes: bytes = delimiter.encode('utf-8')
+    if is_well_formed_block(block, delimiter_bytes):
+        return block.replace(delimiter_bytes, b'\n'), 0
+    sources, sinks, number_of_malformed_lines = tokenize_block(block, delimiter)
+    if not sources:
+        return b'', number_of_malformed_lines
+    return ('\n'.join(chain.from_iterable(zip(sources, sinks))) + '\n').encode('utf-8'), number_of_malformed_lines
+
+
+def load_edge_list(filepath: str, delimiter: str = '\t', skip_header: bool = False,
+                   block_size: int = DEFAULT_BLOCK_SIZE) -> Tuple[Dict[str, List[str]], EdgeListReport]:
+    # No interpreted work is done per edge: vertex names are grouped as rows of 64 bit words with NumPy sorts, first
+    # within each block, then across blocks, and the edges are grouped by source with a stable argsort. Names are only
+    # decoded once per vertex, so that sink lists share one string per vertex. Vertices are created in order of first
+    # appearance as a source, then vertices which are only sinks.
+    block_keys: DefaultDict[int, List[np.ndarray]] = defaultdict(list)
+    block_key_offsets: DefaultDict[int, List[int]] = defaultdict(list)
+    block_token_ids: List[np.ndarray] = [np.zeros(0, dtype=np.int64)]
+    number_of_block_keys: int = 0
+    number_of_malformed_lines: int = 0
+    with open_edge_list_file(filepath) as in_file:
+        for block in iter_line_blocks(in_file, block_size):
+            if skip_header:
+                block = block[block.index(b'\n') + 1:]
+                skip_header = False
+            token_lines, block_malformed_lines = split_tokens(block, delimiter)
+            number_of_malformed_lines += block_malformed_lines
+            characters: np.ndarray = np.frombuffer(token_lines, dtype=np.uint8)
+            ends: np.ndarray = np.flatnonzero(characters == NEWLINE)
+            starts: np.ndarray = np.concatenate(([0], ends[:-1] + 1))
+            lengths: np.ndarray = ends - starts
+            # Tokens are first identified by the distinct names of their block. Names of different lengths never are
+            # equal, they are grouped separately so that a long name does not widen the rows of the others.
+            token_ids: np.ndarray = np.empty(len(ends), dtype=np.int64)
+            for length in np.unique(lengths).tolist():
+                tokens: np.ndarray = np.flatnonzero(lengths == length)
+                keys: np.ndarray = name_keys(characters, starts[tokens], length)
+                groups, first_tokens = group_rows(keys)
+                token_ids[tokens] = number_of_block_keys + groups
+                block_keys[length].append(keys[first_tokens])
+                block_key_offsets[length].append(number_of_block_keys)
+                number_of_block_keys += len(first_tokens)
+            block_token_ids.append(token_ids)
+        number_of_bytes: int = in_file.tell()
+    # Distinct names of the blocks are then grouped into vertices
+    vertex_ids: np.ndarray = np.empty(number_of_block_keys, dtype=np.int64)
+    vertex_names: List[str] = []
+    for length, keys_list in block_keys.items():
+        keys = np.concatenate(keys_list)
+        groups, first_keys = group_rows(keys)
+        groups += len(vertex_names)
+        for block_offset, keys_of_block in zip(block_key_offsets[length], keys_list):
+            vertex_ids[block_offset:block_offset + len(keys_of_block)] = groups[:len(keys_of_block)]
+            groups = groups[len(keys_of_block):]
+        vertex_names.extend(decode_name_keys(keys[first_keys], length))
+    token_vertex_ids: np.ndarray = vertex_ids[np.concatenate(block_token_ids)]
+    source_ids: np.ndarray = token_vertex_ids[0::2]
+    sink_ids: np.ndarray = token_vertex_ids[1::2]
+    names: np.ndarray = np.empty(len(vertex_names), dtype=object)
+    names[:] = vertex_names
+    # Edges of a source are kept in file order by the stable sort, its first edge being its first appearance
+    edge_order: np.ndarray = np.argsort(source_ids, kind='stable')
+    sorted_source_ids: np.ndarray = source_ids[edge_order]
+    is_first_edge_of_source: np.ndarray = np.ones(len(sorted_source_ids), dtype=bool)
+    is_first_edge_of_source[1:] = sorted_source_ids[1:] != sorted_source_ids[:-1]
+    first_edges: np.ndarray = edge_order[is_first_edge_of_source]
+    vertex_order: List[int] = sorted_source_ids[is_first_edge_of_source][np.argsort(first_edges)].tolist()
+    out_degrees: np.ndarray = np.bincount(source_ids, minlength=len(vertex_names))
+    first_sink_indices: np.ndarray = np.full(len(vertex_names), len(sink_ids), dtype=np.int64)
+    np.minimum.at(first_sink_indices, sink_ids, np.arange(len(sink_ids)))
+    sink_only_ids: np.ndarray = np.flatnonzero(out_degrees == 0)
+    vertex_order.extend(sink_only_ids[np.argsort(first_sink_indices[sink_only_ids])].tolist())
+    sorted_sinks: List[str] = names[sink_ids[edge_order]].tolist()
+    sink_list_ends: np.ndarray = np.cumsum(out_degrees)
+    sink_list_starts: List[int] = (sink_list_ends - out_degrees).tolist()
+    sink_list_ends_list: List[int] = sink_list_ends.tolist()
+    # Only acyclic lists are created, the collector would traverse them all repeatedly for nothing
+    with garbage_collection_paused():
+        adjacency_list: Dict[str, List[str]] = {
+            vertex_names[vertex_id]: sorted_sinks[sink_list_starts[vertex_id]:sink_list_ends_list[vertex_id]]
+            for vertex_id in vertex_order}
+    return adjacency_list, EdgeListReport(len(source_ids), number_of_malformed_lines, number_of_bytes)
@@ -4,3 +4,35 @@ class SerializedGraphFilePathNotFound(Exception):
 
 class GraphNotBuiltException(Exception):
     pass
+
+
+class UnknownVertexException(Exception):
+    pass
+
+
+class DuplicateVertexException(Exception):
+    pass
+
+
+class ReadOnlyGraphException(Exception):
+    pass
+
+
+class UnknownEdgeException(Exception):
+    pass
+
+
+class InvalidGraphFileException(Exception):
+    pass
+
+
+class CycleDetectedException(Exception):
+    pass
+
+
+class DeltaLogNotOpenedException(Exception):
+    pass
+
+
+class UnmergeableAccumulatorException(Exception):
+    pass
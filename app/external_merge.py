@@ -0,0 +1,123 @@
+import heapq
+import os
+import pickle
+import tempfile
+from collections import Counter
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from app.degrees import iter_sinks
+
+DEFAULT_MAX_VERTICES_IN_MEMORY = 1_000_000
+RECORDS_PER_BATCH = 10_000
+
+# A run record is (vertex, in degree, out degree, is a vertex). Sinks which never appear as a key of a chunk only
+# contribute to in degrees and are not counted as vertices.
+RunRecord = Tuple[str, int, int, bool]
+
+
+def _write_records(records: Iterable[Tuple], filepath: str) -> None:
+    with open(filepath, 'wb') as out_file:
+        batch: List[Tuple] = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= RECORDS_PER_BATCH:
+                pickle.dump(batch, out_file, protocol=pickle.HIGHEST_PROTOCOL)
+                batch = []
+        if batch:
+            pickle.dump(batch, out_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _read_records(filepath: str) -> Iterator[Tuple]:
+    with open(filepath, 'rb') as in_file:
+        while True:
+            try:
+                yield from pickle.load(in_file)
+            except EOFError:
+                return
+
+
+class MergedDegrees:
+
+    def __init__(self, filepath: str, number_of_vertices: int, number_of_edges: int,
+                 spill_directory: tempfile.TemporaryDirectory = None):
+        self.filepath: str = filepath
+        self.number_of_vertices: int = number_of_vertices
+        self.number_of_edges: int = number_of_edges
+        # Keeps the directory holding the merged run alive, it is removed once this object is garbage collected
+        self.spill_directory: tempfile.TemporaryDirectory = spill_directory
+
+    def __iter__(self) -> Iterator[Tuple[str, int, int]]:
+        # Yields (vertex, in degree, out degree) sorted by vertex, reading the merged run from disk
+        return _read_records(self.filepath)
+
+    def in_degrees(self) -> Dict[str, int]:
+        return {vertex: in_degree for vertex, in_degree, _ in self}
+
+    def out_degrees(self) -> Dict[str, int]:
+        return {vertex: out_degree for vertex, _, out_degree in self}
+
+
+class ExternalDegreesAggregator:
+
+    def __init__(self, max_vertices_in_memory: int = DEFAULT_MAX_VERTICES_IN_MEMORY, spill_dir: str = None):
+        self.max_vertices_in_memory: int = max_vertices_in_memory
+        self.spill_directory = tempfile.TemporaryDirectory(prefix='directed_graph_', dir=spill_dir)
+        self.run_filepaths: List[str] = []
+        self.in_degrees: Counter = Counter()
+        self.out_degrees: Counter = Counter()
+        self.number_of_edges: int = 0
+
+    def add_chunk(self, adjacency_list: Dict[str, List[str]]) -> None:
+        for vertex, sinks in adjacency_list.items():
+            self.out_degrees[vertex] += len(sinks)
+            self.number_of_edges += len(sinks)
+        self.in_degrees.update(iter_sinks(adjacency_list))
+        if len(self.in_degrees) + len(self.out_degrees) > self.max_vertices_in_memory:
+            self.spill()
+
+    def _iter_buffer_records(self) -> Iterator[RunRecord]:
+        for vertex in sorted(self.in_degrees.keys() | self.out_degrees.keys()):
+            yield vertex, self.in_degrees.get(vertex, 0), self.out_degrees.get(vertex, 0), vertex in self.out_degrees
+
+    def spill(self) -> None:
+        if not self.in_degrees and not self.out_degrees:
+            return
+        run_filepath: str = os.path.join(self.spill_directory.name, f'run_{len(self.run_filepaths):06d}.pickle')
+        _write_records(self._iter_buffer_records(), run_filepath)
+        self.run_filepaths.append(run_filepath)
+        self.in_degrees = Counter()
+        self.out_degrees = Counter()
+
+    def _iter_merged_records(self) -> Iterator[Tuple[str, int, int]]:
+        runs: List[Iterator[RunRecord]] = [_read_records(run_filepath) for run_filepath in self.run_filepaths]
+        runs.append(self._iter_buffer_records())
+        for vertex, records in groupby(heapq.merge(*runs, key=itemgetter(0)), key=itemgetter(0)):
+            in_degree: int = 0
+            out_degree: int = 0
+            is_vertex: bool = False
+            for _, record_in_degree, record_out_degree, record_is_vertex in records:
+                in_degree += record_in_degree
+                out_degree += record_out_degree
+                is_vertex = is_vertex or record_is_vertex
+            if is_vertex:
+                yield vertex, in_degree, out_degree
+
+    def merge(self) -> MergedDegrees:
+        merged_filepath: str = os.path.join(self.spill_directory.name, 'merged.pickle')
+        number_of_vertices: int = 0
+
+        def counted_records() -> Iterator[Tuple[str, int, int]]:
+            nonlocal number_of_vertices
+            for record in self._iter_merged_records():
+                number_of_vertices += 1
+                yield record
+
+        _write_records(counted_records(), merged_filepath)
+        for run_filepath in self.run_filepaths:
+            os.remove(run_filepath)
+        self.run_filepaths = []
+        self.in_degrees = Counter()
+        self.out_degrees = Counter()
+        return MergedDegrees(merged_filepath, number_of_vertices, self.number_of_edges, self.spill_directory)
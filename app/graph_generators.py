@@ -0,0 +1,82 @@
+from typing import Callable, Dict, Iterator, List, NamedTuple, Tuple
+
+import numpy as np
+
+from app.csr_graph import TARGETS_DTYPE
+
+DEFAULT_SEED = 0
+DEFAULT_POWER_LAW_EXPONENT = 2.1
+
+
+class SyntheticGraph(NamedTuple):
+    name: str
+    vertices: List[str]
+    sources: np.ndarray
+    sinks: np.ndarray
+
+    @property
+    def number_of_edges(self) -> int:
+        return len(self.sources)
+
+    def edges(self) -> Iterator[Tuple[str, str]]:
+        # Edges are generated lazily, so that the benchmarked build does not start from a materialized list of tuples
+        return zip(map(self.vertices.__getitem__, self.sources.tolist()),
+                   map(self.vertices.__getitem__, self.sinks.tolist()))
+
+    def to_adjacency_list(self) -> Dict[str, List[str]]:
+        adjacency_list: Dict[str, List[str]] = {vertex: [] for vertex in self.vertices}
+        for source, sink in self.edges():
+            adjacency_list[source].append(sink)
+        return adjacency_list
+
+
+def _vertex_names(number_of_vertices: int) -> List[str]:
+    return [f'v{vertex_id}' for vertex_id in range(number_of_vertices)]
+
+
+def generate_uniform_random_graph(number_of_edges: int, number_of_vertices: int = None,
+                                  seed: int = DEFAULT_SEED) -> SyntheticGraph:
+    # Erdos-Renyi like multigraph, sources and sinks being drawn uniformly
+    if number_of_vertices is None:
+        number_of_vertices = max(1, number_of_edges // 10)
+    random_generator: np.random.Generator = np.random.default_rng(seed)
+    sources: np.ndarray = random_generator.integers(number_of_vertices, size=number_of_edges, dtype=TARGETS_DTYPE)
+    sinks: np.ndarray = random_generator.integers(number_of_vertices, size=number_of_edges, dtype=TARGETS_DTYPE)
+    return SyntheticGraph('uniform_random', _vertex_names(number_of_vertices), sources, sinks)
+
+
+def generate_power_law_graph(number_of_edges: int, number_of_vertices: int = None,
+                             exponent: float = DEFAULT_POWER_LAW_EXPONENT, seed: int = DEFAULT_SEED) -> SyntheticGraph:
+    # Sources and sinks are drawn with Zipf probabilities rank ** (-1 / (exponent - 1)), which gives degrees following a
+    # power law of the given exponent: a few hub vertices concentrate most of the edges, like in web or social graphs
+    if number_of_vertices is None:
+        number_of_vertices = max(1, number_of_edges // 10)
+    random_generator: np.random.Generator = np.random.default_rng(seed)
+    probabilities: np.ndarray = np.arange(1, number_of_vertices + 1, dtype=np.float64) ** (-1 / (exponent - 1))
+    probabilities /= probabilities.sum()
+    # Ranks are shuffled so that hubs are not the first inserted vertices
+    vertex_ids_by_rank: np.ndarray = random_generator.permutation(number_of_vertices).astype(TARGETS_DTYPE)
+    sources: np.ndarray = vertex_ids_by_rank[random_generator.choice(number_of_vertices, size=number_of_edges,
+                                                                     p=probabilities)]
+    sinks: np.ndarray = vertex_ids_by_rank[random_generator.choice(number_of_vertices, size=number_of_edges,
+                                                                   p=probabilities)]
+    return SyntheticGraph('power_law', _vertex_names(number_of_vertices), sources, sinks)
+
+
+def generate_dense_multi_edge_graph(number_of_edges: int, number_of_vertices: int = None,
+                                    seed: int = DEFAULT_SEED) -> SyntheticGraph:
+    # Few vertices and many parallel edges: about number_of_edges ** 0.25 vertices, so every pair of vertices is
+    # repeated about sqrt(number_of_edges) times
+    if number_of_vertices is None:
+        number_of_vertices = max(1, round(number_of_edges ** 0.25))
+    random_generator: np.random.Generator = np.random.default_rng(seed)
+    sources: np.ndarray = random_generator.integers(number_of_vertices, size=number_of_edges, dtype=TARGETS_DTYPE)
+    sinks: np.ndarray = random_generator.integers(number_of_vertices, size=number_of_edges, dtype=TARGETS_DTYPE)
+    return SyntheticGraph('dense_multi_edge', _vertex_names(number_of_vertices), sources, sinks)
+
+
+GRAPH_GENERATORS: Dict[str, Callable[..., SyntheticGraph]] = {
+    'power_law': generate_power_law_graph,
+    'uniform_random': generate_uniform_random_graph,
+    'dense_multi_edge': generate_dense_multi_edge_graph,
+}
@@ -0,0 +1,37 @@
+from typing import Dict, List, Mapping
+
+from app.degrees import compute_in_degrees, compute_out_degrees
+
+
+class GraphStatistics:
+
+    def __init__(self, number_of_edges: int, in_degrees: Dict[str, int], out_degrees: Dict[str, int]):
+        self.number_of_edges: int = number_of_edges
+        self.in_degrees: Dict[str, int] = in_degrees
+        self.out_degrees: Dict[str, int] = out_degrees
+
+    @classmethod
+    def from_adjacency_list(cls, adjacency_list: Mapping[str, List[str]]) -> 'GraphStatistics':
+        out_degrees: Dict[str, int] = compute_out_degrees(adjacency_list).to_dict()
+        return cls(sum(out_degrees.values()), compute_in_degrees(adjacency_list).to_dict(), out_degrees)
+
+    def add_vertex(self, vertex: str, in_degree: int = 0) -> None:
+        # A sink which was not a vertex of the graph comes with the edges already pointing to it
+        self.in_degrees[vertex] = in_degree
+        self.out_degrees[vertex] = 0
+
+    def remove_vertex(self, vertex: str) -> None:
+        del self.in_degrees[vertex]
+        del self.out_degrees[vertex]
+
+    def add_edge(self, source: str, sink: str) -> None:
+        self.number_of_edges += 1
+        self.out_degrees[source] += 1
+        self.in_degrees[sink] += 1
+
+    def remove_edges(self, source: str, sink: str, multiplicity: int = 1) -> None:
+        self.number_of_edges -= multiplicity
+        self.out_degrees[source] -= multiplicity
+        # Like in from_adjacency_list, sinks which are not vertices of the graph have no in degree
+        if sink in self.in_degrees:
+            self.in_degrees[sink] -= multiplicity
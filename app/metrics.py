@@ -0,0 +1,126 @@
+import os
+import resource
+import sys
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+# Names of the metrics recorded by DirectedGraph, following the Prometheus naming conventions
+BYTES_READ = 'directed_graph_stream_bytes_read_total'
+CHUNKS_READ = 'directed_graph_stream_chunks_read_total'
+VERTICES_READ = 'directed_graph_stream_vertices_read_total'
+EDGES_READ = 'directed_graph_stream_edges_read_total'
+DESERIALIZATION_SECONDS = 'directed_graph_stream_deserialization_seconds_total'
+AGGREGATION_SECONDS = 'directed_graph_stream_aggregation_seconds_total'
+EDGES_PER_SECOND = 'directed_graph_stream_edges_per_second'
+PEAK_MEMORY_BYTES = 'directed_graph_peak_memory_bytes'
+
+METRIC_DESCRIPTIONS: Dict[str, str] = {
+    BYTES_READ: 'Bytes of serialized chunks read by the stream computations',
+    CHUNKS_READ: 'Chunks unpickled by the stream computations',
+    VERTICES_READ: 'Adjacency list entries read by the stream computations',
+    EDGES_READ: 'Edges read by the stream computations',
+    DESERIALIZATION_SECONDS: 'Time spent unpickling chunks',
+    AGGREGATION_SECONDS: 'Time spent updating the accumulators with the chunks',
+    EDGES_PER_SECOND: 'Throughput of the last stream computation',
+    PEAK_MEMORY_BYTES: 'High-water mark of the resident memory of the process',
+}
+
+
+def get_peak_rss_bytes() -> int:
+    max_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+class MetricsHook(ABC):
+    # Receives the counters (monotonic totals) and gauges (last values) recorded on the hot paths. Implementations must
+    # be cheap, they are called once per chunk.
+
+    @abstractmethod
+    def increment(self, name: str, value: float = 1) -> None:
+        pass
+
+    @abstractmethod
+    def set_gauge(self, name: str, value: float) -> None:
+        pass
+
+
+class InMemoryMetricsHook(MetricsHook):
+
+    def __init__(self):
+        self.counters: Dict[str, float] = {}
+        self.gauges: Dict[str, float] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        self.gauges[name] = value
+
+
+class PrometheusTextExporter(InMemoryMetricsHook):
+    # Keeps the metrics in memory and writes them in the Prometheus text exposition format, e.g. for the textfile
+    # collector of the node exporter
+
+    def __init__(self, filepath: str):
+        super().__init__()
+        self.filepath: str = filepath
+
+    def to_text(self) -> str:
+        lines: List[str] = []
+        for metric_type, metrics in (('counter', self.counters), ('gauge', self.gauges)):
+            for name, value in sorted(metrics.items()):
+                if name in METRIC_DESCRIPTIONS:
+                    lines.append(f'# HELP {name} {METRIC_DESCRIPTIONS[name]}')
+                lines.append(f'# TYPE {name} {metric_type}')
+                lines.append(f'{name} {value!r}')
+        return '\n'.join(lines) + '\n'
+
+    def export(self) -> None:
+        # Written to a temporary file then renamed, so that a scraper never reads a partial file
+        tmp_filepath: str = f'{self.filepath}.{os.getpid()}.tmp'
+        with open(tmp_filepath, 'w') as out_file:
+            out_file.write(self.to_text())
+        os.replace(tmp_filepath, self.filepath)
+
+
+class RateLimitedThroughputLogger:
+    # Aggregates per chunk counts and logs them at most once every interval_seconds, so that logging does not slow
+    # down streams of many small chunks
+
+    def __init__(self, logger, interval_seconds: float):
+        self.logger = logger
+        self.interval_seconds: float = interval_seconds
+        self.last_log_time: float = time.perf_counter()
+        self.number_of_chunks: int = 0
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        self.window_chunks: int = 0
+        self.window_vertices: int = 0
+        self.window_edges: int = 0
+        self.window_bytes: int = 0
+        self.window_seconds: float = 0.0
+
+    def record(self, number_of_vertices: int, number_of_edges: int, number_of_bytes: int, seconds: float) -> None:
+        self.number_of_chunks += 1
+        self.window_chunks += 1
+        self.window_vertices += number_of_vertices
+        self.window_edges += number_of_edges
+        self.window_bytes += number_of_bytes
+        self.window_seconds += seconds
+        now: float = time.perf_counter()
+        if now - self.last_log_time >= self.interval_seconds:
+            self.flush()
+            self.last_log_time = now
+
+    def flush(self) -> None:
+        if not self.window_chunks:
+            return
+        seconds: float = max(self.window_seconds, 1e-9)
+        self.logger.info(f'Chunks {self.number_of_chunks - self.window_chunks + 1} to {self.number_of_chunks}: '
+                         f'{self.window_vertices} vertices, {self.window_edges} edges, {self.window_bytes} bytes in '
+                         f'{self.window_seconds:.3f}s ({self.window_edges / seconds:.0f} edges/s, '
+                         f'{self.window_bytes / seconds / 1e6:.1f} MB/s). Still reading data...')
+        self._reset_window()
@@ -0,0 +1,108 @@
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from app.binary_format import encode_vertex_names
+
+
+ROW_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _hash_rows(keys: np.ndarray) -> np.ndarray:
+    # Multiplicative hash of the words of every row, wrapping around on 64 bits
+    hashes: np.ndarray = np.zeros(len(keys), dtype=np.uint64)
+    for column in range(keys.shape[1]):
+        hashes = (hashes ^ keys[:, column]) * ROW_HASH_MULTIPLIER
+    return hashes
+
+
+def _first_rows_of_groups(sorted_keys: np.ndarray) -> np.ndarray:
+    is_first_of_group: np.ndarray = np.ones(len(sorted_keys), dtype=bool)
+    is_first_of_group[1:] = (sorted_keys[1:] != sorted_keys[:-1]).any(axis=1)
+    return is_first_of_group
+
+
+def group_rows(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Exact grouping of the rows of a matrix of 64 bit words: the rows are sorted, and a new group starts wherever a row
+    # differs from the previous one. Rows of several words are sorted by their hash, a single sort which keeps equal
+    # rows next to each other, unless two different rows share a hash. Returns the group of every row and the first
+    # row of every group.
+    if keys.shape[1] == 1:
+        order: np.ndarray = np.argsort(keys[:, 0], kind='stable')
+        is_first_of_group: np.ndarray = _first_rows_of_groups(keys[order])
+    else:
+        hashes: np.ndarray = _hash_rows(keys)
+        order = np.argsort(hashes, kind='stable')
+        is_first_of_group = _first_rows_of_groups(keys[order])
+        sorted_hashes: np.ndarray = hashes[order]
+        number_of_hashes: int = int(np.count_nonzero(sorted_hashes[1:] != sorted_hashes[:-1]))
+        if number_of_hashes != int(np.count_nonzero(is_first_of_group[1:])):
+            # Different rows share a hash and may be interleaved, they are sorted word by word instead
+            order = np.lexsort(keys.T[::-1])
+            is_first_of_group = _first_rows_of_groups(keys[order])
+    groups: np.ndarray = np.empty(len(keys), dtype=np.int64)
+    groups[order] = np.cumsum(is_first_of_group) - 1
+    # Sorts are stable, so the first sorted row of a group is its first row
+    return groups, order[is_first_of_group]
+
+
+def name_keys(characters: np.ndarray, starts: np.ndarray, length: int) -> np.ndarray:
+    # Names of the same length in bytes, zero padded to whole 64 bit words, each viewed as one row of words. Filled
+    # column by column, so that no index array wider than the names is allocated.
+    key_bytes: np.ndarray = np.zeros((len(starts), 8 * max(1, (length + 7) // 8)), dtype=np.uint8)
+    for column in range(length):
+        key_bytes[:, column] = characters[starts + column]
+    return key_bytes.view(np.uint64)
+
+
+def decode_name_keys(keys: np.ndarray, length: int) -> List[str]:
+    names_data: bytes = keys.view(np.uint8)[:, :length].tobytes()
+    if not length:
+        return [''] * len(keys)
+    return [names_data[start:start + length].decode('utf-8') for start in range(0, len(names_data), length)]
+
+
+def group_names(characters: np.ndarray, starts: np.ndarray, lengths: np.ndarray) -> Tuple[List[str], np.ndarray]:
+    # Groups the UTF-8 names found at starts in characters without decoding them. Names of different lengths never are
+    # equal, they are grouped separately so that a long name does not widen the rows of the others. Returns the
+    # distinct names, decoded once each, in order of first occurrence, and the group of every name.
+    groups: np.ndarray = np.empty(len(starts), dtype=np.int64)
+    first_names: List[np.ndarray] = [np.zeros(0, dtype=np.int64)]
+    distinct_names: List[str] = []
+    for length in np.unique(lengths).tolist():
+        names: np.ndarray = np.flatnonzero(lengths == length)
+        keys: np.ndarray = name_keys(characters, starts[names], length)
+        name_groups, first_rows = group_rows(keys)
+        groups[names] = len(distinct_names) + name_groups
+        first_names.append(names[first_rows])
+        distinct_names.extend(decode_name_keys(keys[first_rows], length))
+    # Groups are renumbered in order of first occurrence
+    order: np.ndarray = np.argsort(np.concatenate(first_names))
+    renumbering: np.ndarray = np.empty(len(order), dtype=np.int64)
+    renumbering[order] = np.arange(len(order))
+    ordered_names: np.ndarray = np.empty(len(distinct_names), dtype=object)
+    ordered_names[:] = distinct_names
+    return ordered_names[order].tolist(), renumbering[groups]
+
+
+class PackedNames:
+    # Vertex names as one UTF-8 string and the offsets of every name in it, which pickle as two buffers instead of one
+    # object per name
+
+    def __init__(self, vertices: Sequence[str]):
+        self.name_offsets, self.names_data = encode_vertex_names(vertices)
+
+
+def group_packed_names(packed_names_list: Sequence[PackedNames]) -> Tuple[List[str], np.ndarray]:
+    # Groups the names of several packed name lists at once, the group of every name being given in the order of the
+    # concatenated lists
+    characters: np.ndarray = np.frombuffer(b''.join(packed_names.names_data for packed_names in packed_names_list),
+                                           dtype=np.uint8)
+    # Offsets are unsigned, they are cast before being shifted by the signed data offsets
+    name_offsets: List[np.ndarray] = [packed_names.name_offsets.astype(np.int64) for packed_names in packed_names_list]
+    data_offsets: List[int] = np.cumsum([0] + [len(packed_names.names_data)
+                                               for packed_names in packed_names_list]).tolist()
+    starts: np.ndarray = np.concatenate([np.zeros(0, dtype=np.int64)] + [
+        offsets[:-1] + data_offset for offsets, data_offset in zip(name_offsets, data_offsets)])
+    lengths: np.ndarray = np.concatenate([np.zeros(0, dtype=np.int64)] + [np.diff(offsets) for offsets in name_offsets])
+    return group_names(characters, starts, lengths)
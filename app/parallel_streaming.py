@@ -0,0 +1,114 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, NamedTuple, Set, Tuple
+
+from app.chunked_pickle import ChunkInfo, iter_pickled_chunks
+from app.metrics import AGGREGATION_SECONDS, DESERIALIZATION_SECONDS, MetricsHook
+from app.exceptions import UnmergeableAccumulatorException
+from app.stream_accumulators import MergeableStreamAccumulator, StreamAccumulator
+from app.subgraph import VertexSelection
+
+DEFAULT_MAX_CHUNKS_PER_TASK = 8
+DEFAULT_MAX_BYTES_PER_TASK = 256 * 1024 * 1024
+
+
+def split_into_tasks(chunk_infos: List[ChunkInfo], max_chunks_per_task: int = DEFAULT_MAX_CHUNKS_PER_TASK,
+                     max_bytes_per_task: int = DEFAULT_MAX_BYTES_PER_TASK) -> List[List[ChunkInfo]]:
+    # Groups consecutive chunks into byte ranges handed out to a single worker
+    tasks: List[List[ChunkInfo]] = []
+    task: List[ChunkInfo] = []
+    task_bytes: int = 0
+    for chunk_info in chunk_infos:
+        if task and (len(task) >= max_chunks_per_task or task_bytes + chunk_info.length > max_bytes_per_task):
+            tasks.append(task)
+            task = []
+            task_bytes = 0
+        task.append(chunk_info)
+        task_bytes += chunk_info.length
+    if task:
+        tasks.append(task)
+    return tasks
+
+
+class PartialStatistics(NamedTuple):
+    # Partial results of the accumulators, see MergeableStreamAccumulator.partial_result
+    partial_results: List[Any]
+    deserialization_seconds: float
+    aggregation_seconds: float
+
+
+def compute_partial_statistics(pickle_filepath: str, chunk_infos: List[ChunkInfo],
+                               accumulators: List[StreamAccumulator],
+                               vertex_selection: VertexSelection = None) -> PartialStatistics:
+    # Runs in a worker process on its own copy of the (empty) accumulators, and only sends back their partial results
+    deserialization_seconds: float = 0.0
+    aggregation_seconds: float = 0.0
+    with open(pickle_filepath, 'rb') as in_file:
+        chunks: Iterator[Tuple[Dict[str, List[str]], int]] = iter_pickled_chunks(in_file, chunk_infos)
+        while True:
+            read_start: float = time.perf_counter()
+            try:
+                adjacency_list, _ = next(chunks)
+            except StopIteration:
+                break
+            aggregation_start: float = time.perf_counter()
+            if vertex_selection is not None:
+                adjacency_list = vertex_selection.induced_chunk(adjacency_list)
+            for accumulator in accumulators:
+                accumulator.update(adjacency_list)
+            deserialization_seconds += aggregation_start - read_start
+            aggregation_seconds += time.perf_counter() - aggregation_start
+    return PartialStatistics([accumulator.partial_result() for accumulator in accumulators], deserialization_seconds,
+                             aggregation_seconds)
+
+
+def merge_partial_results(accumulators: List[MergeableStreamAccumulator], partial_results: List[List[Any]]) -> None:
+    # Every accumulator merges its partial results of all the tasks at once
+    for accumulator, accumulator_partial_results in zip(accumulators, zip(*partial_results)):
+        accumulator.merge_partial_results(list(accumulator_partial_results))
+
+
+def parallel_compute_statistics(pickle_filepath: str, chunk_infos: List[ChunkInfo],
+                                accumulators: List[StreamAccumulator], workers: int = None,
+                                max_chunks_per_task: int = DEFAULT_MAX_CHUNKS_PER_TASK,
+                                max_bytes_per_task: int = DEFAULT_MAX_BYTES_PER_TASK,
+                                max_pending_results: int = None, metrics_hook: MetricsHook = None,
+                                vertex_selection: VertexSelection = None) -> List[StreamAccumulator]:
+    # At most max_pending_results partial results are kept in memory before being merged into the accumulators, and no
+    # more tasks than that are submitted ahead of the merge. Deserialization and aggregation times of the workers are
+    # summed into the metrics hook.
+    for accumulator in accumulators:
+        if not isinstance(accumulator, MergeableStreamAccumulator):
+            raise UnmergeableAccumulatorException(f'{type(accumulator).__name__} cannot be merged, it cannot be computed '
+                                                  f'in parallel !')
+    workers = workers or os.cpu_count() or 1
+    if max_pending_results is None:
+        max_pending_results = 2 * workers
+    tasks: List[List[ChunkInfo]] = split_into_tasks(chunk_infos, max_chunks_per_task, max_bytes_per_task)
+    # Workers start from empty accumulators, so that what the given ones already hold is only counted once
+    empty_accumulators: List[StreamAccumulator] = [accumulator.fresh() for accumulator in accumulators]
+    partial_results: List[List[Any]] = []
+
+    def collect(done_futures: Set[Future]) -> None:
+        for future in done_futures:
+            partial_statistics: PartialStatistics = future.result()
+            partial_results.append(partial_statistics.partial_results)
+            if metrics_hook is not None:
+                metrics_hook.increment(DESERIALIZATION_SECONDS, partial_statistics.deserialization_seconds)
+                metrics_hook.increment(AGGREGATION_SECONDS, partial_statistics.aggregation_seconds)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending_futures: Set[Future] = set()
+        for task in tasks:
+            if len(pending_futures) >= max_pending_results:
+                done_futures, pending_futures = wait(pending_futures, return_when=FIRST_COMPLETED)
+                collect(done_futures)
+            if len(partial_results) >= max_pending_results:
+                merge_partial_results(accumulators, partial_results)
+                partial_results.clear()
+            pending_futures.add(executor.submit(compute_partial_statistics, pickle_filepath, task,
+                                                empty_accumulators, vertex_selection))
+        collect(wait(pending_futures).done)
+    merge_partial_results(accumulators, partial_results)
+    return accumulators
@@ -0,0 +1,144 @@
+import json
+import os
+import sys
+import zlib
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Set, Tuple
+
+from app.chunked_pickle import ChunkInfo, iter_pickled_chunks, read_chunk_index, write_chunked_graph
+from app.exceptions import InvalidGraphFileException, SerializedGraphFilePathNotFound
+
+MANIFEST_FILENAME = 'manifest.json'
+MANIFEST_FORMAT = 'directed_graph_partitions'
+MANIFEST_VERSION = 1
+DEFAULT_NUMBER_OF_PARTITIONS = 16
+DEFAULT_MAX_CACHED_BYTES = 256 * 1024 * 1024
+
+
+class PartitionInfo(NamedTuple):
+    filename: str
+    number_of_vertices: int
+    number_of_edges: int
+    number_of_bytes: int
+
+
+def partition_of(vertex: str, number_of_partitions: int) -> int:
+    # crc32 rather than hash(), which is salted per process, so that every reader finds a vertex in the same shard
+    return zlib.crc32(vertex.encode('utf-8')) % number_of_partitions
+
+
+def partition_filename(partition_number: int) -> str:
+    return f'partition_{partition_number:05d}.pickle'
+
+
+def write_partitioned_graph(adjacency_list: Mapping[str, List[str]], dir_path: str,
+                            number_of_partitions: int = DEFAULT_NUMBER_OF_PARTITIONS,
+                            vertices_per_chunk: int = None) -> List[PartitionInfo]:
+    # Every shard is a chunked pickle file, carrying its own chunk index, so it can also be streamed on its own
+    partitions: List[Dict[str, List[str]]] = [{} for _ in range(number_of_partitions)]
+    for vertex, sinks in adjacency_list.items():
+        partitions[partition_of(vertex, number_of_partitions)][vertex] = sinks
+    partition_infos: List[PartitionInfo] = []
+    for partition_number, partition in enumerate(partitions):
+        filename: str = partition_filename(partition_number)
+        filepath: str = os.path.join(dir_path, filename)
+        chunk_infos: List[ChunkInfo] = write_chunked_graph(partition, filepath, vertices_per_chunk=vertices_per_chunk)
+        partition_infos.append(PartitionInfo(filename, len(partition),
+                                             sum(chunk_info.number_of_edges for chunk_info in chunk_infos),
+                                             os.path.getsize(filepath)))
+    manifest: Dict[str, Any] = {
+        'format': MANIFEST_FORMAT,
+        'version': MANIFEST_VERSION,
+        'number_of_partitions': number_of_partitions,
+        'number_of_vertices': len(adjacency_list),
+        'number_of_edges': sum(partition_info.number_of_edges for partition_info in partition_infos),
+        'partitions': [partition_info._asdict() for partition_info in partition_infos],
+    }
+    # The manifest is written last, so that a directory without it is known to be incomplete
+    with open(os.path.join(dir_path, MANIFEST_FILENAME), 'w') as out_file:
+        json.dump(manifest, out_file, indent=2)
+    return partition_infos
+
+
+def read_manifest(dir_path: str) -> Dict[str, Any]:
+    manifest_filepath: str = os.path.join(dir_path, MANIFEST_FILENAME)
+    try:
+        with open(manifest_filepath) as in_file:
+            manifest: Dict[str, Any] = json.load(in_file)
+    except FileNotFoundError:
+        raise SerializedGraphFilePathNotFound(f'{manifest_filepath} not found !')
+    except ValueError:
+        raise InvalidGraphFileException(f'{manifest_filepath} is not a valid manifest !')
+    if not isinstance(manifest, dict) or manifest.get('format') != MANIFEST_FORMAT:
+        raise InvalidGraphFileException(f'{manifest_filepath} is not a valid manifest !')
+    if manifest['version'] != MANIFEST_VERSION:
+        raise InvalidGraphFileException(f'{manifest_filepath} has unsupported version {manifest["version"]} !')
+    return manifest
+
+
+def read_partition(filepath: str) -> Dict[str, List[str]]:
+    partition: Dict[str, List[str]] = {}
+    with open(filepath, 'rb') as in_file:
+        for chunk, _ in iter_pickled_chunks(in_file, read_chunk_index(in_file)):
+            partition.update(chunk)
+    return partition
+
+
+def estimate_partition_memory(partition: Dict[str, List[str]]) -> int:
+    # Bytes held by a loaded partition: the dict, the sink lists and the strings. Unpickling shares the equal strings
+    # of a chunk, which are counted once. On uniform random graphs a partition takes about 5 times its pickled size.
+    strings: Set[str] = set(partition)
+    strings.update(chain.from_iterable(partition.values()))
+    return sys.getsizeof(partition) + sum(map(sys.getsizeof, partition.values())) + sum(map(sys.getsizeof, strings))
+
+
+class PartitionedAdjacencyList(Mapping):
+    # Read-only adjacency list backed by a partitioned directory. Shards are loaded on the first lookup of one of their
+    # vertices and kept in a LRU cache, whose size is bounded by the estimated memory of the cached shards. The last
+    # loaded shard is always kept, even when it is bigger than the bound.
+
+    def __init__(self, dir_path: str, max_cached_bytes: int = DEFAULT_MAX_CACHED_BYTES):
+        manifest: Dict[str, Any] = read_manifest(dir_path)
+        self.dir_path: str = dir_path
+        self.max_cached_bytes: int = max_cached_bytes
+        self.number_of_vertices: int = manifest['number_of_vertices']
+        self.number_of_edges: int = manifest['number_of_edges']
+        self.partition_infos: List[PartitionInfo] = [PartitionInfo(**partition_info)
+                                                     for partition_info in manifest['partitions']]
+        self._cache: OrderedDict = OrderedDict()
+        self.cached_bytes: int = 0
+        self.number_of_loads: int = 0
+
+    def get_partition(self, partition_number: int) -> Dict[str, List[str]]:
+        cached_partition: Tuple[Dict[str, List[str]], int] = self._cache.get(partition_number)
+        if cached_partition is not None:
+            self._cache.move_to_end(partition_number)
+            return cached_partition[0]
+        partition_info: PartitionInfo = self.partition_infos[partition_number]
+        partition: Dict[str, List[str]] = read_partition(os.path.join(self.dir_path, partition_info.filename))
+        partition_bytes: int = estimate_partition_memory(partition)
+        self.number_of_loads += 1
+        self._cache[partition_number] = (partition, partition_bytes)
+        self.cached_bytes += partition_bytes
+        while self.cached_bytes > self.max_cached_bytes and len(self._cache) > 1:
+            self.cached_bytes -= self._cache.popitem(last=False)[1][1]
+        return partition
+
+    def _get_vertex_partition(self, vertex: str) -> Dict[str, List[str]]:
+        return self.get_partition(partition_of(vertex, len(self.partition_infos)))
+
+    def __getitem__(self, vertex: str) -> List[str]:
+        if not isinstance(vertex, str):
+            raise KeyError(vertex)
+        return self._get_vertex_partition(vertex)[vertex]
+
+    def __contains__(self, vertex: object) -> bool:
+        return isinstance(vertex, str) and vertex in self._get_vertex_partition(vertex)
+
+    def __iter__(self) -> Iterator[str]:
+        # Vertices are iterated shard by shard, so that a full scan loads every shard once
+        return chain.from_iterable(map(self.get_partition, range(len(self.partition_infos))))
+
+    def __len__(self) -> int:
+        return self.number_of_vertices
@@ -0,0 +1,208 @@
+from abc import ABC, abstractmethod
+from itertools import compress
+from typing import Any, Dict, List, NamedTuple, Set, Tuple
+
+import numpy as np
+
+from app.degrees import DEGREES_DTYPE, VertexDegrees, compute_out_degrees, encode_vertices, grow_degrees, \
+    intern_vertices, iter_sinks
+from app.external_merge import DEFAULT_MAX_VERTICES_IN_MEMORY, ExternalDegreesAggregator, MergedDegrees
+from app.name_grouping import PackedNames, group_packed_names
+
+
+class PackedDegrees(NamedTuple):
+    # Partial result of a degrees accumulator, made of NumPy buffers only
+    names: PackedNames
+    degrees: np.ndarray
+    is_vertex: np.ndarray = None
+
+
+class StreamAccumulator(ABC):
+    name: str = None
+
+    @abstractmethod
+    def update(self, adjacency_list: Dict[str, List[str]]) -> None:
+        pass
+
+    @abstractmethod
+    def result(self) -> Any:
+        pass
+
+
+class MergeableStreamAccumulator(StreamAccumulator, ABC):
+    # Accumulators which can be computed on separate chunks, e.g. by parallel workers, then merged together
+
+    @abstractmethod
+    def merge(self, other: 'MergeableStreamAccumulator') -> None:
+        # Adds the partial result of an accumulator of the same type, computed on other chunks
+        pass
+
+    def fresh(self) -> 'MergeableStreamAccumulator':
+        # An empty accumulator of the same type, whatever this one already accumulated
+        return type(self)()
+
+    def partial_result(self) -> Any:
+        # What a worker sends back to be merged with merge_partial_results, the accumulator itself by default. Compact
+        # partial results keep the pickling and the merge in the parent process cheap.
+        return self
+
+    def merge_partial_results(self, partial_results: List[Any]) -> None:
+        for partial_result in partial_results:
+            self.merge(partial_result)
+
+
+class NumberOfVerticesAccumulator(MergeableStreamAccumulator):
+    name = 'number_of_vertices'
+
+    def __init__(self):
+        # A vertex split across several chunks must only be counted once
+        self.vertices: Set[str] = set()
+
+    def update(self, adjacency_list: Dict[str, List[str]]) -> None:
+        self.vertices.update(adjacency_list)
+
+    def merge(self, other: 'NumberOfVerticesAccumulator') -> None:
+        self.vertices |= other.vertices
+
+    def partial_result(self) -> Set[str]:
+        # A pickled set is already a flat list of names, and sets are merged at C speed
+        return self.vertices
+
+    def merge_partial_results(self, partial_results: List[Set[str]]) -> None:
+        self.vertices.update(*partial_results)
+
+    def result(self) -> int:
+        return len(self.vertices)
+
+
+class NumberOfEdgesAccumulator(MergeableStreamAccumulator):
+    name = 'number_of_edges'
+
+    def __init__(self):
+        self.number_of_edges: int = 0
+
+    def update(self, adjacency_list: Dict[str, List[str]]) -> None:
+        self.number_of_edges += sum(map(len, adjacency_list.values()))
+
+    def merge(self, other: 'NumberOfEdgesAccumulator') -> None:
+        self.number_of_edges += other.number_of_edges
+
+    def partial_result(self) -> int:
+        return self.number_of_edges
+
+    def merge_partial_results(self, partial_results: List[int]) -> None:
+        self.number_of_edges += sum(partial_results)
+
+    def result(self) -> int:
+        return self.number_of_edges
+
+
+class VertexIndexedDegreesAccumulator(MergeableStreamAccumulator, ABC):
+
+    def __init__(self):
+        self.vertex_ids: Dict[str, int] = {}
+        self.degrees: np.ndarray = np.zeros(0, dtype=DEGREES_DTYPE)
+
+    def _add_degrees(self, vertex_ids: np.ndarray, degrees: np.ndarray) -> None:
+        self.degrees = grow_degrees(self.degrees, len(self.vertex_ids))
+        # vertex_ids must be unique so that the fancy-indexed addition does not lose any update
+        self.degrees[vertex_ids] += degrees
+
+    def merge(self, other: 'VertexIndexedDegreesAccumulator') -> None:
+        intern_vertices(other.vertex_ids, self.vertex_ids)
+        other_ids: np.ndarray = encode_vertices(other.vertex_ids, self.vertex_ids, count=len(other.vertex_ids))
+        self._add_degrees(other_ids, other.degrees[:len(other.vertex_ids)])
+
+    def partial_result(self) -> PackedDegrees:
+        return PackedDegrees(PackedNames(list(self.vertex_ids)), self.degrees[:len(self.vertex_ids)])
+
+    def _merge_packed_degrees(self, partial_results: List[PackedDegrees]) -> Tuple[np.ndarray, np.ndarray]:
+        # The degrees of every vertex are summed over the partial results with NumPy, only the distinct vertices are
+        # then interned. Returns the ids of the distinct vertices and the group of every vertex of the partial results.
+        vertices, groups = group_packed_names([partial_result.names for partial_result in partial_results])
+        degrees: np.ndarray = np.zeros(len(vertices), dtype=DEGREES_DTYPE)
+        np.add.at(degrees, groups, np.concatenate([np.zeros(0, dtype=DEGREES_DTYPE)] + [
+            partial_result.degrees for partial_result in partial_results]))
+        intern_vertices(vertices, self.vertex_ids)
+        vertex_ids: np.ndarray = encode_vertices(vertices, self.vertex_ids, count=len(vertices))
+        self._add_degrees(vertex_ids, degrees)
+        return vertex_ids, groups
+
+    def merge_partial_results(self, partial_results: List[PackedDegrees]) -> None:
+        self._merge_packed_degrees(partial_results)
+
+    def result_array(self) -> VertexDegrees:
+        return VertexDegrees(list(self.vertex_ids), self.degrees[:len(self.vertex_ids)])
+
+    def result(self) -> Dict[str, int]:
+        return self.result_array().to_dict()
+
+
+class InDegreesAccumulator(VertexIndexedDegreesAccumulator):
+    name = 'in_degrees'
+
+    def __init__(self):
+        super().__init__()
+        # Sinks are interned as they are met, but only the ones which are also a key of some chunk are vertices. Like
+        # compute_in_degrees_per_vertex, the result leaves the other sinks out.
+        self.is_vertex: np.ndarray = np.zeros(0, dtype=bool)
+
+    def _mark_vertices(self, vertex_ids: np.ndarray) -> None:
+        self.is_vertex = grow_degrees(self.is_vertex, len(self.vertex_ids))
+        self.is_vertex[vertex_ids] = True
+
+    def update(self, adjacency_list: Dict[str, List[str]]) -> None:
+        intern_vertices(adjacency_list, self.vertex_ids)
+        intern_vertices(iter_sinks(adjacency_list), self.vertex_ids)
+        sink_ids: np.ndarray = encode_vertices(iter_sinks(adjacency_list), self.vertex_ids)
+        # A bincount over all the vertices seen so far would cost O(V) per chunk, counts are only taken on the chunk
+        unique_sink_ids, sink_counts = np.unique(sink_ids, return_counts=True)
+        self._add_degrees(unique_sink_ids, sink_counts)
+        self._mark_vertices(encode_vertices(adjacency_list, self.vertex_ids, count=len(adjacency_list)))
+
+    def merge(self, other: 'InDegreesAccumulator') -> None:
+        super().merge(other)
+        other_ids: np.ndarray = encode_vertices(other.vertex_ids, self.vertex_ids, count=len(other.vertex_ids))
+        self._mark_vertices(other_ids[other.is_vertex[:len(other.vertex_ids)]])
+
+    def partial_result(self) -> PackedDegrees:
+        is_vertex: np.ndarray = grow_degrees(self.is_vertex, len(self.vertex_ids))[:len(self.vertex_ids)]
+        return PackedDegrees(PackedNames(list(self.vertex_ids)), self.degrees[:len(self.vertex_ids)], is_vertex)
+
+    def merge_partial_results(self, partial_results: List[PackedDegrees]) -> None:
+        vertex_ids, groups = self._merge_packed_degrees(partial_results)
+        is_vertex: np.ndarray = np.concatenate([np.zeros(0, dtype=bool)] + [
+            partial_result.is_vertex for partial_result in partial_results])
+        self._mark_vertices(vertex_ids[groups[is_vertex]])
+
+    def result_array(self) -> VertexDegrees:
+        is_vertex: np.ndarray = grow_degrees(self.is_vertex, len(self.vertex_ids))[:len(self.vertex_ids)]
+        return VertexDegrees(list(compress(self.vertex_ids, is_vertex.tolist())),
+                             self.degrees[:len(self.vertex_ids)][is_vertex])
+
+
+class OutDegreesAccumulator(VertexIndexedDegreesAccumulator):
+    name = 'out_degrees'
+
+    def update(self, adjacency_list: Dict[str, List[str]]) -> None:
+        intern_vertices(adjacency_list, self.vertex_ids)
+        source_ids: np.ndarray = encode_vertices(adjacency_list, self.vertex_ids, count=len(adjacency_list))
+        self._add_degrees(source_ids, compute_out_degrees(adjacency_list).degrees)
+
+
+class ExternalMergeAccumulator(StreamAccumulator):
+    name = 'merged_degrees'
+
+    def __init__(self, max_vertices_in_memory: int = DEFAULT_MAX_VERTICES_IN_MEMORY, spill_dir: str = None):
+        self.aggregator: ExternalDegreesAggregator = ExternalDegreesAggregator(max_vertices_in_memory, spill_dir)
+
+    def update(self, adjacency_list: Dict[str, List[str]]) -> None:
+        self.aggregator.add_chunk(adjacency_list)
+
+    def result(self) -> MergedDegrees:
+        return self.aggregator.merge()
+
+
+def create_default_accumulators() -> List[StreamAccumulator]:
+    return [NumberOfVerticesAccumulator(), NumberOfEdgesAccumulator(), InDegreesAccumulator(),
+            OutDegreesAccumulator()]
@@ -0,0 +1,90 @@
+import sys
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set
+
+from app.degrees import iter_sinks
+
+
+def prefix_upper_bound(prefix: str) -> Optional[str]:
+    # Smallest string greater than every string starting with prefix, None when there is none
+    stripped_prefix: str = prefix.rstrip(chr(sys.maxunicode))
+    if not stripped_prefix:
+        return None
+    return stripped_prefix[:-1] + chr(ord(stripped_prefix[-1]) + 1)
+
+
+class SortedVertexIndex:
+    # Vertex names in sorted order, so that the vertices starting with a prefix are a range found by two bisections
+
+    def __init__(self, vertices: Iterable[str]):
+        self.sorted_vertices: List[str] = sorted(vertices)
+
+    def prefix_range(self, prefix: str) -> List[str]:
+        start: int = bisect_left(self.sorted_vertices, prefix)
+        upper_bound: Optional[str] = prefix_upper_bound(prefix)
+        if upper_bound is None:
+            return self.sorted_vertices[start:]
+        return self.sorted_vertices[start:bisect_left(self.sorted_vertices, upper_bound, lo=start)]
+
+
+class VertexSelection:
+    # Selects the vertices belonging to all of the given criteria: an explicit collection of vertices, a name prefix
+    # and a predicate. It is picklable, and can thus be sent to the parallel stream workers, when the predicate is.
+
+    def __init__(self, vertices: Iterable[str] = None, prefix: str = None, predicate: Callable[[str], bool] = None):
+        # A dict rather than a set keeps the order of the explicit vertices
+        self.vertices: Optional[Dict[str, None]] = dict.fromkeys(vertices) if vertices is not None else None
+        self.prefix: Optional[str] = prefix
+        self.predicate: Optional[Callable[[str], bool]] = predicate
+
+    def __call__(self, vertex: str) -> bool:
+        if self.vertices is not None and vertex not in self.vertices:
+            return False
+        if self.prefix is not None and not vertex.startswith(self.prefix):
+            return False
+        return self.predicate is None or bool(self.predicate(vertex))
+
+    def select(self, adjacency_list: Mapping[str, List[str]],
+               sorted_vertex_index: SortedVertexIndex = None) -> List[str]:
+        # Vertices of the graph which are selected, in the order of the explicit vertices, else in sorted order for a
+        # prefix looked up in the index, else in the order of the graph
+        if self.vertices is not None:
+            candidates: Iterable[str] = (vertex for vertex in self.vertices if vertex in adjacency_list)
+        elif self.prefix is not None and sorted_vertex_index is not None:
+            candidates = sorted_vertex_index.prefix_range(self.prefix)
+        else:
+            candidates = adjacency_list
+        return list(filter(self, candidates))
+
+    def induced_chunk(self, adjacency_list: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        # Restricts a chunk of the streaming reader to the selected vertices and the edges between them. The criteria
+        # are evaluated once per distinct name of the chunk.
+        selected: Set[str] = set(filter(self, set(adjacency_list).union(iter_sinks(adjacency_list))))
+        return {vertex: [sink for sink in sinks if sink in selected]
+                for vertex, sinks in adjacency_list.items() if vertex in selected}
+
+
+class InducedSubgraphView(Mapping):
+    # Read-only adjacency list of the subgraph induced by some vertices. Nothing is copied up front: the sinks of a
+    # vertex are filtered when they are looked up. The vertices are fixed when the view is created, the view is meant
+    # to be used before the graph is modified again.
+
+    def __init__(self, adjacency_list: Mapping[str, List[str]], vertices: List[str]):
+        self.adjacency_list: Mapping[str, List[str]] = adjacency_list
+        self.vertices: List[str] = vertices
+        self.vertex_set: Set[str] = set(vertices)
+
+    def __getitem__(self, vertex: str) -> List[str]:
+        if vertex not in self.vertex_set:
+            raise KeyError(vertex)
+        vertex_set: Set[str] = self.vertex_set
+        return [sink for sink in self.adjacency_list[vertex] if sink in vertex_set]
+
+    def __contains__(self, vertex: object) -> bool:
+        return vertex in self.vertex_set
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.vertices)
+
+    def __len__(self) -> int:
+        return len(self.vertices)
@@ -0,0 +1,144 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from app.csr_graph import CSRGraph
+from app.exceptions import CycleDetectedException
+
+# The algorithms below are iterative, so they are not bound by the recursion limit, and work on vertex ids over
+# zero-copy memoryviews of the CSR buffers, which are faster to index from Python than NumPy arrays. Visited flags are
+# kept in preallocated bytearrays and BFS queues double as the returned visiting order.
+
+
+def _as_memoryview(array: np.ndarray) -> memoryview:
+    return memoryview(np.ascontiguousarray(array).astype(array.dtype.newbyteorder('='), copy=False))
+
+
+def _csr_memoryviews(csr_graph: CSRGraph) -> Tuple[memoryview, memoryview]:
+    return _as_memoryview(csr_graph.offsets), _as_memoryview(csr_graph.targets)
+
+
+def breadth_first_search(csr_graph: CSRGraph, source_id: int, max_depth: int = None) -> List[int]:
+    offsets, targets = _csr_memoryviews(csr_graph)
+    visited: bytearray = bytearray(csr_graph.number_of_vertices())
+    visited[source_id] = 1
+    order: List[int] = [source_id]
+    head: int = 0
+    depth: int = 0
+    # Index in order of the first vertex of the next BFS level
+    next_level_start: int = 1
+    while head < len(order):
+        if head == next_level_start:
+            depth += 1
+            next_level_start = len(order)
+        if max_depth is not None and depth >= max_depth:
+            break
+        vertex_id: int = order[head]
+        head += 1
+        for sink_id in targets[offsets[vertex_id]:offsets[vertex_id + 1]]:
+            if not visited[sink_id]:
+                visited[sink_id] = 1
+                order.append(sink_id)
+    return order
+
+
+def depth_first_search(csr_graph: CSRGraph, source_id: int) -> List[int]:
+    offsets, targets = _csr_memoryviews(csr_graph)
+    visited: bytearray = bytearray(csr_graph.number_of_vertices())
+    order: List[int] = []
+    stack: List[int] = [source_id]
+    while stack:
+        vertex_id: int = stack.pop()
+        if visited[vertex_id]:
+            continue
+        visited[vertex_id] = 1
+        order.append(vertex_id)
+        # Successors are pushed in reverse order so that they are visited in adjacency order
+        stack.extend(sink_id for sink_id in targets[offsets[vertex_id]:offsets[vertex_id + 1]][::-1]
+                     if not visited[sink_id])
+    return order
+
+
+def strongly_connected_components(csr_graph: CSRGraph) -> np.ndarray:
+    # Iterative Tarjan algorithm. Returns the component label of every vertex, components being labelled in reverse
+    # topological order of the condensation graph.
+    offsets, targets = _csr_memoryviews(csr_graph)
+    number_of_vertices: int = csr_graph.number_of_vertices()
+    unvisited: int = -1
+    index: List[int] = [unvisited] * number_of_vertices
+    lowlink: List[int] = [0] * number_of_vertices
+    on_stack: bytearray = bytearray(number_of_vertices)
+    labels: np.ndarray = np.full(number_of_vertices, -1, dtype=np.int32)
+    tarjan_stack: List[int] = []
+    # Call stack of (vertex id, position of the next edge to explore)
+    call_stack: List[List[int]] = []
+    next_index: int = 0
+    next_label: int = 0
+    for root_id in range(number_of_vertices):
+        if index[root_id] != unvisited:
+            continue
+        call_stack.append([root_id, offsets[root_id]])
+        index[root_id] = lowlink[root_id] = next_index
+        next_index += 1
+        tarjan_stack.append(root_id)
+        on_stack[root_id] = 1
+        while call_stack:
+            frame: List[int] = call_stack[-1]
+            vertex_id, edge_position = frame
+            end_position: int = offsets[vertex_id + 1]
+            while edge_position < end_position:
+                sink_id: int = targets[edge_position]
+                edge_position += 1
+                if index[sink_id] == unvisited:
+                    frame[1] = edge_position
+                    index[sink_id] = lowlink[sink_id] = next_index
+                    next_index += 1
+                    tarjan_stack.append(sink_id)
+                    on_stack[sink_id] = 1
+                    call_stack.append([sink_id, offsets[sink_id]])
+                    break
+                if on_stack[sink_id] and index[sink_id] < lowlink[vertex_id]:
+                    lowlink[vertex_id] = index[sink_id]
+            else:
+                call_stack.pop()
+                if call_stack:
+                    parent_id: int = call_stack[-1][0]
+                    if lowlink[vertex_id] < lowlink[parent_id]:
+                        lowlink[parent_id] = lowlink[vertex_id]
+                if lowlink[vertex_id] == index[vertex_id]:
+                    while True:
+                        member_id: int = tarjan_stack.pop()
+                        on_stack[member_id] = 0
+                        labels[member_id] = next_label
+                        if member_id == vertex_id:
+                            break
+                    next_label += 1
+    return labels
+
+
+def topological_sort(csr_graph: CSRGraph) -> List[int]:
+    # Kahn algorithm, a cycle (self loops included) leaves vertices which never reach a zero in degree. In degrees count
+    # CSR entries, not edges, so that parallel edges compressed into a single entry are removed at once.
+    offsets, targets = _csr_memoryviews(csr_graph)
+    in_degrees: List[int] = np.bincount(csr_graph.targets, minlength=csr_graph.number_of_vertices()).tolist()
+    order: List[int] = [vertex_id for vertex_id, in_degree in enumerate(in_degrees) if in_degree == 0]
+    head: int = 0
+    while head < len(order):
+        vertex_id: int = order[head]
+        head += 1
+        for sink_id in targets[offsets[vertex_id]:offsets[vertex_id + 1]]:
+            in_degrees[sink_id] -= 1
+            if in_degrees[sink_id] == 0:
+                order.append(sink_id)
+    if len(order) < csr_graph.number_of_vertices():
+        raise CycleDetectedException(f'The graph contains a cycle, {csr_graph.number_of_vertices() - len(order)} '
+                                     f'vertices cannot be topologically sorted!')
+    return order
+
+
+def is_acyclic(csr_graph: CSRGraph) -> bool:
+    try:
+        topological_sort(csr_graph)
+    except CycleDetectedException:
+        return False
+    return True
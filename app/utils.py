@@ -1,7 +1,39 @@
+import functools
+import gc
 import os
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
 
 
 def create_dir_if_not_exist(directory: str) -> str:
     if not os.path.exists(directory):
         os.makedirs(directory)
     return directory
+
+
+def cached_on_version(method: Callable) -> Callable:
+    # Memoizes a method of an object exposing a `version` counter and a `_version_cache` dict. The cached value is
+    # reused as long as the version of the object did not change.
+    @functools.wraps(method)
+    def wrapper(self, *args: Any) -> Any:
+        key = (method.__name__,) + args
+        cached = self._version_cache.get(key)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        value = method(self, *args)
+        self._version_cache[key] = (self.version, value)
+        return value
+    return wrapper
+
+
+@contextmanager
+def garbage_collection_paused() -> Iterator[None]:
+    # Pauses the cyclic garbage collector while many containers are created, collections being triggered by the number
+    # of allocations and traversing every container already alive
+    was_enabled: bool = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
@@ -0,0 +1,112 @@
+import asyncio
+from typing import AsyncIterator, Tuple
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from app.async_ingestion import AsyncEdgeIngestor
+from app.directed_graph import DirectedGraph
+
+
+class TestAsyncEdgeIngestor(IsolatedAsyncioTestCase):
+
+    async def test_ingest_async_iterator_in_batches(self):
+        # Given
+        async def edges() -> AsyncIterator[Tuple[str, str]]:
+            for edge in [('a', 'b'), ('a', 'b'), ('b', 'c'), ('c', 'a'), ('d', 'd')]:
+                yield edge
+
+        a_directed_graph = DirectedGraph()
+        an_ingestor = AsyncEdgeIngestor(a_directed_graph, batch_size=2, max_pending_batches=1)
+
+        # When
+        number_of_ingested_edges = await an_ingestor.ingest(edges())
+
+        # Then
+        self.assertEqual(5, number_of_ingested_edges)
+        self.assertDictEqual({'a': ['b', 'b'], 'b': ['c'], 'c': ['a'], 'd': ['d']}, a_directed_graph.adjacency_list)
+
+    async def test_ingest_queue_lets_statistics_be_queried_during_ingestion(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.build_graph_from_vertices_and_edges(vertices_list=['a', 'b'], edges_list=[])
+        an_ingestor = AsyncEdgeIngestor(a_directed_graph, batch_size=100)
+        a_queue = asyncio.Queue()
+        ingestion = asyncio.ensure_future(an_ingestor.ingest_queue(a_queue, flush_interval=0.01))
+
+        # When
+        await a_queue.put(('a', 'b'))
+        await a_queue.put(('b', 'a'))
+        while an_ingestor.number_of_ingested_edges < 2:
+            await asyncio.sleep(0.01)
+        live_number_of_edges = a_directed_graph.compute_number_of_edges()
+        await a_queue.put(('a', 'c'))
+        await a_queue.put(None)
+        number_of_ingested_edges = await ingestion
+
+        # Then
+        self.assertEqual(2, live_number_of_edges)
+        self.assertEqual(3, number_of_ingested_edges)
+        self.assertEqual(3, a_directed_graph.compute_number_of_edges())
+        self.assertDictEqual({'a': 1, 'b': 1, 'c': 1}, a_directed_graph.compute_in_degrees_per_vertex())
+
+    async def test_ingest_stream_from_local_tcp_producer(self):
+        # Given
+        lines = [b'a\tb\n', b'a\tb\nb\t', b'c\nmalformed line\n\n', b'c\ta']
+
+        async def produce_edges(_: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            for line in lines:
+                writer.write(line)
+                await writer.drain()
+                await asyncio.sleep(0.01)
+            writer.close()
+
+        server = await asyncio.start_server(produce_edges, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        a_directed_graph = DirectedGraph()
+        an_ingestor = AsyncEdgeIngestor(a_directed_graph, batch_size=2)
+
+        # When
+        async with server:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            number_of_ingested_edges = await an_ingestor.ingest_stream(reader)
+            writer.close()
+
+        # Then
+        self.assertEqual(4, number_of_ingested_edges)
+        self.assertEqual(1, an_ingestor.number_of_malformed_lines)
+        self.assertDictEqual({'a': ['b', 'b'], 'b': ['c'], 'c': ['a']}, a_directed_graph.adjacency_list)
+
+    async def test_ingest_stops_producer_when_applying_a_batch_fails(self):
+        # Given
+        produced_edges = []
+
+        async def edges() -> AsyncIterator[Tuple[str, str]]:
+            for edge in [('a', 'b'), ('b', 'c'), ('c', 'a'), ('d', 'd')]:
+                produced_edges.append(edge)
+                yield edge
+
+        a_directed_graph = DirectedGraph()
+        an_ingestor = AsyncEdgeIngestor(a_directed_graph, batch_size=1, max_pending_batches=1)
+        tasks_before = asyncio.all_tasks()
+
+        # When
+        with patch.object(a_directed_graph, 'add_edges', side_effect=[1, ValueError('failed batch')]):
+            with self.assertRaises(ValueError):
+                await an_ingestor.ingest(edges())
+
+        # Then
+        self.assertSetEqual(set(), {task for task in asyncio.all_tasks() - tasks_before if not task.done()})
+        self.assertLess(len(produced_edges), 4)
+
+    async def test_ingest_stream_splits_reads_into_batches_of_at_most_batch_size(self):
+        # Given
+        a_reader = asyncio.StreamReader()
+        a_reader.feed_data(b'a\tb\nb\tc\nc\ta\nd\td\ne\ta\n')
+        a_reader.feed_eof()
+        an_ingestor = AsyncEdgeIngestor(DirectedGraph(), batch_size=2)
+
+        # When
+        batches = [batch async for batch in an_ingestor._batch_stream(a_reader, b'\t', read_size=1024)]
+
+        # Then
+        self.assertEqual([[('a', 'b'), ('b', 'c')], [('c', 'a'), ('d', 'd')], [('e', 'a')]], batches)
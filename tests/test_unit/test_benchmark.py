@@ -0,0 +1,52 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from app.benchmark import BenchmarkResult, BenchmarkRunner, COMPUTE_OPERATIONS, STREAM_OPERATIONS, compare_results, \
+    read_results, write_results
+
+
+class TestBenchmark(TestCase):
+
+    def test_run_benchmarks_measures_every_operation(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            # Given
+            a_benchmark_runner = BenchmarkRunner(work_dir=dir_path, isolate_cases=False)
+
+            # When
+            results = a_benchmark_runner.run(generator_names=['uniform_random'], sizes=[200])
+
+            # Then
+            self.assertEqual([], os.listdir(dir_path))
+        operations = [result.operation for result in results]
+        self.assertEqual('build_graph_from_vertices_and_edges', operations[0])
+        self.assertTrue(set(COMPUTE_OPERATIONS + STREAM_OPERATIONS) <= set(operations))
+        self.assertIn('build_graph_from_pickle_file', operations)
+        self.assertIn('build_graph_from_edge_list_file', operations)
+        self.assertIn('stream_compute_statistics_in_parallel', operations)
+        for result in results:
+            self.assertEqual(('uniform_random', 20, 200), (result.generator, result.number_of_vertices,
+                                                           result.number_of_edges))
+            self.assertGreater(result.wall_time_seconds, 0)
+            self.assertGreater(result.edges_per_second, 0)
+            self.assertGreater(result.peak_rss_bytes, 0)
+            self.assertGreaterEqual(result.peak_rss_increase_bytes, 0)
+
+    def test_write_read_then_compare_results(self):
+        # Given
+        some_baseline_results = [BenchmarkResult('power_law', 100, 1000, 'serialize_graph', 0.5, 2000, 10, 0),
+                                 BenchmarkResult('power_law', 100, 1000, 'removed_operation', 0.5, 2000, 10, 0)]
+        some_results = [BenchmarkResult('power_law', 100, 1000, 'serialize_graph', 1.0, 1000, 10, 0)]
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = os.path.join(dir_path, 'benchmarks.json')
+            write_results(some_baseline_results, filepath)
+
+            # When
+            read_baseline_results = read_results(filepath)
+
+        ratios = compare_results(read_baseline_results, some_results)
+
+        # Then
+        self.assertEqual(some_baseline_results, read_baseline_results)
+        self.assertDictEqual({('power_law', 1000, 'serialize_graph'): 2.0}, ratios)
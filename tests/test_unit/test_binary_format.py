@@ -0,0 +1,151 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from app.binary_format import HEADER_STRUCT, HEADER_STRUCTS, StringTable, load_binary_graph, write_binary_graph
+from app.csr_graph import CSRGraph
+from app.exceptions import InvalidGraphFileException, SerializedGraphFilePathNotFound
+
+
+class TestBinaryFormat(TestCase):
+
+    def setUp(self):
+        self.an_adjacency_list = {'a': ['b', 'b', 'd', ], 'b': ['d'], 'c': ['a'], 'd': ['c'], 'é': []}
+
+    def test_write_then_load_binary_graph(self):
+        # Given
+        a_csr_graph = CSRGraph.from_adjacency_list(self.an_adjacency_list)
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = os.path.join(dir_path, 'graph.dgraph')
+            write_binary_graph(a_csr_graph, filepath)
+
+            # When
+            a_mapped_graph = load_binary_graph(filepath)
+
+            # Then
+            self.assertIsInstance(a_mapped_graph.vertices, StringTable)
+            self.assertEqual(5, a_mapped_graph.number_of_vertices())
+            self.assertEqual(6, a_mapped_graph.number_of_edges())
+            self.assertEqual([3, 1, 1, 1, 0], a_mapped_graph.out_degrees().tolist())
+            self.assertEqual([1, 2, 1, 2, 0], a_mapped_graph.in_degrees().tolist())
+            self.assertEqual(['a', 'b', 'c', 'd', 'é'], list(a_mapped_graph.vertices))
+            self.assertEqual('é', a_mapped_graph.vertices[-1])
+            self.assertDictEqual(self.an_adjacency_list, a_mapped_graph.to_adjacency_list())
+
+    def test_write_then_load_binary_graph_with_transposed_graph(self):
+        # Given
+        a_csr_graph = CSRGraph.from_adjacency_list(self.an_adjacency_list)
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = os.path.join(dir_path, 'graph.dgraph')
+            write_binary_graph(a_csr_graph, filepath, include_transposed=True)
+
+            # When
+            a_mapped_graph = load_binary_graph(filepath)
+
+            # Then
+            self.assertIsNotNone(a_mapped_graph.transposed)
+            self.assertEqual(['a', 'a'], a_mapped_graph.predecessors('b'))
+            self.assertEqual(['a', 'b'], a_mapped_graph.predecessors('d'))
+            self.assertEqual(0, a_mapped_graph.in_degree('é'))
+
+    def test_write_then_load_binary_graph_with_multiplicities(self):
+        # Given
+        a_csr_graph = CSRGraph.from_adjacency_list(self.an_adjacency_list, compress_multiplicities=True)
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = os.path.join(dir_path, 'graph.dgraph')
+            write_binary_graph(a_csr_graph, filepath, include_transposed=True)
+
+            # When
+            a_mapped_graph = load_binary_graph(filepath)
+
+            # Then
+            self.assertEqual([2, 1, 1, 1, 1], a_mapped_graph.multiplicities.tolist())
+            self.assertEqual(6, a_mapped_graph.number_of_edges())
+            self.assertEqual([1, 2, 1, 2, 0], a_mapped_graph.in_degrees().tolist())
+            self.assertEqual(2, a_mapped_graph.in_degree('b'))
+            self.assertDictEqual(self.an_adjacency_list, a_mapped_graph.to_adjacency_list())
+
+    def test_load_version_1_binary_graph(self):
+        # Given
+        a_csr_graph = CSRGraph.from_adjacency_list(self.an_adjacency_list)
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = os.path.join(dir_path, 'graph.dgraph')
+            write_binary_graph(a_csr_graph, filepath)
+            with open(filepath, 'rb') as in_file:
+                header = HEADER_STRUCT.unpack_from(in_file.read(HEADER_STRUCT.size))
+            # Version 1 files have a shorter header, sections are shifted accordingly
+            shift = HEADER_STRUCT.size - HEADER_STRUCTS[1].size
+            with open(filepath, 'rb') as in_file:
+                body = in_file.read()[HEADER_STRUCT.size:]
+            with open(filepath, 'wb') as out_file:
+                out_file.write(HEADER_STRUCTS[1].pack(header[0], 1, 0, *header[3:5],
+                                                      *[offset - shift for offset in header[5:9]]))
+                out_file.write(body)
+
+            # When
+            a_mapped_graph = load_binary_graph(filepath)
+
+            # Then
+            self.assertIsNone(a_mapped_graph.transposed)
+            self.assertDictEqual(self.an_adjacency_list, a_mapped_graph.to_adjacency_list())
+
+    def test_write_then_load_empty_binary_graph(self):
+        # Given
+        a_csr_graph = CSRGraph.from_adjacency_list({})
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = os.path.join(dir_path, 'graph.dgraph')
+            write_binary_graph(a_csr_graph, filepath)
+
+            # When
+            a_mapped_graph = load_binary_graph(filepath)
+
+            # Then
+            self.assertEqual(0, a_mapped_graph.number_of_vertices())
+            self.assertEqual(0, a_mapped_graph.number_of_edges())
+
+    def test_load_binary_graph_with_wrong_magic_should_raise_exception(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            # Given
+            filepath = os.path.join(dir_path, 'graph.pickle')
+            with open(filepath, 'wb') as out_file:
+                out_file.write(b'\x80\x04' + b'\x00' * 100)
+
+            # When
+            with self.assertRaises(InvalidGraphFileException) as custom_error:
+                load_binary_graph(filepath)
+
+        # Then
+        self.assertEqual(f'{filepath} is not a binary graph file !', custom_error.exception.args[0])
+
+    def test_load_truncated_binary_graph_should_raise_exception(self):
+        # Given
+        a_csr_graph = CSRGraph.from_adjacency_list(self.an_adjacency_list)
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = os.path.join(dir_path, 'graph.dgraph')
+            write_binary_graph(a_csr_graph, filepath)
+            with open(filepath, 'r+b') as out_file:
+                out_file.truncate(os.path.getsize(filepath) - 4)
+
+            # When
+            with self.assertRaises(InvalidGraphFileException) as custom_error:
+                load_binary_graph(filepath)
+
+        # Then
+        self.assertEqual(f'{filepath} is truncated !', custom_error.exception.args[0])
+
+    def test_load_binary_graph_should_raise_exception_when_file_not_found(self):
+        # Given
+        provided_filepath = 'mysterious_file.dgraph'
+
+        # When
+        with self.assertRaises(SerializedGraphFilePathNotFound) as custom_error:
+            load_binary_graph(provided_filepath)
+
+        # Then
+        self.assertEqual(f'{provided_filepath} not found !', custom_error.exception.args[0])
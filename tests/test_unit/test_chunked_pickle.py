@@ -0,0 +1,72 @@
+import os
+import pickle
+import tempfile
+from unittest import TestCase
+
+from app.chunked_pickle import ChunkInfo, iter_adjacency_chunks, iter_pickled_chunks, read_chunk_index, \
+    write_chunked_graph
+
+
+class TestChunkedPickle(TestCase):
+
+    def setUp(self):
+        self.an_adjacency_list = {'a': ['b', 'b', 'd', ], 'b': ['d'], 'c': ['a'], 'd': ['c'], 'e': []}
+
+    def test_iter_adjacency_chunks_by_number_of_vertices(self):
+        # When
+        chunks = list(iter_adjacency_chunks(self.an_adjacency_list, vertices_per_chunk=2))
+
+        # Then
+        self.assertEqual([{'a': ['b', 'b', 'd'], 'b': ['d']}, {'c': ['a'], 'd': ['c']}, {'e': []}], chunks)
+
+    def test_iter_adjacency_chunks_by_number_of_bytes(self):
+        # When
+        chunks = list(iter_adjacency_chunks(self.an_adjacency_list, bytes_per_chunk=15))
+
+        # Then
+        self.assertEqual([{'a': ['b', 'b', 'd']}, {'b': ['d'], 'c': ['a']}, {'d': ['c'], 'e': []}], chunks)
+
+    def test_write_chunked_graph_then_read_its_index_and_chunks(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            # Given
+            filepath = os.path.join(dir_path, 'graph.pickle')
+
+            # When
+            written_chunk_infos = write_chunked_graph(self.an_adjacency_list, filepath, vertices_per_chunk=2)
+            with open(filepath, 'rb') as in_file:
+                chunk_infos = read_chunk_index(in_file)
+                sequential_chunks = [chunk for chunk, _ in iter_pickled_chunks(in_file)]
+                last_chunk = [chunk for chunk, _ in iter_pickled_chunks(in_file, chunk_infos[2:])]
+
+        # Then
+        self.assertEqual(written_chunk_infos, chunk_infos)
+        self.assertEqual([(2, 4), (2, 2), (1, 0)],
+                         [(chunk_info.number_of_vertices, chunk_info.number_of_edges) for chunk_info in chunk_infos])
+        self.assertEqual(0, chunk_infos[0].offset)
+        self.assertEqual(chunk_infos[0].length, chunk_infos[1].offset)
+        self.assertEqual([{'a': ['b', 'b', 'd'], 'b': ['d']}, {'c': ['a'], 'd': ['c']}, {'e': []}],
+                         sequential_chunks)
+        self.assertEqual([{'e': []}], last_chunk)
+
+    def test_read_chunk_index_of_a_file_without_index(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            # Given
+            filepath = os.path.join(dir_path, 'graph.pickle')
+            with open(filepath, 'wb') as out_file:
+                pickle.dump(self.an_adjacency_list, out_file)
+
+            # When
+            with open(filepath, 'rb') as in_file:
+                chunk_infos = read_chunk_index(in_file)
+                position = in_file.tell()
+
+        # Then
+        self.assertIsNone(chunk_infos)
+        self.assertEqual(0, position)
+
+    def test_chunk_info_fields(self):
+        # When
+        a_chunk_info = ChunkInfo(10, 20, 3, 4)
+
+        # Then
+        self.assertEqual((10, 20, 3, 4), tuple(a_chunk_info))
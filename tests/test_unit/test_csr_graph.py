@@ -0,0 +1,124 @@
+from unittest import TestCase
+
+import numpy as np
+
+from app.csr_graph import CSRGraph
+from app.exceptions import UnknownVertexException
+
+
+class TestCSRGraph(TestCase):
+
+    def setUp(self):
+        self.an_adjacency_list = {'a': ['b', 'b', 'd', ], 'b': ['d'], 'c': ['a'], 'd': ['c'], 'e': []}
+
+    def test_from_adjacency_list_builds_offsets_and_targets(self):
+        # When
+        a_csr_graph = CSRGraph.from_adjacency_list(self.an_adjacency_list)
+
+        # Then
+        self.assertEqual(['a', 'b', 'c', 'd', 'e'], a_csr_graph.vertices)
+        self.assertEqual([0, 3, 4, 5, 6, 6], a_csr_graph.offsets.tolist())
+        self.assertEqual([1, 1, 3, 3, 0, 2], a_csr_graph.targets.tolist())
+        self.assertEqual(np.int32, a_csr_graph.targets.dtype)
+
+    def test_statistics(self):
+        # Given
+        a_csr_graph = CSRGraph.from_adjacency_list(self.an_adjacency_list)
+
+        # When
+        number_of_vertices = a_csr_graph.number_of_vertices()
+        number_of_edges = a_csr_graph.number_of_edges()
+        in_degrees = a_csr_graph.in_degrees()
+        out_degrees = a_csr_graph.out_degrees()
+
+        # Then
+        self.assertEqual(5, number_of_vertices)
+        self.assertEqual(6, number_of_edges)
+        self.assertEqual([1, 2, 1, 2, 0], in_degrees.tolist())
+        self.assertEqual([3, 1, 1, 1, 0], out_degrees.tolist())
+
+    def test_adjacency_view_behaves_like_the_adjacency_list(self):
+        # Given
+        a_csr_graph = CSRGraph.from_adjacency_list(self.an_adjacency_list)
+
+        # When
+        a_view = a_csr_graph.adjacency_view()
+
+        # Then
+        self.assertEqual(5, len(a_view))
+        self.assertIn('e', a_view)
+        self.assertNotIn('f', a_view)
+        self.assertEqual(['b', 'b', 'd'], a_view['a'])
+        self.assertDictEqual(self.an_adjacency_list, dict(a_view))
+        self.assertDictEqual(self.an_adjacency_list, a_csr_graph.to_adjacency_list())
+
+    def test_from_adjacency_list_leaves_out_edges_to_sinks_which_are_not_vertices(self):
+        # Given
+        an_adjacency_list = {'a': ['z', 'b', 'z'], 'b': ['y'], 'c': ['a']}
+
+        # When
+        a_csr_graph = CSRGraph.from_adjacency_list(an_adjacency_list)
+
+        # Then
+        self.assertEqual([0, 1, 1, 2], a_csr_graph.offsets.tolist())
+        self.assertEqual([1, 0], a_csr_graph.targets.tolist())
+        self.assertDictEqual({'a': ['b'], 'b': [], 'c': ['a']}, a_csr_graph.to_adjacency_list())
+
+    def test_transpose_gives_predecessors_in_adjacency_order(self):
+        # Given
+        a_csr_graph = CSRGraph.from_adjacency_list(self.an_adjacency_list)
+
+        # When
+        a_transposed_graph = a_csr_graph.transpose()
+
+        # Then
+        self.assertIs(a_transposed_graph, a_csr_graph.transpose())
+        self.assertIs(a_csr_graph, a_transposed_graph.transpose())
+        self.assertEqual(a_csr_graph.in_degrees().tolist(), a_transposed_graph.out_degrees().tolist())
+        self.assertEqual(['a', 'a'], a_csr_graph.predecessors('b'))
+        self.assertEqual(['a', 'b'], a_csr_graph.predecessors('d'))
+        self.assertEqual([], a_csr_graph.predecessors('e'))
+        self.assertEqual(2, a_csr_graph.in_degree('d'))
+
+    def test_predecessors_of_unknown_vertex_should_raise_exception(self):
+        # Given
+        a_csr_graph = CSRGraph.from_adjacency_list(self.an_adjacency_list)
+
+        # When
+        with self.assertRaises(UnknownVertexException) as custom_error:
+            a_csr_graph.predecessors('z')
+
+        # Then
+        self.assertEqual('z is not a vertex of the graph !', custom_error.exception.args[0])
+
+    def test_compressed_multiplicities_give_same_statistics(self):
+        # Given
+        a_csr_graph = CSRGraph.from_adjacency_list(self.an_adjacency_list)
+
+        # When
+        a_compressed_graph = CSRGraph.from_adjacency_list(self.an_adjacency_list, compress_multiplicities=True)
+
+        # Then
+        self.assertEqual(5, len(a_compressed_graph.targets))
+        self.assertEqual([2, 1, 1, 1, 1], a_compressed_graph.multiplicities.tolist())
+        self.assertEqual(6, a_compressed_graph.number_of_edges())
+        self.assertEqual(a_csr_graph.in_degrees().tolist(), a_compressed_graph.in_degrees().tolist())
+        self.assertEqual(a_csr_graph.out_degrees().tolist(), a_compressed_graph.out_degrees().tolist())
+        self.assertEqual([('b', 2), ('d', 1)], a_compressed_graph.weighted_successors('a'))
+        self.assertEqual(['a', 'a'], a_compressed_graph.predecessors('b'))
+        self.assertEqual(2, a_compressed_graph.in_degree('b'))
+
+    def test_compress_then_expand_is_lossless(self):
+        # Given
+        a_csr_graph = CSRGraph.from_adjacency_list(self.an_adjacency_list)
+
+        # When
+        a_compressed_graph = a_csr_graph.compress()
+        an_expanded_graph = a_compressed_graph.expand()
+
+        # Then
+        self.assertDictEqual(self.an_adjacency_list, a_compressed_graph.to_adjacency_list())
+        self.assertDictEqual(self.an_adjacency_list, an_expanded_graph.to_adjacency_list())
+        self.assertEqual(a_csr_graph.offsets.tolist(), an_expanded_graph.offsets.tolist())
+        self.assertEqual(a_csr_graph.targets.tolist(), an_expanded_graph.targets.tolist())
+        self.assertIsNone(an_expanded_graph.multiplicities)
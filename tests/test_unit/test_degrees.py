@@ -0,0 +1,71 @@
+from unittest import TestCase
+
+import numpy as np
+
+from app.degrees import VertexDegrees, compute_in_degrees, compute_out_degrees, encode_vertices, grow_degrees, \
+    intern_vertices
+
+
+class TestDegrees(TestCase):
+
+    def setUp(self):
+        self.an_adjacency_list = {'a': ['b', 'b', 'd', ], 'b': ['d'], 'c': ['a'], 'd': ['c'], 'e': []}
+
+    def test_compute_in_degrees_returns_array_aligned_with_vertices(self):
+        # When
+        in_degrees = compute_in_degrees(self.an_adjacency_list)
+
+        # Then
+        self.assertEqual(['a', 'b', 'c', 'd', 'e'], in_degrees.vertices)
+        self.assertEqual([1, 2, 1, 2, 0], in_degrees.degrees.tolist())
+        self.assertDictEqual({'a': 1, 'b': 2, 'c': 1, 'd': 2, 'e': 0}, in_degrees.to_dict())
+
+    def test_compute_in_degrees_ignores_sinks_which_are_not_vertices(self):
+        # Given
+        an_adjacency_list = {'a': ['b', 'z'], 'b': ['z', 'a']}
+
+        # When
+        in_degrees = compute_in_degrees(an_adjacency_list)
+
+        # Then
+        self.assertDictEqual({'a': 1, 'b': 1}, in_degrees.to_dict())
+
+    def test_compute_out_degrees(self):
+        # When
+        out_degrees = compute_out_degrees(self.an_adjacency_list)
+
+        # Then
+        self.assertDictEqual({'a': 3, 'b': 1, 'c': 1, 'd': 1, 'e': 0}, out_degrees.to_dict())
+
+    def test_intern_then_encode_vertices(self):
+        # Given
+        vertex_ids = {'a': 0}
+
+        # When
+        intern_vertices(['b', 'a', 'c', 'b'], vertex_ids)
+        encoded_vertices = encode_vertices(['c', 'a', 'b', 'z'], vertex_ids)
+
+        # Then
+        self.assertDictEqual({'a': 0, 'b': 1, 'c': 2}, vertex_ids)
+        self.assertEqual([2, 0, 1, 3], encoded_vertices.tolist())
+
+    def test_grow_degrees_keeps_existing_degrees(self):
+        # Given
+        degrees = np.array([1, 2, 3])
+
+        # When
+        grown_degrees = grow_degrees(degrees, 4)
+
+        # Then
+        self.assertEqual([1, 2, 3, 0, 0, 0], grown_degrees.tolist())
+        self.assertIs(grown_degrees, grow_degrees(grown_degrees, 5))
+
+    def test_vertex_degrees_to_dict(self):
+        # Given
+        vertex_degrees = VertexDegrees(['a', 'b'], np.array([4, 0]))
+
+        # When
+        degrees = vertex_degrees.to_dict()
+
+        # Then
+        self.assertDictEqual({'a': 4, 'b': 0}, degrees)
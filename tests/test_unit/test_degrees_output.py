@@ -0,0 +1,107 @@
+import io
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from app.degrees_output import align_degrees, collect_degree_columns, output_degrees, read_degrees_file, \
+    top_k_degrees, write_degree_rows
+from app.exceptions import InvalidGraphFileException, SerializedGraphFilePathNotFound
+
+
+class TestDegreesOutput(TestCase):
+
+    def setUp(self):
+        self.vertices = ['a', 'b', 'c', 'd', 'é']
+        self.in_degrees = np.array([1, 3, 0, 3, 2], dtype=np.int64)
+        self.out_degrees = np.array([4, 0, 2, 1, 2], dtype=np.int64)
+
+    def test_write_degree_rows_in_batches(self):
+        # Given
+        an_out_file = io.StringIO()
+
+        # When
+        number_of_rows = write_degree_rows([('a', 1, 4), ('b', 3, 0), ('c', 0, 2)], an_out_file, rows_per_write=2)
+
+        # Then
+        self.assertEqual(3, number_of_rows)
+        self.assertEqual('a\t1\t4\nb\t3\t0\nc\t0\t2\n', an_out_file.getvalue())
+
+    def test_top_k_degrees_sorted_by_decreasing_degree_then_vertex_order(self):
+        self.assertEqual([('b', 3), ('d', 3), ('é', 2)], top_k_degrees(self.vertices, self.in_degrees, 3))
+        self.assertEqual([('a', 4)], top_k_degrees(self.vertices, self.out_degrees, 1))
+        self.assertEqual(5, len(top_k_degrees(self.vertices, self.out_degrees, 10)))
+        self.assertEqual([], top_k_degrees([], np.zeros(0, dtype=np.int64), 3))
+
+    def test_top_k_degrees_keeps_first_vertices_tied_at_kth_degree(self):
+        # Given
+        vertices = [f'v{index:03d}' for index in range(200)]
+        degrees = np.ones(200, dtype=np.int64)
+        degrees[[150, 7]] = 5
+
+        # When
+        top_degrees = top_k_degrees(vertices, degrees, 5)
+
+        # Then
+        self.assertEqual([('v007', 5), ('v150', 5), ('v000', 1), ('v001', 1), ('v002', 1)], top_degrees)
+
+    def test_align_and_collect_degree_columns(self):
+        # Given
+        in_degrees = {'a': 1, 'b': 0, 'dangling sink': 1}
+        out_degrees = {'b': 2, 'a': 0}
+
+        # When
+        vertices, aligned_in_degrees, aligned_out_degrees = align_degrees(in_degrees, out_degrees)
+        collected_columns = collect_degree_columns([('b', 0, 2), ('a', 1, 0)])
+
+        # Then
+        self.assertEqual(['b', 'a'], vertices)
+        self.assertEqual([0, 1], aligned_in_degrees.tolist())
+        self.assertEqual([2, 0], aligned_out_degrees.tolist())
+        self.assertEqual(['b', 'a'], collected_columns[0])
+        self.assertEqual([0, 1], collected_columns[1].tolist())
+        self.assertEqual([2, 0], collected_columns[2].tolist())
+
+    def test_write_then_read_degrees_file(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            # Given
+            filepath = os.path.join(dir_path, 'degrees.npz')
+            an_out_file = io.StringIO()
+
+            # When
+            output_degrees(self.vertices, self.in_degrees, self.out_degrees, output_filepath=filepath,
+                           out_file=an_out_file)
+            vertices, in_degrees, out_degrees = read_degrees_file(filepath)
+
+        # Then
+        self.assertEqual(f'# Degrees written to {filepath}\n', an_out_file.getvalue())
+        self.assertEqual(self.vertices, vertices)
+        self.assertEqual(self.in_degrees.tolist(), in_degrees.tolist())
+        self.assertEqual(self.out_degrees.tolist(), out_degrees.tolist())
+
+    def test_read_degrees_file_should_raise_exception_when_file_is_missing_or_invalid(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = os.path.join(dir_path, 'degrees.npz')
+            with self.assertRaises(SerializedGraphFilePathNotFound) as custom_error:
+                read_degrees_file(filepath)
+            self.assertEqual(f'{filepath} not found !', custom_error.exception.args[0])
+
+            with open(filepath, 'wb') as out_file:
+                np.savez(out_file, in_degrees=np.zeros(0))
+            with self.assertRaises(InvalidGraphFileException) as custom_error:
+                read_degrees_file(filepath)
+            self.assertEqual(f'{filepath} is not a degrees file !', custom_error.exception.args[0])
+
+    def test_output_degrees_prints_all_degrees_or_top_k(self):
+        # Given
+        all_degrees_file = io.StringIO()
+        top_k_file = io.StringIO()
+
+        # When
+        output_degrees(self.vertices[:2], self.in_degrees[:2], self.out_degrees[:2], out_file=all_degrees_file)
+        output_degrees(self.vertices, self.in_degrees, self.out_degrees, top_k=1, out_file=top_k_file)
+
+        # Then
+        self.assertEqual('# in and out degrees are\na\t1\t4\nb\t3\t0\n', all_degrees_file.getvalue())
+        self.assertEqual('# top 1 in degrees are\nb\t3\n# top 1 out degrees are\na\t4\n', top_k_file.getvalue())
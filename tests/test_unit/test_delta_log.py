@@ -0,0 +1,53 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from app.delta_log import ADD_EDGE, ADD_VERTEX, REMOVE_EDGE, REMOVE_VERTEX, DeltaLog, read_delta_log
+from app.exceptions import InvalidGraphFileException
+
+
+class TestDeltaLog(TestCase):
+
+    def test_append_then_read_delta_log(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            # Given
+            a_delta_log = DeltaLog(os.path.join(dir_path, 'graph.pickle'))
+
+            # When
+            a_delta_log.append([(ADD_VERTEX, 'é'), (ADD_EDGE, 'a', 'é')])
+            a_delta_log.append([])
+            a_delta_log.append([(REMOVE_EDGE, 'a', 'é'), (REMOVE_VERTEX, 'é')])
+
+            # Then
+            self.assertEqual(os.path.join(dir_path, 'graph.delta.jsonl'), a_delta_log.filepath)
+            self.assertEqual([[ADD_VERTEX, 'é'], [ADD_EDGE, 'a', 'é'], [REMOVE_EDGE, 'a', 'é'], [REMOVE_VERTEX, 'é']],
+                             list(read_delta_log(a_delta_log.filepath)))
+
+    def test_torn_last_line_is_ignored_then_truncated(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            # Given
+            log_filepath = os.path.join(dir_path, 'graph.delta.jsonl')
+            with open(log_filepath, 'w') as log_file:
+                log_file.write('["add_vertex", "a"]\n["add_ed')
+
+            # When
+            operations_before_reopening = list(read_delta_log(log_filepath))
+            DeltaLog(os.path.join(dir_path, 'graph.pickle')).append([(ADD_VERTEX, 'b')])
+
+            # Then
+            self.assertEqual([[ADD_VERTEX, 'a']], operations_before_reopening)
+            self.assertEqual([[ADD_VERTEX, 'a'], [ADD_VERTEX, 'b']], list(read_delta_log(log_filepath)))
+
+    def test_read_delta_log_should_raise_exception_on_invalid_operation(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            # Given
+            log_filepath = os.path.join(dir_path, 'graph.delta.jsonl')
+            with open(log_filepath, 'w') as log_file:
+                log_file.write('["add_vertex", "a"]\n["add_edge", "a"]\n')
+
+            # When
+            with self.assertRaises(InvalidGraphFileException) as custom_error:
+                list(read_delta_log(log_filepath))
+
+            # Then
+            self.assertEqual(f'{log_filepath} has an invalid operation at line 2 !', custom_error.exception.args[0])
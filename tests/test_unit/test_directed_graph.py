@@ -1,10 +1,20 @@
 import os
+import pickle
+import tempfile
 from typing import List, Tuple, Dict
 from unittest import TestCase
 from unittest.mock import Mock, patch
 
-from app.directed_graph import DirectedGraph
-from app.exceptions import SerializedGraphFilePathNotFound, GraphNotBuiltException
+from app.delta_log import read_delta_log
+from app.directed_graph import DirectedGraph, DuplicateVertexPolicy
+from app.exceptions import SerializedGraphFilePathNotFound, GraphNotBuiltException, DuplicateVertexException, \
+    ReadOnlyGraphException, UnknownEdgeException, UnknownVertexException, InvalidGraphFileException, \
+    CycleDetectedException, DeltaLogNotOpenedException
+from app.graph_statistics import GraphStatistics
+from app.metrics import AGGREGATION_SECONDS, BYTES_READ, CHUNKS_READ, DESERIALIZATION_SECONDS, EDGES_PER_SECOND, \
+    EDGES_READ, PEAK_MEMORY_BYTES, VERTICES_READ, InMemoryMetricsHook
+from app.stream_accumulators import NumberOfEdgesAccumulator
+from app.subgraph import VertexSelection
 
 
 class TestDirectedGraph(TestCase):
@@ -75,6 +85,19 @@ class TestDirectedGraph(TestCase):
         expected_number_of_edges = 6
         self.assertEqual(expected_number_of_edges, computed_number_of_edges)
 
+    def test_compute_number_of_edges_does_not_build_degree_tables(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = {'a': ['b', 'c'], 'b': ['c'], 'c': []}
+
+        with patch('app.directed_graph.GraphStatistics.from_adjacency_list') as spied_full_scan:
+            # When
+            computed_number_of_edges = a_directed_graph.compute_number_of_edges()
+
+        # Then
+        spied_full_scan.assert_not_called()
+        self.assertEqual(3, computed_number_of_edges)
+
     def test_compute_number_of_edges_when_graph_is_empty_should_raise_exception(self):
         # Given
         a_directed_graph = DirectedGraph()
@@ -207,3 +230,855 @@ class TestDirectedGraph(TestCase):
 
         # Then
         self.assertEqual('You have to build a graph before serializing it!', custom_error.exception.args[0])
+
+    def _write_pickle_chunks(self, dir_path: str, chunks: List[Dict[str, List[str]]]) -> str:
+        filepath: str = os.path.join(dir_path, 'graph.pickle')
+        with open(filepath, 'wb') as out_file:
+            for chunk in chunks:
+                pickle.dump(chunk, out_file)
+        return filepath
+
+    def test_stream_compute_statistics_reads_file_once(self):
+        # Given
+        chunks = [{'a': ['b', 'b', 'd'], 'b': ['d']}, {'c': ['a'], 'd': ['c'], 'e': []}]
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = self._write_pickle_chunks(dir_path, chunks)
+            a_directed_graph = DirectedGraph()
+
+            # When
+            with patch('pickle.load', side_effect=pickle.load) as spied_pickle_load:
+                statistics = a_directed_graph.stream_compute_statistics(filepath)
+
+        # Then
+        self.assertEqual(3, spied_pickle_load.call_count)
+        self.assertEqual(5, statistics['number_of_vertices'])
+        self.assertEqual(6, statistics['number_of_edges'])
+        self.assertDictEqual({'a': 1, 'b': 2, 'c': 1, 'd': 2, 'e': 0}, statistics['in_degrees'])
+        self.assertDictEqual({'a': 3, 'b': 1, 'c': 1, 'd': 1, 'e': 0}, statistics['out_degrees'])
+
+    def test_stream_compute_statistics_with_custom_accumulators(self):
+        # Given
+        chunks = [{'a': ['b', 'b', 'd'], 'b': ['d']}, {'c': ['a'], 'd': ['c'], 'e': []}]
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = self._write_pickle_chunks(dir_path, chunks)
+            a_directed_graph = DirectedGraph()
+
+            # When
+            statistics = a_directed_graph.stream_compute_statistics(filepath, [NumberOfEdgesAccumulator()])
+
+        # Then
+        self.assertDictEqual({'number_of_edges': 6}, statistics)
+
+    def test_stream_compute_methods_match_in_memory_computations(self):
+        # Given
+        chunks = [{'a': ['b', 'b', 'd'], 'b': ['d']}, {'c': ['a'], 'd': ['c'], 'e': []}]
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = self._write_pickle_chunks(dir_path, chunks)
+            a_directed_graph = DirectedGraph()
+
+            # When
+            number_of_vertices = a_directed_graph.stream_compute_number_of_vertices(filepath)
+            number_of_edges = a_directed_graph.stream_compute_number_of_edges(filepath)
+            in_degrees = a_directed_graph.stream_compute_in_degrees_per_vertex(filepath)
+            out_degrees = a_directed_graph.stream_compute_out_degrees_per_vertex(filepath)
+
+        # Then
+        self.assertEqual(5, number_of_vertices)
+        self.assertEqual(6, number_of_edges)
+        self.assertDictEqual({'a': 1, 'b': 2, 'c': 1, 'd': 2, 'e': 0}, in_degrees)
+        self.assertDictEqual({'a': 3, 'b': 1, 'c': 1, 'd': 1, 'e': 0}, out_degrees)
+
+    def test_stream_compute_statistics_should_raise_exception_when_file_not_found(self):
+        # Given
+        provided_filepath = 'mysterious_file.pickle'
+
+        # When
+        a_directed_graph = DirectedGraph()
+        with self.assertRaises(SerializedGraphFilePathNotFound) as custom_error:
+            a_directed_graph.stream_compute_statistics(provided_filepath)
+
+        # Then
+        self.assertEqual(f'{provided_filepath} not found !', custom_error.exception.args[0])
+
+    def test_csr_backend_gives_same_statistics_as_dict_backend(self):
+        # Given
+        a_vertex_list: List[str] = ['a', 'b', 'c', 'c', 'd', 'e']
+        an_edges_list: List[Tuple[str, str]] = [('a', 'b'), ('a', 'b'), ('d', 'c'), ('b', 'd'), ('a', 'd'), ('c', 'a'),
+                                                ('b', 'b')]
+        a_dict_graph = DirectedGraph()
+        a_dict_graph.build_graph_from_vertices_and_edges(vertices_list=a_vertex_list, edges_list=an_edges_list)
+
+        # When
+        a_csr_graph = DirectedGraph(use_csr_backend=True)
+        a_csr_graph.build_graph_from_vertices_and_edges(vertices_list=a_vertex_list, edges_list=an_edges_list)
+
+        # Then
+        self.assertIsNotNone(a_csr_graph.csr_graph)
+        self.assertDictEqual(a_dict_graph.adjacency_list, dict(a_csr_graph.adjacency_list))
+        self.assertEqual(a_dict_graph.compute_number_of_vertices(), a_csr_graph.compute_number_of_vertices())
+        self.assertEqual(a_dict_graph.compute_number_of_edges(), a_csr_graph.compute_number_of_edges())
+        self.assertDictEqual(a_dict_graph.compute_in_degrees_per_vertex(), a_csr_graph.compute_in_degrees_per_vertex())
+        self.assertDictEqual(a_dict_graph.compute_out_degrees_per_vertex(),
+                             a_csr_graph.compute_out_degrees_per_vertex())
+
+    def test_setting_adjacency_list_drops_csr_backend(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = {'a': ['b'], 'b': []}
+        a_directed_graph.to_csr_backend()
+
+        # When
+        a_directed_graph.adjacency_list = {'a': ['b', 'b'], 'b': []}
+
+        # Then
+        self.assertIsNone(a_directed_graph.csr_graph)
+        self.assertEqual(2, a_directed_graph.compute_number_of_edges())
+
+    def test_to_csr_backend_when_graph_is_empty_should_raise_exception(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+
+        # When
+        with self.assertRaises(GraphNotBuiltException) as custom_error:
+            a_directed_graph.to_csr_backend()
+
+        # Then
+        self.assertEqual('You have to build a graph before compacting it!', custom_error.exception.args[0])
+
+    def test_adjacency_list_build_from_generators(self):
+        # Given
+        a_vertex_generator = (vertex for vertex in ['a', 'b', 'c'])
+        an_edges_generator = ((source, sink) for source, sink in [('a', 'b'), ('b', 'c'), ('c', 'z'), ('a', 'b')])
+
+        # When
+        directed_graph = DirectedGraph()
+        directed_graph.build_graph_from_vertices_and_edges(vertices_list=a_vertex_generator,
+                                                           edges_list=an_edges_generator)
+
+        # Then
+        self.assertDictEqual({'a': ['b', 'b'], 'b': ['c'], 'c': []}, directed_graph.adjacency_list)
+
+    def test_adjacency_list_build_with_raise_policy_should_raise_exception_on_duplicate_vertex(self):
+        # Given
+        a_vertex_list: List[str] = ['a', 'b', 'c', 'c']
+
+        # When
+        directed_graph = DirectedGraph()
+        with self.assertRaises(DuplicateVertexException) as custom_error:
+            directed_graph.build_graph_from_vertices_and_edges(vertices_list=a_vertex_list, edges_list=[],
+                                                               duplicate_vertex_policy=DuplicateVertexPolicy.RAISE)
+
+        # Then
+        self.assertEqual('c is already a vertex of the graph !', custom_error.exception.args[0])
+
+    def test_add_edges_appends_valid_edges_only(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.build_graph_from_vertices_and_edges(vertices_list=['a', 'b'], edges_list=[('a', 'b')])
+
+        # When
+        number_of_added_edges = a_directed_graph.add_edges([('b', 'a'), ('a', 'z'), ('z', 'a'), ('a', 'b')])
+
+        # Then
+        self.assertEqual(2, number_of_added_edges)
+        self.assertDictEqual({'a': ['b', 'b'], 'b': ['a']}, a_directed_graph.adjacency_list)
+
+    def test_add_edges_can_create_missing_vertices(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.build_graph_from_vertices_and_edges(vertices_list=['a'], edges_list=[])
+
+        # When
+        number_of_added_edges = a_directed_graph.add_edges([('a', 'b'), ('c', 'c')], create_missing_vertices=True)
+
+        # Then
+        self.assertEqual(2, number_of_added_edges)
+        self.assertDictEqual({'a': ['b'], 'b': [], 'c': ['c']}, a_directed_graph.adjacency_list)
+
+    def test_add_vertices_returns_number_of_new_vertices(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.build_graph_from_vertices_and_edges(vertices_list=['a'], edges_list=[])
+
+        # When
+        number_of_added_vertices = a_directed_graph.add_vertices(['a', 'b', 'c', 'b'])
+
+        # Then
+        self.assertEqual(2, number_of_added_vertices)
+        self.assertDictEqual({'a': [], 'b': [], 'c': []}, a_directed_graph.adjacency_list)
+
+    def test_add_edges_when_graph_is_empty_should_raise_exception(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+
+        # When
+        with self.assertRaises(GraphNotBuiltException) as custom_error:
+            a_directed_graph.add_edges([('a', 'b')])
+
+        # Then
+        self.assertEqual('You have to build a graph before modifying it!', custom_error.exception.args[0])
+
+    def test_add_edges_on_csr_backend_should_raise_exception(self):
+        # Given
+        a_directed_graph = DirectedGraph(use_csr_backend=True)
+        a_directed_graph.build_graph_from_vertices_and_edges(vertices_list=['a', 'b'], edges_list=[('a', 'b')])
+
+        # When
+        with self.assertRaises(ReadOnlyGraphException) as custom_error:
+            a_directed_graph.add_edges([('b', 'a')])
+
+        # Then
+        self.assertEqual('This graph backend is read-only, it cannot be modified!', custom_error.exception.args[0])
+
+    def test_compute_degrees_arrays(self):
+        # Given
+        a_given_adjacency_list = {'a': ['b', 'b', 'd', ], 'b': ['d'], 'c': ['a'], 'd': ['c'], 'e': []}
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = a_given_adjacency_list
+
+        # When
+        in_degrees = a_directed_graph.compute_in_degrees_array()
+        out_degrees = a_directed_graph.compute_out_degrees_array()
+
+        # Then
+        self.assertEqual(['a', 'b', 'c', 'd', 'e'], list(in_degrees.vertices))
+        self.assertEqual([1, 2, 1, 2, 0], in_degrees.degrees.tolist())
+        self.assertEqual([3, 1, 1, 1, 0], out_degrees.degrees.tolist())
+
+    def test_statistics_are_maintained_incrementally_after_first_read(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.build_graph_from_vertices_and_edges(vertices_list=['a', 'b', 'c'],
+                                                             edges_list=[('a', 'b'), ('b', 'c')])
+
+        with patch('app.directed_graph.GraphStatistics.from_adjacency_list',
+                   side_effect=GraphStatistics.from_adjacency_list) as spied_full_scan:
+            # When
+            a_directed_graph.compute_number_of_edges()
+            a_directed_graph.add_edges([('c', 'a'), ('a', 'd')], create_missing_vertices=True)
+            a_directed_graph.add_vertices(['e'])
+            a_directed_graph.remove_edge('a', 'b')
+            number_of_edges = a_directed_graph.compute_number_of_edges()
+            in_degrees = a_directed_graph.compute_in_degrees_per_vertex()
+            out_degrees = a_directed_graph.compute_out_degrees_per_vertex()
+
+        # Then
+        spied_full_scan.assert_called_once()
+        self.assertEqual(3, number_of_edges)
+        self.assertDictEqual({'a': 1, 'b': 0, 'c': 1, 'd': 1, 'e': 0}, in_degrees)
+        self.assertDictEqual({'a': 1, 'b': 1, 'c': 1, 'd': 0, 'e': 0}, out_degrees)
+
+    def test_remove_vertex_removes_its_incoming_and_outgoing_edges(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.build_graph_from_vertices_and_edges(
+            vertices_list=['a', 'b', 'c'], edges_list=[('a', 'b'), ('a', 'b'), ('b', 'b'), ('b', 'c'), ('c', 'a')])
+        a_directed_graph.compute_number_of_edges()
+
+        # When
+        a_directed_graph.remove_vertex('b')
+
+        # Then
+        self.assertDictEqual({'a': [], 'c': ['a']}, a_directed_graph.adjacency_list)
+        self.assertEqual(1, a_directed_graph.compute_number_of_edges())
+        self.assertDictEqual({'a': 1, 'c': 0}, a_directed_graph.compute_in_degrees_per_vertex())
+        self.assertDictEqual({'a': 0, 'c': 1}, a_directed_graph.compute_out_degrees_per_vertex())
+
+    def test_remove_unknown_edge_or_vertex_should_raise_exception(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.build_graph_from_vertices_and_edges(vertices_list=['a', 'b'], edges_list=[('a', 'b')])
+
+        # When
+        with self.assertRaises(UnknownEdgeException) as edge_error:
+            a_directed_graph.remove_edge('b', 'a')
+        with self.assertRaises(UnknownVertexException) as vertex_error:
+            a_directed_graph.remove_vertex('z')
+
+        # Then
+        self.assertEqual('(b, a) is not an edge of the graph !', edge_error.exception.args[0])
+        self.assertEqual('z is not a vertex of the graph !', vertex_error.exception.args[0])
+
+    def test_version_is_incremented_on_mutations_and_invalidates_memoized_results(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.build_graph_from_vertices_and_edges(vertices_list=['a', 'b'], edges_list=[('a', 'b')])
+        initial_version = a_directed_graph.version
+        first_in_degrees = a_directed_graph.compute_in_degrees_array()
+
+        # When
+        memoized_in_degrees = a_directed_graph.compute_in_degrees_array()
+        a_directed_graph.add_edges([('b', 'b')])
+        updated_in_degrees = a_directed_graph.compute_in_degrees_array()
+
+        # Then
+        self.assertIs(first_in_degrees, memoized_in_degrees)
+        self.assertEqual(initial_version + 1, a_directed_graph.version)
+        self.assertEqual([0, 2], updated_in_degrees.degrees.tolist())
+
+    def test_serialize_then_build_graph_from_binary_file(self):
+        # Given
+        a_given_adjacency_list = {'a': ['b', 'b', 'd', ], 'b': ['d'], 'c': ['a'], 'd': ['c'], 'e': []}
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = a_given_adjacency_list
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = a_directed_graph.serialize_graph_to_binary_file(dir_path)
+
+            # When
+            a_mapped_directed_graph = DirectedGraph()
+            a_mapped_directed_graph.build_graph_from_binary_file(filepath)
+
+            # Then
+            self.assertTrue(filepath.endswith('.dgraph'))
+            self.assertEqual(5, a_mapped_directed_graph.compute_number_of_vertices())
+            self.assertEqual(6, a_mapped_directed_graph.compute_number_of_edges())
+            self.assertDictEqual({'a': 1, 'b': 2, 'c': 1, 'd': 2, 'e': 0},
+                                 a_mapped_directed_graph.compute_in_degrees_per_vertex())
+            self.assertDictEqual({'a': 3, 'b': 1, 'c': 1, 'd': 1, 'e': 0},
+                                 a_mapped_directed_graph.compute_out_degrees_per_vertex())
+            self.assertEqual(['b', 'b', 'd'], a_mapped_directed_graph.adjacency_list['a'])
+
+    def test_serialize_graph_in_chunks_then_stream_compute_statistics(self):
+        # Given
+        a_given_adjacency_list = {'a': ['b', 'b', 'd', ], 'b': ['d'], 'c': ['a'], 'd': ['c'], 'e': []}
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = a_given_adjacency_list
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = a_directed_graph.serialize_graph_in_chunks(dir_path, vertices_per_chunk=2)
+
+            # When
+            statistics = a_directed_graph.stream_compute_statistics(filepath)
+            last_chunks_statistics = a_directed_graph.stream_compute_statistics(filepath, chunk_numbers=[1, 2])
+
+        # Then
+        self.assertTrue(filepath.endswith('_chunked.pickle'))
+        self.assertEqual(5, statistics['number_of_vertices'])
+        self.assertEqual(6, statistics['number_of_edges'])
+        self.assertDictEqual({'a': 1, 'b': 2, 'c': 1, 'd': 2, 'e': 0}, statistics['in_degrees'])
+        self.assertDictEqual({'a': 3, 'b': 1, 'c': 1, 'd': 1, 'e': 0}, statistics['out_degrees'])
+        self.assertEqual(3, last_chunks_statistics['number_of_vertices'])
+        self.assertEqual(2, last_chunks_statistics['number_of_edges'])
+
+    def test_stream_compute_statistics_with_chunk_numbers_on_file_without_index_should_raise_exception(self):
+        # Given
+        chunks = [{'a': ['b']}, {'b': []}]
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = self._write_pickle_chunks(dir_path, chunks)
+            a_directed_graph = DirectedGraph()
+
+            # When
+            with self.assertRaises(InvalidGraphFileException) as custom_error:
+                a_directed_graph.stream_compute_statistics(filepath, chunk_numbers=[1])
+
+        # Then
+        self.assertEqual(f'{filepath} has no chunk index, chunks cannot be selected !', custom_error.exception.args[0])
+
+    def test_stream_computations_merge_vertices_split_across_chunks(self):
+        # Given
+        chunks = [{'a': ['b', 'b'], 'b': ['d']}, {'c': ['a'], 'a': ['d']}, {'d': ['c'], 'e': []}]
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = self._write_pickle_chunks(dir_path, chunks)
+            a_directed_graph = DirectedGraph()
+
+            # When
+            statistics = a_directed_graph.stream_compute_statistics(filepath)
+            merged_degrees = a_directed_graph.stream_compute_merged_degrees(filepath, max_vertices_in_memory=2,
+                                                                            spill_dir=dir_path)
+
+            # Then
+            self.assertEqual(5, statistics['number_of_vertices'])
+            self.assertDictEqual({'a': 1, 'b': 2, 'c': 1, 'd': 2, 'e': 0}, statistics['in_degrees'])
+            self.assertDictEqual({'a': 3, 'b': 1, 'c': 1, 'd': 1, 'e': 0}, statistics['out_degrees'])
+            self.assertEqual(5, merged_degrees.number_of_vertices)
+            self.assertEqual(6, merged_degrees.number_of_edges)
+            self.assertDictEqual(statistics['in_degrees'], merged_degrees.in_degrees())
+            self.assertDictEqual(statistics['out_degrees'], merged_degrees.out_degrees())
+
+    def test_stream_compute_statistics_in_parallel(self):
+        # Given
+        a_given_adjacency_list = {'a': ['b', 'b', 'd', ], 'b': ['d'], 'c': ['a'], 'd': ['c'], 'e': []}
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = a_given_adjacency_list
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            indexed_filepath = a_directed_graph.serialize_graph_in_chunks(dir_path, vertices_per_chunk=2)
+            not_indexed_filepath = self._write_pickle_chunks(dir_path, [a_given_adjacency_list])
+
+            # When
+            statistics = a_directed_graph.stream_compute_statistics_in_parallel(indexed_filepath, workers=2)
+            sequential_statistics = a_directed_graph.stream_compute_statistics_in_parallel(not_indexed_filepath,
+                                                                                           workers=2)
+
+        # Then
+        self.assertEqual(5, statistics['number_of_vertices'])
+        self.assertEqual(6, statistics['number_of_edges'])
+        self.assertDictEqual({'a': 1, 'b': 2, 'c': 1, 'd': 2, 'e': 0}, statistics['in_degrees'])
+        self.assertDictEqual({'a': 3, 'b': 1, 'c': 1, 'd': 1, 'e': 0}, statistics['out_degrees'])
+        self.assertDictEqual(statistics, sequential_statistics)
+
+    def test_traversals_and_analytics_by_vertex_name(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = {'a': ['b', 'b'], 'b': ['d', 'e'], 'c': ['a'], 'd': ['c'], 'e': [], 'f': []}
+
+        # When
+        breadth_first_order = a_directed_graph.breadth_first_search('a')
+        depth_first_order = a_directed_graph.depth_first_search('a')
+        two_hop_reachable_vertices = a_directed_graph.compute_k_hop_reachable_vertices('a', 2)
+        components = a_directed_graph.compute_strongly_connected_components()
+
+        # Then
+        self.assertEqual(['a', 'b', 'd', 'e', 'c'], breadth_first_order)
+        self.assertEqual(['a', 'b', 'd', 'c', 'e'], depth_first_order)
+        self.assertEqual(['a', 'b', 'd', 'e'], two_hop_reachable_vertices)
+        self.assertCountEqual([['a', 'b', 'c', 'd'], ['e'], ['f']], components)
+        self.assertFalse(a_directed_graph.is_acyclic())
+
+    def test_topological_sort_follows_mutations(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.build_graph_from_vertices_and_edges(vertices_list=['a', 'b', 'c'],
+                                                             edges_list=[('a', 'b'), ('b', 'c')])
+        first_order = a_directed_graph.topological_sort()
+
+        # When
+        a_directed_graph.add_edges([('c', 'a')])
+
+        # Then
+        self.assertEqual(['a', 'b', 'c'], first_order)
+        with self.assertRaises(CycleDetectedException):
+            a_directed_graph.topological_sort()
+
+    def test_traversal_from_unknown_vertex_should_raise_exception(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = {'a': []}
+
+        # When
+        with self.assertRaises(UnknownVertexException) as custom_error:
+            a_directed_graph.breadth_first_search('z')
+
+        # Then
+        self.assertEqual('z is not a vertex of the graph !', custom_error.exception.args[0])
+
+    def test_reverse_index_is_maintained_on_build_and_mutations(self):
+        # Given
+        a_directed_graph = DirectedGraph(with_reverse_index=True)
+        a_directed_graph.build_graph_from_vertices_and_edges(
+            vertices_list=['a', 'b', 'c'], edges_list=[('a', 'b'), ('a', 'b'), ('b', 'b'), ('b', 'c'), ('c', 'a')])
+
+        # When
+        a_directed_graph.add_edges([('c', 'b'), ('d', 'b')], create_missing_vertices=True)
+        a_directed_graph.remove_edge('a', 'b')
+        a_directed_graph.remove_vertex('c')
+
+        # Then
+        self.assertEqual(['a', 'b', 'd'], a_directed_graph.predecessors('b'))
+        self.assertEqual([], a_directed_graph.predecessors('a'))
+        self.assertEqual([], a_directed_graph.predecessors('d'))
+        self.assertEqual(3, a_directed_graph.compute_in_degree('b'))
+        self.assertDictEqual({'a': ['b'], 'b': ['b'], 'd': ['b']}, a_directed_graph.adjacency_list)
+
+    def test_reverse_index_is_built_lazily_on_first_predecessor_query(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = {'a': ['b', 'b', 'z'], 'b': ['a'], 'c': ['b']}
+
+        # When
+        predecessors = a_directed_graph.predecessors('b')
+        a_directed_graph.remove_vertex('c')
+
+        # Then
+        self.assertEqual(['a', 'a', 'c'], predecessors)
+        self.assertEqual(['a', 'a'], a_directed_graph.predecessors('b'))
+        self.assertEqual(1, a_directed_graph.compute_in_degree('a'))
+
+    def test_predecessors_of_unknown_vertex_should_raise_exception(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.build_graph_from_vertices_and_edges(vertices_list=['a', 'b'], edges_list=[('a', 'b')])
+
+        # When
+        with self.assertRaises(UnknownVertexException) as custom_error:
+            a_directed_graph.predecessors('z')
+
+        # Then
+        self.assertEqual('z is not a vertex of the graph !', custom_error.exception.args[0])
+
+    def test_predecessors_when_graph_is_empty_should_raise_exception(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+
+        # When
+        with self.assertRaises(GraphNotBuiltException) as custom_error:
+            a_directed_graph.compute_in_degree('a')
+
+        # Then
+        self.assertEqual('You have to build a graph before making computations on it!', custom_error.exception.args[0])
+
+    def test_serialize_then_load_reverse_index(self):
+        # Given
+        a_directed_graph = DirectedGraph(with_reverse_index=True)
+        a_directed_graph.build_graph_from_vertices_and_edges(
+            vertices_list=['a', 'b', 'c'], edges_list=[('a', 'b'), ('c', 'b'), ('b', 'a')])
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            a_directed_graph.serialize_graph(dir_path)
+            pickle_filepath, reverse_index_filepath = sorted(
+                os.path.join(dir_path, filename) for filename in os.listdir(dir_path))
+            binary_filepath = a_directed_graph.serialize_graph_to_binary_file(dir_path)
+
+            # When
+            a_loaded_directed_graph = DirectedGraph(with_reverse_index=True)
+            with patch.object(DirectedGraph, '_build_reverse_adjacency_list') as mocked_build:
+                a_loaded_directed_graph.build_graph_from_pickle_file(pickle_filepath)
+            a_mapped_directed_graph = DirectedGraph(with_reverse_index=True)
+            a_mapped_directed_graph.build_graph_from_binary_file(binary_filepath)
+
+            # Then
+            self.assertTrue(reverse_index_filepath.endswith('.reverse.pickle'))
+            mocked_build.assert_not_called()
+            self.assertEqual(['a', 'c'], a_loaded_directed_graph.predecessors('b'))
+            self.assertEqual(['a', 'c'], a_mapped_directed_graph.predecessors('b'))
+            self.assertEqual(1, a_mapped_directed_graph.compute_in_degree('a'))
+
+    def test_compressed_multiplicities_give_same_statistics_and_traversals(self):
+        # Given
+        a_given_adjacency_list = {'a': ['b', 'b', 'd', ], 'b': ['d', 'd'], 'c': [], 'd': ['c']}
+        a_directed_graph = DirectedGraph(use_csr_backend=True, compress_multiplicities=True)
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = os.path.join(dir_path, 'graph.pickle')
+            with open(filepath, 'wb') as out_file:
+                pickle.dump(a_given_adjacency_list, out_file)
+
+            # When
+            a_directed_graph.build_graph_from_pickle_file(filepath)
+
+        # Then
+        self.assertEqual(4, len(a_directed_graph.csr_graph.targets))
+        self.assertEqual(6, a_directed_graph.compute_number_of_edges())
+        self.assertDictEqual({'a': 0, 'b': 2, 'c': 1, 'd': 3}, a_directed_graph.compute_in_degrees_per_vertex())
+        self.assertDictEqual({'a': 3, 'b': 2, 'c': 0, 'd': 1}, a_directed_graph.compute_out_degrees_per_vertex())
+        self.assertEqual([('b', 2), ('d', 1)], a_directed_graph.weighted_successors('a'))
+        self.assertEqual(['a', 'b', 'd', 'c'], a_directed_graph.topological_sort())
+        self.assertDictEqual(a_given_adjacency_list, dict(a_directed_graph.adjacency_list))
+
+    def test_weighted_successors_on_dict_backend(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.build_graph_from_vertices_and_edges(
+            vertices_list=['a', 'b', 'c'], edges_list=[('a', 'b'), ('a', 'c'), ('a', 'b')])
+
+        # When
+        weighted_successors = a_directed_graph.weighted_successors('a')
+
+        # Then
+        self.assertEqual([('b', 2), ('c', 1)], weighted_successors)
+
+    def test_stream_compute_statistics_records_metrics(self):
+        # Given
+        a_given_adjacency_list = {'a': ['b', 'b', 'd', ], 'b': ['d'], 'c': ['a'], 'd': ['c'], 'e': []}
+        a_metrics_hook = InMemoryMetricsHook()
+        a_directed_graph = DirectedGraph(metrics_hook=a_metrics_hook, log_interval_seconds=3600)
+        a_directed_graph.adjacency_list = a_given_adjacency_list
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = a_directed_graph.serialize_graph_in_chunks(dir_path, vertices_per_chunk=2)
+            with patch.object(a_directed_graph, 'logger') as mocked_logger:
+
+                # When
+                a_directed_graph.stream_compute_statistics(filepath)
+                sequential_counters = dict(a_metrics_hook.counters)
+                a_directed_graph.stream_compute_statistics_in_parallel(filepath, workers=2)
+
+        # Then
+        self.assertEqual(3, sequential_counters[CHUNKS_READ])
+        self.assertEqual(5, sequential_counters[VERTICES_READ])
+        self.assertEqual(6, sequential_counters[EDGES_READ])
+        self.assertGreater(sequential_counters[BYTES_READ], 0)
+        self.assertGreater(sequential_counters[DESERIALIZATION_SECONDS], 0)
+        self.assertGreater(sequential_counters[AGGREGATION_SECONDS], 0)
+        self.assertEqual(6, a_metrics_hook.counters[CHUNKS_READ])
+        self.assertEqual(12, a_metrics_hook.counters[EDGES_READ])
+        self.assertEqual(2 * sequential_counters[BYTES_READ], a_metrics_hook.counters[BYTES_READ])
+        self.assertGreater(a_metrics_hook.counters[DESERIALIZATION_SECONDS],
+                           sequential_counters[DESERIALIZATION_SECONDS])
+        self.assertGreater(a_metrics_hook.gauges[EDGES_PER_SECOND], 0)
+        self.assertGreater(a_metrics_hook.gauges[PEAK_MEMORY_BYTES], 0)
+        # The 3 chunks of the sequential pass are logged in a single line, plus one summary line per pass
+        self.assertEqual(3, mocked_logger.info.call_count)
+
+    def test_build_graph_from_edge_list_file(self):
+        # Given
+        a_directed_graph = DirectedGraph(use_csr_backend=True)
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = os.path.join(dir_path, 'edges.csv')
+            with open(filepath, 'w') as out_file:
+                out_file.write('a,b\na,b\na,d\nb,d\nc,a\nd,c\nnot an edge\n')
+
+            # When
+            report = a_directed_graph.build_graph_from_edge_list_file(filepath, delimiter=',')
+
+        # Then
+        self.assertEqual((6, 1), (report.number_of_edges, report.number_of_malformed_lines))
+        self.assertIsNotNone(a_directed_graph.csr_graph)
+        self.assertEqual(4, a_directed_graph.compute_number_of_vertices())
+        self.assertEqual(6, a_directed_graph.compute_number_of_edges())
+        self.assertDictEqual({'a': 1, 'b': 2, 'c': 1, 'd': 2}, a_directed_graph.compute_in_degrees_per_vertex())
+
+    def test_serialize_graph_in_partitions_then_build_graph_from_partitioned_directory(self):
+        # Given
+        a_given_adjacency_list = {'a': ['b', 'b', 'd', ], 'b': ['d'], 'c': ['a'], 'd': ['c'], 'e': []}
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = a_given_adjacency_list
+        a_lazy_directed_graph = DirectedGraph()
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            partitioned_dir_path = a_directed_graph.serialize_graph_in_partitions(dir_path, number_of_partitions=3)
+
+            # When
+            a_lazy_directed_graph.build_graph_from_partitioned_directory(partitioned_dir_path)
+
+            # Then
+            self.assertTrue(partitioned_dir_path.endswith('_partitioned'))
+            self.assertEqual(5, a_lazy_directed_graph.compute_number_of_vertices())
+            self.assertEqual(6, a_lazy_directed_graph.compute_number_of_edges())
+            self.assertEqual(['b', 'b', 'd'], a_lazy_directed_graph.adjacency_list['a'])
+            self.assertDictEqual({'a': 1, 'b': 2, 'c': 1, 'd': 2, 'e': 0},
+                                 a_lazy_directed_graph.compute_in_degrees_per_vertex())
+            self.assertEqual(['c'], a_lazy_directed_graph.predecessors('a'))
+            self.assertEqual(['a', 'b', 'd', 'c'], a_lazy_directed_graph.breadth_first_search('a'))
+            with self.assertRaises(ReadOnlyGraphException):
+                a_lazy_directed_graph.add_edges([('e', 'a')])
+
+    def test_open_delta_log_then_build_graph_from_pickle_file_replays_changes(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = {'a': ['b', 'b', 'd'], 'b': ['d'], 'c': ['a'], 'd': ['c'], 'e': []}
+        a_reloaded_directed_graph = DirectedGraph(with_reverse_index=True)
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            pickle_filepath = a_directed_graph.serialize_graph(dir_path)
+            a_directed_graph.open_delta_log(pickle_filepath)
+            a_directed_graph.add_vertices(['f'])
+            a_directed_graph.add_edges([('f', 'a'), ('e', 'g'), ('h', 'f')], create_missing_vertices=True)
+            a_directed_graph.add_edges([('a', 'unknown')])
+            a_directed_graph.remove_edge('a', 'b')
+            a_directed_graph.remove_vertex('d')
+
+            # When
+            a_reloaded_directed_graph.build_graph_from_pickle_file(pickle_filepath)
+
+        # Then
+        self.assertDictEqual(a_directed_graph.adjacency_list, a_reloaded_directed_graph.adjacency_list)
+        self.assertEqual(list(a_directed_graph.adjacency_list), list(a_reloaded_directed_graph.adjacency_list))
+        self.assertEqual(['c', 'f'], a_reloaded_directed_graph.predecessors('a'))
+
+    def test_compact_delta_log(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = {'a': ['b'], 'b': []}
+        a_reloaded_directed_graph = DirectedGraph()
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            pickle_filepath = a_directed_graph.serialize_graph(dir_path)
+            a_directed_graph.open_delta_log(pickle_filepath)
+            a_directed_graph.add_edges([('b', 'a')])
+
+            # When
+            compacted_pickle_filepath = a_directed_graph.compact_delta_log()
+            a_directed_graph.add_edges([('b', 'b')])
+            a_reloaded_directed_graph.build_graph_from_pickle_file(compacted_pickle_filepath)
+
+            # Then
+            self.assertNotEqual(pickle_filepath, compacted_pickle_filepath)
+            self.assertEqual(sorted([os.path.basename(compacted_pickle_filepath),
+                                     os.path.basename(a_directed_graph.delta_log.filepath)]),
+                             sorted(os.listdir(dir_path)))
+        self.assertDictEqual({'a': ['b'], 'b': ['a', 'b']}, a_reloaded_directed_graph.adjacency_list)
+
+    def test_compact_delta_log_should_raise_exception_when_no_delta_log_is_opened(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = {'a': []}
+
+        # When
+        with self.assertRaises(DeltaLogNotOpenedException) as custom_error:
+            a_directed_graph.compact_delta_log()
+
+        # Then
+        self.assertEqual('You have to open a delta log before compacting it!', custom_error.exception.args[0])
+
+    def test_subgraph(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = {'ns:a': ['ns:b', 'c'], 'ns:b': ['ns:a', 'ns:a'], 'c': ['ns:b'], 'd': []}
+
+        # When
+        a_subgraph = a_directed_graph.subgraph(prefix='ns:')
+        another_subgraph = a_directed_graph.subgraph(vertices=['d', 'c', 'unknown'])
+        a_predicate_subgraph = a_directed_graph.subgraph(predicate=lambda vertex: vertex != 'ns:a')
+
+        # Then
+        self.assertEqual(2, a_subgraph.compute_number_of_vertices())
+        self.assertEqual(3, a_subgraph.compute_number_of_edges())
+        self.assertDictEqual({'ns:a': 2, 'ns:b': 1}, a_subgraph.compute_in_degrees_per_vertex())
+        self.assertEqual(['ns:a'], a_subgraph.predecessors('ns:b'))
+        self.assertEqual(['d', 'c'], list(another_subgraph.adjacency_list))
+        self.assertEqual(0, another_subgraph.compute_number_of_edges())
+        self.assertDictEqual({'ns:b': 1, 'c': 0, 'd': 0}, a_predicate_subgraph.compute_in_degrees_per_vertex())
+        with self.assertRaises(ReadOnlyGraphException):
+            a_subgraph.add_edges([('ns:a', 'ns:a')])
+
+    def test_stream_compute_statistics_of_a_vertex_selection(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = {'ns:a': ['ns:b', 'c'], 'ns:b': ['ns:a', 'ns:a'], 'c': ['ns:b'], 'd': []}
+        a_vertex_selection = VertexSelection(prefix='ns:')
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = a_directed_graph.serialize_graph_in_chunks(dir_path, vertices_per_chunk=1)
+
+            # When
+            statistics = a_directed_graph.stream_compute_statistics(filepath, vertex_selection=a_vertex_selection)
+            parallel_statistics = a_directed_graph.stream_compute_statistics_in_parallel(
+                filepath, workers=2, vertex_selection=a_vertex_selection)
+
+        # Then
+        expected_statistics = {'number_of_vertices': 2, 'number_of_edges': 3, 'in_degrees': {'ns:a': 2, 'ns:b': 1},
+                               'out_degrees': {'ns:a': 1, 'ns:b': 2}}
+        self.assertDictEqual(expected_statistics, statistics)
+        self.assertDictEqual(expected_statistics, parallel_statistics)
+
+    def test_serialize_graph_does_not_reuse_the_path_of_a_snapshot_with_a_delta_log(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = {'a': [], 'b': []}
+        a_reloaded_directed_graph = DirectedGraph()
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            with patch('time.strftime', return_value='20200101-000000'):
+                pickle_filepath = a_directed_graph.serialize_graph(dir_path)
+                a_directed_graph.open_delta_log(pickle_filepath)
+                a_directed_graph.add_edges([('b', 'a')])
+
+                # When
+                new_pickle_filepath = a_directed_graph.serialize_graph(dir_path)
+            a_reloaded_directed_graph.build_graph_from_pickle_file(new_pickle_filepath)
+
+        # Then
+        self.assertNotEqual(pickle_filepath, new_pickle_filepath)
+        self.assertDictEqual({'a': [], 'b': ['a']}, a_reloaded_directed_graph.adjacency_list)
+
+    def test_remove_edge_to_a_sink_which_is_not_a_vertex(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = {'a': ['b', 'z'], 'b': []}
+        a_directed_graph.compute_out_degrees_array()
+        version = a_directed_graph.version
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            pickle_filepath = a_directed_graph.serialize_graph(dir_path)
+            a_directed_graph.open_delta_log(pickle_filepath)
+
+            # When
+            a_directed_graph.remove_edge('a', 'z')
+
+            # Then
+            self.assertEqual([['remove_edge', 'a', 'z']], list(read_delta_log(a_directed_graph.delta_log.filepath)))
+        self.assertEqual(version + 1, a_directed_graph.version)
+        self.assertEqual(1, a_directed_graph.compute_number_of_edges())
+        self.assertDictEqual({'a': 1, 'b': 0}, a_directed_graph.compute_out_degrees_array().to_dict())
+        self.assertDictEqual({'a': 0, 'b': 1}, a_directed_graph.compute_in_degrees_per_vertex())
+
+    def test_sink_which_becomes_a_vertex_keeps_its_incoming_edges(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = {'a': ['x', 'y', 'x'], 'b': ['x']}
+        a_directed_graph.compute_in_degrees_per_vertex()
+        a_directed_graph.build_reverse_index()
+
+        # When
+        a_directed_graph.add_vertices(['x'])
+        a_directed_graph.add_edges([('y', 'b')], create_missing_vertices=True)
+
+        # Then
+        self.assertDictEqual({'a': 0, 'b': 1, 'x': 3, 'y': 1}, a_directed_graph.compute_in_degrees_per_vertex())
+        self.assertEqual(['a', 'a', 'b'], a_directed_graph.predecessors('x'))
+        self.assertEqual(['a'], a_directed_graph.predecessors('y'))
+
+        # When
+        a_directed_graph.remove_vertex('x')
+
+        # Then
+        self.assertDictEqual({'a': ['y'], 'b': [], 'y': ['b']}, a_directed_graph.adjacency_list)
+        self.assertEqual(2, a_directed_graph.compute_number_of_edges())
+        self.assertDictEqual({'a': 0, 'b': 1, 'y': 1}, a_directed_graph.compute_in_degrees_per_vertex())
+
+    def test_sink_which_becomes_a_vertex_keeps_its_remaining_incoming_edges(self):
+        # Given
+        a_directed_graph = DirectedGraph(with_reverse_index=True)
+        a_directed_graph.adjacency_list = {'a': ['x', 'x'], 'b': ['x']}
+        a_directed_graph.build_reverse_index()
+        a_directed_graph.add_vertices(['c'])
+
+        # When
+        a_directed_graph.remove_edge('a', 'x')
+        a_directed_graph.remove_vertex('b')
+        a_directed_graph.add_vertices(['x'])
+
+        # Then
+        self.assertEqual(['a'], a_directed_graph.predecessors('x'))
+        self.assertEqual(1, a_directed_graph.compute_in_degree('x'))
+
+    def test_traversals_and_csr_backend_leave_out_sinks_which_are_not_vertices(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = {'a': ['z', 'b'], 'b': ['c', 'y'], 'c': []}
+
+        # When
+        breadth_first_order = a_directed_graph.breadth_first_search('a')
+        depth_first_order = a_directed_graph.depth_first_search('a')
+        topological_order = a_directed_graph.topological_sort()
+        components = a_directed_graph.compute_strongly_connected_components()
+        with tempfile.TemporaryDirectory() as dir_path:
+            binary_filepath = a_directed_graph.serialize_graph_to_binary_file(dir_path)
+            a_reloaded_directed_graph = DirectedGraph()
+            a_reloaded_directed_graph.build_graph_from_binary_file(binary_filepath)
+        a_directed_graph.to_csr_backend()
+
+        # Then
+        self.assertEqual(['a', 'b', 'c'], breadth_first_order)
+        self.assertEqual(['a', 'b', 'c'], depth_first_order)
+        self.assertEqual(['a', 'b', 'c'], topological_order)
+        self.assertEqual(3, len(components))
+        self.assertDictEqual({'a': ['b'], 'b': ['c'], 'c': []}, dict(a_directed_graph.adjacency_list))
+        self.assertDictEqual({'a': ['b'], 'b': ['c'], 'c': []}, dict(a_reloaded_directed_graph.adjacency_list))
+
+    def test_stream_and_in_memory_in_degrees_agree_on_sinks_which_are_not_vertices(self):
+        # Given
+        a_directed_graph = DirectedGraph()
+        a_directed_graph.adjacency_list = {'a': ['b', 'z'], 'b': ['a']}
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = a_directed_graph.serialize_graph_in_chunks(dir_path, vertices_per_chunk=1)
+
+            # When
+            statistics = a_directed_graph.stream_compute_statistics(filepath)
+            parallel_statistics = a_directed_graph.stream_compute_statistics_in_parallel(filepath, workers=2)
+            merged_in_degrees = a_directed_graph.stream_compute_merged_degrees(filepath).in_degrees()
+
+        # Then
+        self.assertDictEqual({'a': 1, 'b': 1}, a_directed_graph.compute_in_degrees_per_vertex())
+        self.assertDictEqual({'a': 1, 'b': 1}, statistics['in_degrees'])
+        self.assertDictEqual({'a': 1, 'b': 1}, parallel_statistics['in_degrees'])
+        self.assertDictEqual({'a': 1, 'b': 1}, merged_in_degrees)
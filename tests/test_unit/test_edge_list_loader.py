@@ -0,0 +1,111 @@
+import gzip
+import io
+import os
+import tempfile
+from unittest import TestCase
+
+from app.edge_list_loader import is_well_formed_block, iter_line_blocks, load_edge_list, tokenize_block
+from app.exceptions import SerializedGraphFilePathNotFound
+
+
+class TestEdgeListLoader(TestCase):
+
+    def setUp(self):
+        self.an_edge_list = b'a\tb\na\tb\nb\td\nc\ta\nd\tc\ne\tf\n'
+        self.an_adjacency_list = {'a': ['b', 'b'], 'b': ['d'], 'c': ['a'], 'd': ['c'], 'e': ['f'], 'f': []}
+
+    def test_iter_line_blocks_yields_whole_lines(self):
+        # Given
+        an_edge_list_file = io.BytesIO(b'a\tb\nc\td\ne\tf')
+
+        # When
+        blocks = list(iter_line_blocks(an_edge_list_file, block_size=5))
+
+        # Then
+        self.assertEqual([b'a\tb\n', b'c\td\n', b'e\tf\n'], blocks)
+
+    def test_is_well_formed_block(self):
+        self.assertTrue(is_well_formed_block(self.an_edge_list, b'\t'))
+        self.assertTrue(is_well_formed_block(b'', b'\t'))
+        # A line without delimiter and a line with two delimiters give the right number of tokens
+        self.assertFalse(is_well_formed_block(b'a\nb\tc\td\n', b'\t'))
+        self.assertFalse(is_well_formed_block(b'a\tb\n\tc\n', b'\t'))
+        self.assertFalse(is_well_formed_block(b'a\tb\nc\t\n', b'\t'))
+        self.assertFalse(is_well_formed_block(b'a\tb\n#c\td\n', b'\t'))
+        self.assertFalse(is_well_formed_block(b'a::b\n', b'::'))
+
+    def test_tokenize_block_skips_comments_blank_and_malformed_lines(self):
+        # Given
+        a_block = '# comment\r\na,b\r\n\r\nc\r\nd,e,f\r\né,a\r\n'.encode('utf-8')
+
+        # When
+        sources, sinks, number_of_malformed_lines = tokenize_block(a_block, ',')
+
+        # Then
+        self.assertEqual(['a', 'é'], sources)
+        self.assertEqual(['b', 'a'], sinks)
+        self.assertEqual(2, number_of_malformed_lines)
+
+    def test_load_edge_list_from_plain_and_gzip_files(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            # Given
+            filepath = os.path.join(dir_path, 'edges.tsv')
+            with open(filepath, 'wb') as out_file:
+                out_file.write(b'source\tsink\n' + self.an_edge_list)
+            gzip_filepath = os.path.join(dir_path, 'edges.tsv.gz')
+            with gzip.open(gzip_filepath, 'wb') as out_file:
+                out_file.write(self.an_edge_list)
+
+            # When
+            adjacency_list, report = load_edge_list(filepath, skip_header=True, block_size=7)
+            gzip_adjacency_list, gzip_report = load_edge_list(gzip_filepath)
+
+        # Then
+        self.assertDictEqual(self.an_adjacency_list, adjacency_list)
+        self.assertEqual((6, 0, len(self.an_edge_list) + len(b'source\tsink\n')), report)
+        self.assertDictEqual(self.an_adjacency_list, gzip_adjacency_list)
+        self.assertEqual((6, 0, len(self.an_edge_list)), gzip_report)
+        self.assertIs(adjacency_list['a'][0], adjacency_list['a'][1])
+
+    def test_load_edge_list_should_raise_exception_when_file_not_found(self):
+        # Given
+        provided_filepath = 'mysterious_file.tsv'
+
+        # When
+        with self.assertRaises(SerializedGraphFilePathNotFound) as custom_error:
+            load_edge_list(provided_filepath)
+
+        # Then
+        self.assertEqual(f'{provided_filepath} not found !', custom_error.exception.args[0])
+
+    def test_load_edge_list_groups_names_of_any_length_across_blocks(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            # Given
+            filepath = os.path.join(dir_path, 'edges.csv')
+            with open(filepath, 'wb') as out_file:
+                out_file.write('a_long_vertex_name,b\nb,é\n# comment\nc\né,a_long_vertex_name\n'
+                               'a_long_vertex_name,b\nb,a_longer_vertex_name\n'.encode('utf-8'))
+
+            # When
+            adjacency_list, report = load_edge_list(filepath, delimiter=',', block_size=16)
+
+        # Then
+        self.assertEqual({'a_long_vertex_name': ['b', 'b'], 'b': ['é', 'a_longer_vertex_name'],
+                          'é': ['a_long_vertex_name'], 'a_longer_vertex_name': []}, adjacency_list)
+        self.assertEqual(['a_long_vertex_name', 'b', 'é', 'a_longer_vertex_name'], list(adjacency_list))
+        self.assertEqual((5, 1), report[:2])
+        self.assertIs(adjacency_list['a_long_vertex_name'][0], adjacency_list['a_long_vertex_name'][1])
+
+    def test_load_edge_list_from_empty_file(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            # Given
+            filepath = os.path.join(dir_path, 'edges.tsv')
+            with open(filepath, 'wb') as out_file:
+                out_file.write(b'source\tsink\n')
+
+            # When
+            adjacency_list, report = load_edge_list(filepath, skip_header=True)
+
+        # Then
+        self.assertEqual({}, adjacency_list)
+        self.assertEqual((0, 0, len(b'source\tsink\n')), report)
@@ -0,0 +1,56 @@
+import os
+import pickle
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from click.testing import CliRunner, Result
+
+from app.application.entry_point_work_on_directed_graph_from_file_streaming import \
+    work_on_graph_from_pickle_file_streaming
+from app.stream_accumulators import InDegreesAccumulator, OutDegreesAccumulator
+
+
+class TestEntryPointWorkOnDirectedGraphFromFileStreaming(TestCase):
+
+    def test_summary_only_does_not_accumulate_degrees(self):
+        # Given
+        chunks = [{'a': ['b', 'b', 'd'], 'b': ['d']}, {'c': ['a'], 'd': ['c'], 'e': []}]
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath: str = os.path.join(dir_path, 'graph.pickle')
+            with open(filepath, 'wb') as out_file:
+                for chunk in chunks:
+                    pickle.dump(chunk, out_file)
+
+            # When
+            with patch.object(InDegreesAccumulator, 'update') as spied_in_degrees_update, \
+                    patch.object(OutDegreesAccumulator, 'update') as spied_out_degrees_update:
+                result: Result = CliRunner().invoke(work_on_graph_from_pickle_file_streaming,
+                                                    ['--filepath', filepath, '--summary-only'])
+
+        # Then
+        self.assertEqual(0, result.exit_code, result.output)
+        spied_in_degrees_update.assert_not_called()
+        spied_out_degrees_update.assert_not_called()
+        self.assertEqual('Summary of the graph you entered: \n# Number of vertices is 5\n# Number of edges is 6\n',
+                         result.output)
+
+    def test_summary_only_with_top_k_prints_top_degrees(self):
+        # Given
+        chunks = [{'a': ['b', 'b', 'd'], 'b': ['d']}, {'c': ['a'], 'd': ['c'], 'e': []}]
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath: str = os.path.join(dir_path, 'graph.pickle')
+            with open(filepath, 'wb') as out_file:
+                for chunk in chunks:
+                    pickle.dump(chunk, out_file)
+
+            # When
+            result: Result = CliRunner().invoke(work_on_graph_from_pickle_file_streaming,
+                                                ['--filepath', filepath, '--summary-only', '--top-k', '1'])
+
+        # Then
+        self.assertEqual(0, result.exit_code, result.output)
+        self.assertEqual('Summary of the graph you entered: \n# Number of vertices is 5\n# Number of edges is 6\n'
+                         '# top 1 in degrees are\nb\t2\n# top 1 out degrees are\na\t3\n', result.output)
@@ -0,0 +1,43 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from app.external_merge import ExternalDegreesAggregator
+
+
+class TestExternalMerge(TestCase):
+
+    def test_merge_vertices_split_across_chunks_and_spilled_runs(self):
+        # Given
+        chunks = [{'a': ['b', 'b'], 'b': ['d']}, {'c': ['a'], 'a': ['d']}, {'d': ['c'], 'e': []}, {'b': ['a']}]
+
+        with tempfile.TemporaryDirectory() as spill_dir:
+            an_aggregator = ExternalDegreesAggregator(max_vertices_in_memory=1, spill_dir=spill_dir)
+
+            # When
+            for chunk in chunks:
+                an_aggregator.add_chunk(chunk)
+            number_of_runs = len(an_aggregator.run_filepaths)
+            merged_degrees = an_aggregator.merge()
+
+            # Then
+            self.assertEqual(4, number_of_runs)
+            self.assertEqual(['merged.pickle'], os.listdir(an_aggregator.spill_directory.name))
+            self.assertEqual(5, merged_degrees.number_of_vertices)
+            self.assertEqual(7, merged_degrees.number_of_edges)
+            self.assertEqual([('a', 2, 3), ('b', 2, 2), ('c', 1, 1), ('d', 2, 1), ('e', 0, 0)], list(merged_degrees))
+            self.assertDictEqual({'a': 2, 'b': 2, 'c': 1, 'd': 2, 'e': 0}, merged_degrees.in_degrees())
+            self.assertDictEqual({'a': 3, 'b': 2, 'c': 1, 'd': 1, 'e': 0}, merged_degrees.out_degrees())
+
+    def test_merge_without_spill(self):
+        # Given
+        an_aggregator = ExternalDegreesAggregator()
+
+        # When
+        an_aggregator.add_chunk({'a': ['b', 'z'], 'b': []})
+        merged_degrees = an_aggregator.merge()
+
+        # Then
+        self.assertEqual([], an_aggregator.run_filepaths)
+        self.assertEqual(2, merged_degrees.number_of_vertices)
+        self.assertEqual([('a', 0, 2), ('b', 1, 0)], list(merged_degrees))
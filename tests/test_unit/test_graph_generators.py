@@ -0,0 +1,56 @@
+from collections import Counter
+from unittest import TestCase
+
+from app.config.benchmark_config import GENERATOR_NAMES
+from app.graph_generators import GRAPH_GENERATORS, generate_dense_multi_edge_graph, generate_power_law_graph, \
+    generate_uniform_random_graph
+
+
+class TestGraphGenerators(TestCase):
+
+    def test_generator_names_of_the_benchmark_config_are_the_ones_of_the_generators(self):
+        self.assertEqual(GENERATOR_NAMES, tuple(GRAPH_GENERATORS))
+
+    def test_generators_give_requested_number_of_edges_between_known_vertices(self):
+        for generator_name, generator in GRAPH_GENERATORS.items():
+            # Given
+            number_of_edges = 1_000
+
+            # When
+            a_synthetic_graph = generator(number_of_edges)
+
+            # Then
+            self.assertEqual(generator_name, a_synthetic_graph.name)
+            self.assertEqual(number_of_edges, a_synthetic_graph.number_of_edges)
+            edges = list(a_synthetic_graph.edges())
+            self.assertEqual(number_of_edges, len(edges))
+            self.assertTrue(set(vertex for edge in edges for vertex in edge) <= set(a_synthetic_graph.vertices))
+            self.assertEqual(number_of_edges, sum(map(len, a_synthetic_graph.to_adjacency_list().values())))
+
+    def test_generators_are_reproducible_with_a_seed(self):
+        # Given
+        a_seed = 42
+
+        # When
+        a_synthetic_graph = generate_uniform_random_graph(1_000, seed=a_seed)
+        a_same_synthetic_graph = generate_uniform_random_graph(1_000, seed=a_seed)
+        another_synthetic_graph = generate_uniform_random_graph(1_000, seed=a_seed + 1)
+
+        # Then
+        self.assertEqual(list(a_synthetic_graph.edges()), list(a_same_synthetic_graph.edges()))
+        self.assertNotEqual(list(a_synthetic_graph.edges()), list(another_synthetic_graph.edges()))
+
+    def test_power_law_graph_has_hubs_and_dense_graph_has_parallel_edges(self):
+        # Given
+        number_of_edges = 10_000
+
+        # When
+        a_power_law_graph = generate_power_law_graph(number_of_edges)
+        a_uniform_random_graph = generate_uniform_random_graph(number_of_edges)
+        a_dense_multi_edge_graph = generate_dense_multi_edge_graph(number_of_edges)
+
+        # Then
+        self.assertGreater(max(Counter(a_power_law_graph.sinks.tolist()).values()),
+                           5 * max(Counter(a_uniform_random_graph.sinks.tolist()).values()))
+        self.assertEqual(10, len(a_dense_multi_edge_graph.vertices))
+        self.assertLessEqual(len(set(a_dense_multi_edge_graph.edges())), 100)
@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+from app.graph_statistics import GraphStatistics
+
+
+class TestGraphStatistics(TestCase):
+
+    def test_from_adjacency_list(self):
+        # Given
+        an_adjacency_list = {'a': ['b', 'b', 'd', ], 'b': ['d'], 'c': ['a'], 'd': ['c'], 'e': []}
+
+        # When
+        statistics = GraphStatistics.from_adjacency_list(an_adjacency_list)
+
+        # Then
+        self.assertEqual(6, statistics.number_of_edges)
+        self.assertDictEqual({'a': 1, 'b': 2, 'c': 1, 'd': 2, 'e': 0}, statistics.in_degrees)
+        self.assertDictEqual({'a': 3, 'b': 1, 'c': 1, 'd': 1, 'e': 0}, statistics.out_degrees)
+
+    def test_incremental_updates(self):
+        # Given
+        statistics = GraphStatistics.from_adjacency_list({'a': ['b', 'b'], 'b': []})
+
+        # When
+        statistics.add_vertex('c')
+        statistics.add_edge('c', 'a')
+        statistics.remove_edges('a', 'b', multiplicity=2)
+
+        # Then
+        self.assertEqual(1, statistics.number_of_edges)
+        self.assertDictEqual({'a': 1, 'b': 0, 'c': 0}, statistics.in_degrees)
+        self.assertDictEqual({'a': 0, 'b': 0, 'c': 1}, statistics.out_degrees)
@@ -0,0 +1,73 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from app.metrics import BYTES_READ, EDGES_PER_SECOND, InMemoryMetricsHook, PrometheusTextExporter, \
+    RateLimitedThroughputLogger, get_peak_rss_bytes
+
+
+class TestMetrics(TestCase):
+
+    def test_in_memory_metrics_hook_sums_counters_and_keeps_last_gauges(self):
+        # Given
+        a_metrics_hook = InMemoryMetricsHook()
+
+        # When
+        a_metrics_hook.increment(BYTES_READ, 100)
+        a_metrics_hook.increment(BYTES_READ, 50)
+        a_metrics_hook.increment('custom_total')
+        a_metrics_hook.set_gauge(EDGES_PER_SECOND, 10.0)
+        a_metrics_hook.set_gauge(EDGES_PER_SECOND, 20.0)
+
+        # Then
+        self.assertDictEqual({BYTES_READ: 150, 'custom_total': 1}, a_metrics_hook.counters)
+        self.assertDictEqual({EDGES_PER_SECOND: 20.0}, a_metrics_hook.gauges)
+
+    def test_prometheus_text_exporter_writes_metrics_to_file(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            # Given
+            filepath = os.path.join(dir_path, 'directed_graph.prom')
+            a_metrics_exporter = PrometheusTextExporter(filepath)
+            a_metrics_exporter.increment(BYTES_READ, 150)
+            a_metrics_exporter.increment('custom_total')
+            a_metrics_exporter.set_gauge(EDGES_PER_SECOND, 20.5)
+
+            # When
+            a_metrics_exporter.export()
+
+            # Then
+            with open(filepath) as in_file:
+                text = in_file.read()
+            self.assertEqual(['directed_graph.prom'], os.listdir(dir_path))
+        self.assertEqual(f'# TYPE custom_total counter\n'
+                         f'custom_total 1\n'
+                         f'# HELP {BYTES_READ} Bytes of serialized chunks read by the stream computations\n'
+                         f'# TYPE {BYTES_READ} counter\n'
+                         f'{BYTES_READ} 150\n'
+                         f'# HELP {EDGES_PER_SECOND} Throughput of the last stream computation\n'
+                         f'# TYPE {EDGES_PER_SECOND} gauge\n'
+                         f'{EDGES_PER_SECOND} 20.5\n', text)
+
+    def test_rate_limited_throughput_logger_aggregates_chunks_between_logs(self):
+        # Given
+        a_logger = Mock()
+        with patch('time.perf_counter', side_effect=[0.0, 1.0, 2.0, 6.0, 7.0]):
+            a_throughput_logger = RateLimitedThroughputLogger(a_logger, interval_seconds=5.0)
+
+            # When
+            a_throughput_logger.record(10, 100, 1000, 0.5)
+            a_throughput_logger.record(10, 100, 1000, 0.5)
+            a_throughput_logger.record(10, 100, 1000, 0.5)
+            a_throughput_logger.record(5, 50, 500, 0.5)
+        a_throughput_logger.flush()
+
+        # Then
+        self.assertEqual(2, a_logger.info.call_count)
+        self.assertTrue(a_logger.info.call_args_list[0].args[0].startswith(
+            'Chunks 1 to 3: 30 vertices, 300 edges, 3000 bytes in 1.500s (200 edges/s'))
+        self.assertTrue(a_logger.info.call_args_list[1].args[0].startswith(
+            'Chunks 4 to 4: 5 vertices, 50 edges, 500 bytes'))
+
+    def test_get_peak_rss_bytes(self):
+        self.assertGreater(get_peak_rss_bytes(), 1024 * 1024)
@@ -0,0 +1,61 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from app.name_grouping import PackedNames, group_names, group_packed_names, group_rows
+
+
+class TestNameGrouping(TestCase):
+
+    def test_group_rows_numbers_groups_in_sorted_order_and_gives_their_first_row(self):
+        # Given
+        some_keys = np.array([[3, 1], [1, 2], [3, 1], [1, 2], [1, 3]], dtype=np.uint64)
+
+        # When
+        groups, first_rows = group_rows(some_keys)
+
+        # Then
+        self.assertEqual(groups[0], groups[2])
+        self.assertEqual(groups[1], groups[3])
+        self.assertEqual(3, len(set(groups.tolist())))
+        self.assertEqual([0, 1, 4], sorted(first_rows.tolist()))
+
+    def test_group_rows_stays_exact_when_different_rows_share_a_hash(self):
+        # Given
+        some_keys = np.array([[3, 1], [1, 2], [3, 1], [1, 3]], dtype=np.uint64)
+
+        # When
+        with patch('app.name_grouping._hash_rows', return_value=np.zeros(4, dtype=np.uint64)):
+            groups, first_rows = group_rows(some_keys)
+
+        # Then
+        self.assertEqual(groups[0], groups[2])
+        self.assertEqual(3, len(set(groups.tolist())))
+        self.assertEqual([0, 1, 3], sorted(first_rows.tolist()))
+
+    def test_group_names_in_order_of_first_occurrence(self):
+        # Given
+        some_names = ['a_long_vertex_name', 'é', '', 'b', 'é', 'a_long_vertex_name', 'a_long_vertex_namf', '']
+        encoded_names = [name.encode('utf-8') for name in some_names]
+        characters = np.frombuffer(b''.join(encoded_names), dtype=np.uint8)
+        lengths = np.array([len(name) for name in encoded_names], dtype=np.int64)
+        starts = np.cumsum(lengths) - lengths
+
+        # When
+        distinct_names, groups = group_names(characters, starts, lengths)
+
+        # Then
+        self.assertEqual(['a_long_vertex_name', 'é', '', 'b', 'a_long_vertex_namf'], distinct_names)
+        self.assertEqual([0, 1, 2, 3, 1, 0, 4, 2], groups.tolist())
+
+    def test_group_packed_names(self):
+        # Given
+        some_packed_names = [PackedNames(['a', 'bb']), PackedNames([]), PackedNames(['bb', 'c'])]
+
+        # When
+        distinct_names, groups = group_packed_names(some_packed_names)
+
+        # Then
+        self.assertEqual(['a', 'bb', 'c'], distinct_names)
+        self.assertEqual([0, 1, 1, 2], groups.tolist())
@@ -0,0 +1,90 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from app.chunked_pickle import ChunkInfo, write_chunked_graph
+from app.exceptions import UnmergeableAccumulatorException
+from app.parallel_streaming import merge_partial_results, parallel_compute_statistics, split_into_tasks
+from app.stream_accumulators import ExternalMergeAccumulator, NumberOfEdgesAccumulator, \
+    create_default_accumulators
+
+
+class TestParallelStreaming(TestCase):
+
+    def test_split_into_tasks_by_number_of_chunks_and_bytes(self):
+        # Given
+        chunk_infos = [ChunkInfo(0, 10, 1, 1), ChunkInfo(10, 10, 1, 1), ChunkInfo(20, 30, 1, 1),
+                       ChunkInfo(50, 10, 1, 1)]
+
+        # When
+        tasks = split_into_tasks(chunk_infos, max_chunks_per_task=2, max_bytes_per_task=35)
+
+        # Then
+        self.assertEqual([chunk_infos[:2], chunk_infos[2:3], chunk_infos[3:]], tasks)
+
+    def test_merge_partial_results(self):
+        # Given
+        accumulators = create_default_accumulators()
+        partial_results = []
+        for chunk in [{'a': ['b', 'z']}, {'b': ['a', 'a']}, {'c': ['b']}]:
+            task_accumulators = [accumulator.fresh() for accumulator in accumulators]
+            for accumulator in task_accumulators:
+                accumulator.update(chunk)
+            partial_results.append([accumulator.partial_result() for accumulator in task_accumulators])
+
+        # When
+        merge_partial_results(accumulators, partial_results)
+
+        # Then
+        statistics = {accumulator.name: accumulator.result() for accumulator in accumulators}
+        self.assertEqual(3, statistics['number_of_vertices'])
+        self.assertEqual(5, statistics['number_of_edges'])
+        self.assertDictEqual({'a': 2, 'b': 2, 'c': 0}, statistics['in_degrees'])
+        self.assertDictEqual({'a': 2, 'b': 2, 'c': 1}, statistics['out_degrees'])
+
+    def test_parallel_compute_statistics_matches_sequential_results(self):
+        # Given
+        an_adjacency_list = {'a': ['b', 'b', 'd', ], 'b': ['d'], 'c': ['a'], 'd': ['c'], 'e': []}
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = os.path.join(dir_path, 'graph.pickle')
+            chunk_infos = write_chunked_graph(an_adjacency_list, filepath, vertices_per_chunk=1)
+
+            # When
+            accumulators = parallel_compute_statistics(filepath, chunk_infos, create_default_accumulators(),
+                                                       workers=2, max_chunks_per_task=2, max_pending_results=2)
+
+        # Then
+        statistics = {accumulator.name: accumulator.result() for accumulator in accumulators}
+        self.assertEqual(5, statistics['number_of_vertices'])
+        self.assertEqual(6, statistics['number_of_edges'])
+        self.assertDictEqual({'a': 1, 'b': 2, 'c': 1, 'd': 2, 'e': 0}, statistics['in_degrees'])
+        self.assertDictEqual({'a': 3, 'b': 1, 'c': 1, 'd': 1, 'e': 0}, statistics['out_degrees'])
+
+    def test_parallel_compute_statistics_counts_the_state_of_given_accumulators_once(self):
+        # Given
+        an_accumulator = NumberOfEdgesAccumulator()
+        an_accumulator.update({'a': ['b', 'b']})
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            filepath = os.path.join(dir_path, 'graph.pickle')
+            chunk_infos = write_chunked_graph({'a': ['b'], 'b': ['a']}, filepath, vertices_per_chunk=1)
+
+            # When
+            accumulators = parallel_compute_statistics(filepath, chunk_infos, [an_accumulator], workers=2,
+                                                       max_chunks_per_task=1)
+
+        # Then
+        self.assertEqual(4, accumulators[0].result())
+
+    def test_parallel_compute_statistics_should_raise_exception_on_unmergeable_accumulator_before_reading(self):
+        # Given
+        an_accumulator = ExternalMergeAccumulator()
+
+        # When
+        with self.assertRaises(UnmergeableAccumulatorException) as custom_error:
+            parallel_compute_statistics('mysterious_file.pickle', [ChunkInfo(0, 10, 1, 1)], [an_accumulator])
+
+        # Then
+        self.assertEqual('ExternalMergeAccumulator cannot be merged, it cannot be computed in parallel !',
+                         custom_error.exception.args[0])
@@ -0,0 +1,92 @@
+import json
+import os
+import sys
+import tempfile
+from unittest import TestCase
+
+from app.exceptions import InvalidGraphFileException, SerializedGraphFilePathNotFound
+from app.partitioned_graph import MANIFEST_FILENAME, PartitionedAdjacencyList, estimate_partition_memory, \
+    partition_of, read_partition, write_partitioned_graph
+
+
+class TestPartitionedGraph(TestCase):
+
+    def setUp(self):
+        self.an_adjacency_list = {f'v{i}': [f'v{(i + 1) % 50}', f'v{(i * 7) % 50}'] for i in range(50)}
+
+    def test_write_partitioned_graph_hash_partitions_vertices(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            # When
+            partition_infos = write_partitioned_graph(self.an_adjacency_list, dir_path, number_of_partitions=4,
+                                                      vertices_per_chunk=3)
+
+            # Then
+            self.assertEqual(4, len(partition_infos))
+            self.assertEqual(50, sum(partition_info.number_of_vertices for partition_info in partition_infos))
+            self.assertEqual(100, sum(partition_info.number_of_edges for partition_info in partition_infos))
+            for partition_number, partition_info in enumerate(partition_infos):
+                partition = read_partition(os.path.join(dir_path, partition_info.filename))
+                self.assertEqual(partition_info.number_of_vertices, len(partition))
+                self.assertTrue(all(partition_of(vertex, 4) == partition_number for vertex in partition))
+
+    def test_partitioned_adjacency_list_loads_partitions_on_demand(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            # Given
+            write_partitioned_graph(self.an_adjacency_list, dir_path, number_of_partitions=4)
+            a_partitioned_adjacency_list = PartitionedAdjacencyList(dir_path)
+
+            # When
+            successors = a_partitioned_adjacency_list['v3']
+
+            # Then
+            self.assertEqual(['v4', 'v21'], successors)
+            self.assertEqual(1, a_partitioned_adjacency_list.number_of_loads)
+            self.assertEqual(50, len(a_partitioned_adjacency_list))
+            self.assertNotIn('v50', a_partitioned_adjacency_list)
+            self.assertNotIn(3, a_partitioned_adjacency_list)
+            with self.assertRaises(KeyError):
+                a_partitioned_adjacency_list['v50']
+            self.assertDictEqual(self.an_adjacency_list, dict(a_partitioned_adjacency_list.items()))
+            self.assertEqual(4, a_partitioned_adjacency_list.number_of_loads)
+
+    def test_partitioned_adjacency_list_evicts_least_recently_used_partitions(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            # Given
+            partition_infos = write_partitioned_graph(self.an_adjacency_list, dir_path, number_of_partitions=4)
+            a_partitioned_adjacency_list = PartitionedAdjacencyList(dir_path, max_cached_bytes=1)
+            a_vertex = next(vertex for vertex in self.an_adjacency_list if partition_of(vertex, 4) == 0)
+            another_vertex = next(vertex for vertex in self.an_adjacency_list if partition_of(vertex, 4) == 1)
+
+            # When
+            for vertex in (a_vertex, a_vertex, another_vertex, a_vertex):
+                a_partitioned_adjacency_list[vertex]
+
+            # Then
+            self.assertEqual(3, a_partitioned_adjacency_list.number_of_loads)
+            self.assertEqual(estimate_partition_memory(read_partition(os.path.join(dir_path, partition_infos[0].filename))),
+                             a_partitioned_adjacency_list.cached_bytes)
+
+    def test_partitioned_adjacency_list_should_raise_exception_when_manifest_is_missing_or_invalid(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            manifest_filepath = os.path.join(dir_path, MANIFEST_FILENAME)
+            with self.assertRaises(SerializedGraphFilePathNotFound) as custom_error:
+                PartitionedAdjacencyList(dir_path)
+            self.assertEqual(f'{manifest_filepath} not found !', custom_error.exception.args[0])
+
+            with open(manifest_filepath, 'w') as out_file:
+                json.dump({'format': 'something else'}, out_file)
+            with self.assertRaises(InvalidGraphFileException) as custom_error:
+                PartitionedAdjacencyList(dir_path)
+            self.assertEqual(f'{manifest_filepath} is not a valid manifest !', custom_error.exception.args[0])
+
+    def test_estimate_partition_memory_counts_shared_strings_once(self):
+        # Given
+        a_partition = {'a': ['b', 'b'], 'b': ['a']}
+
+        # When
+        estimated_bytes = estimate_partition_memory(a_partition)
+
+        # Then
+        expected_bytes = sys.getsizeof(a_partition) + sys.getsizeof(a_partition['a']) + sys.getsizeof(a_partition['b']) \
+            + sys.getsizeof('a') + sys.getsizeof('b')
+        self.assertEqual(expected_bytes, estimated_bytes)
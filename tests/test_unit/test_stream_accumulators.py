@@ -0,0 +1,123 @@
+import pickle
+from unittest import TestCase
+
+from app.stream_accumulators import NumberOfVerticesAccumulator, NumberOfEdgesAccumulator, InDegreesAccumulator, \
+    OutDegreesAccumulator, create_default_accumulators
+
+
+class TestStreamAccumulators(TestCase):
+
+    def test_accumulators_aggregate_several_chunks(self):
+        # Given
+        chunks = [{'a': ['b', 'b', 'd'], 'b': ['d']}, {'c': ['a'], 'd': ['c'], 'e': []}]
+        accumulators = [NumberOfVerticesAccumulator(), NumberOfEdgesAccumulator(), InDegreesAccumulator(),
+                        OutDegreesAccumulator()]
+
+        # When
+        for chunk in chunks:
+            for accumulator in accumulators:
+                accumulator.update(chunk)
+
+        # Then
+        self.assertEqual(5, accumulators[0].result())
+        self.assertEqual(6, accumulators[1].result())
+        self.assertDictEqual({'a': 1, 'b': 2, 'c': 1, 'd': 2, 'e': 0}, accumulators[2].result())
+        self.assertDictEqual({'a': 3, 'b': 1, 'c': 1, 'd': 1, 'e': 0}, accumulators[3].result())
+
+    def test_in_degrees_accumulator_keeps_vertices_without_incoming_edges(self):
+        # Given
+        an_accumulator = InDegreesAccumulator()
+
+        # When
+        an_accumulator.update({'a': [], 'b': []})
+
+        # Then
+        self.assertDictEqual({'a': 0, 'b': 0}, an_accumulator.result())
+
+    def test_in_degrees_accumulator_leaves_out_sinks_which_are_not_vertices(self):
+        # Given
+        an_accumulator = InDegreesAccumulator()
+        another_accumulator = InDegreesAccumulator()
+
+        # When
+        an_accumulator.update({'a': ['b', 'z', 'c']})
+        another_accumulator.update({'b': ['a', 'y']})
+        another_accumulator.update({'c': []})
+        an_accumulator.merge(another_accumulator)
+
+        # Then
+        self.assertDictEqual({'a': 1, 'b': 1, 'c': 1}, an_accumulator.result())
+        self.assertEqual([1, 1, 1], an_accumulator.result_array().degrees.tolist())
+
+    def test_create_default_accumulators_have_distinct_names(self):
+        # When
+        accumulators = create_default_accumulators()
+
+        # Then
+        self.assertEqual(['number_of_vertices', 'number_of_edges', 'in_degrees', 'out_degrees'],
+                         [accumulator.name for accumulator in accumulators])
+
+    def test_degrees_accumulators_return_arrays_aligned_with_vertices(self):
+        # Given
+        an_accumulator = OutDegreesAccumulator()
+
+        # When
+        an_accumulator.update({'a': ['b', 'b'], 'b': []})
+        an_accumulator.update({'c': ['a']})
+
+        # Then
+        self.assertEqual(['a', 'b', 'c'], an_accumulator.result_array().vertices)
+        self.assertEqual([2, 0, 1], an_accumulator.result_array().degrees.tolist())
+
+    def test_number_of_vertices_accumulator_counts_vertices_split_across_chunks_once(self):
+        # Given
+        an_accumulator = NumberOfVerticesAccumulator()
+
+        # When
+        an_accumulator.update({'a': ['b'], 'b': []})
+        an_accumulator.update({'a': ['c'], 'c': []})
+
+        # Then
+        self.assertEqual(3, an_accumulator.result())
+
+    def test_merge_partial_accumulators(self):
+        # Given
+        left_accumulators = create_default_accumulators()
+        right_accumulators = create_default_accumulators()
+        for accumulator in left_accumulators:
+            accumulator.update({'a': ['b', 'b', 'd'], 'b': ['d']})
+        for accumulator in right_accumulators:
+            accumulator.update({'c': ['a'], 'd': ['c'], 'e': [], 'a': ['e']})
+
+        # When
+        for left_accumulator, right_accumulator in zip(left_accumulators, right_accumulators):
+            left_accumulator.merge(right_accumulator)
+
+        # Then
+        self.assertEqual(5, left_accumulators[0].result())
+        self.assertEqual(7, left_accumulators[1].result())
+        self.assertDictEqual({'a': 1, 'b': 2, 'c': 1, 'd': 2, 'e': 1}, left_accumulators[2].result())
+        self.assertDictEqual({'a': 4, 'b': 1, 'c': 1, 'd': 1, 'e': 0}, left_accumulators[3].result())
+
+    def test_merge_pickled_partial_results(self):
+        # Given
+        accumulators = create_default_accumulators()
+        for accumulator in accumulators:
+            accumulator.update({'a': ['b'], 'z': ['a']})
+        pickled_partial_results = []
+        for chunk in [{'a': ['b', 'b', 'd'], 'b': ['d', 'y']}, {'c': ['a'], 'd': ['c'], 'e': [], 'a': ['e']}]:
+            chunk_accumulators = [accumulator.fresh() for accumulator in accumulators]
+            for accumulator in chunk_accumulators:
+                accumulator.update(chunk)
+            pickled_partial_results.append([pickle.dumps(accumulator.partial_result())
+                                            for accumulator in chunk_accumulators])
+
+        # When
+        for accumulator, accumulator_partial_results in zip(accumulators, zip(*pickled_partial_results)):
+            accumulator.merge_partial_results(list(map(pickle.loads, accumulator_partial_results)))
+
+        # Then
+        self.assertEqual(6, accumulators[0].result())
+        self.assertEqual(10, accumulators[1].result())
+        self.assertDictEqual({'a': 2, 'b': 3, 'c': 1, 'd': 2, 'e': 1, 'z': 0}, accumulators[2].result())
+        self.assertDictEqual({'a': 5, 'b': 2, 'c': 1, 'd': 1, 'e': 0, 'z': 1}, accumulators[3].result())
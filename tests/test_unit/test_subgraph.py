@@ -0,0 +1,71 @@
+import pickle
+import sys
+from unittest import TestCase
+
+from app.subgraph import InducedSubgraphView, SortedVertexIndex, VertexSelection, prefix_upper_bound
+
+
+class TestSubgraph(TestCase):
+
+    def setUp(self):
+        self.an_adjacency_list = {'ns:b': ['ns:a', 'other', 'ns:a'], 'ns:a': ['ns:b'], 'other': ['ns:a'],
+                                  'ns': ['dangling'], 'nt:c': []}
+
+    def test_prefix_upper_bound(self):
+        self.assertEqual('nt', prefix_upper_bound('ns'))
+        self.assertEqual('b', prefix_upper_bound('a' + chr(sys.maxunicode)))
+        self.assertIsNone(prefix_upper_bound(''))
+        self.assertIsNone(prefix_upper_bound(chr(sys.maxunicode)))
+
+    def test_sorted_vertex_index_prefix_range(self):
+        # Given
+        a_sorted_vertex_index = SortedVertexIndex(self.an_adjacency_list)
+
+        # When
+        vertices_with_prefix = a_sorted_vertex_index.prefix_range('ns:')
+
+        # Then
+        self.assertEqual(['ns:a', 'ns:b'], vertices_with_prefix)
+        self.assertEqual(['ns', 'ns:a', 'ns:b'], a_sorted_vertex_index.prefix_range('ns'))
+        self.assertEqual([], a_sorted_vertex_index.prefix_range('z'))
+        self.assertEqual(5, len(a_sorted_vertex_index.prefix_range('')))
+
+    def test_vertex_selection_select(self):
+        # Given
+        a_sorted_vertex_index = SortedVertexIndex(self.an_adjacency_list)
+
+        # When
+        explicit_vertices = VertexSelection(vertices=['other', 'unknown', 'ns:b']).select(self.an_adjacency_list)
+        prefixed_vertices = VertexSelection(prefix='ns:').select(self.an_adjacency_list, a_sorted_vertex_index)
+        combined_vertices = VertexSelection(prefix='n', predicate=lambda vertex: ':' in vertex).select(
+            self.an_adjacency_list)
+
+        # Then
+        self.assertEqual(['other', 'ns:b'], explicit_vertices)
+        self.assertEqual(['ns:a', 'ns:b'], prefixed_vertices)
+        self.assertEqual(['ns:b', 'ns:a', 'nt:c'], combined_vertices)
+
+    def test_vertex_selection_induced_chunk(self):
+        # Given
+        a_vertex_selection = VertexSelection(prefix='ns')
+
+        # When
+        induced_chunk = a_vertex_selection.induced_chunk(self.an_adjacency_list)
+
+        # Then
+        self.assertDictEqual({'ns:b': ['ns:a', 'ns:a'], 'ns:a': ['ns:b'], 'ns': []}, induced_chunk)
+        self.assertEqual(a_vertex_selection.prefix, pickle.loads(pickle.dumps(a_vertex_selection)).prefix)
+
+    def test_induced_subgraph_view(self):
+        # Given
+        an_induced_subgraph_view = InducedSubgraphView(self.an_adjacency_list, ['ns:a', 'ns:b', 'other'])
+
+        # Then
+        self.assertEqual(['ns:a', 'other', 'ns:a'], an_induced_subgraph_view['ns:b'])
+        self.assertEqual(3, len(an_induced_subgraph_view))
+        self.assertIn('other', an_induced_subgraph_view)
+        self.assertNotIn('ns', an_induced_subgraph_view)
+        with self.assertRaises(KeyError):
+            an_induced_subgraph_view['ns']
+        self.assertDictEqual({'ns:a': ['ns:b'], 'ns:b': ['ns:a', 'other', 'ns:a'], 'other': ['ns:a']},
+                             dict(an_induced_subgraph_view.items()))
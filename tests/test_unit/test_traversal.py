@@ -0,0 +1,89 @@
+from unittest import TestCase
+
+from app.csr_graph import CSRGraph
+from app.exceptions import CycleDetectedException
+from app.traversal import breadth_first_search, depth_first_search, is_acyclic, strongly_connected_components, \
+    topological_sort
+
+
+class TestTraversal(TestCase):
+
+    def setUp(self):
+        # a -> b -> d -> c -> a is a cycle, e is only reachable from b and f is isolated
+        self.a_csr_graph = CSRGraph.from_adjacency_list(
+            {'a': ['b', 'b'], 'b': ['d', 'e'], 'c': ['a'], 'd': ['c'], 'e': [], 'f': []})
+        self.a_dag = CSRGraph.from_adjacency_list({'a': ['b', 'c'], 'b': ['d'], 'c': ['d'], 'd': [], 'e': ['a']})
+
+    def test_breadth_first_search(self):
+        # When
+        order = breadth_first_search(self.a_csr_graph, 0)
+
+        # Then
+        self.assertEqual([0, 1, 3, 4, 2], order)
+
+    def test_breadth_first_search_with_max_depth(self):
+        # When
+        orders = [breadth_first_search(self.a_csr_graph, 0, max_depth=max_depth) for max_depth in range(4)]
+
+        # Then
+        self.assertEqual([[0], [0, 1], [0, 1, 3, 4], [0, 1, 3, 4, 2]], orders)
+
+    def test_depth_first_search(self):
+        # When
+        order = depth_first_search(self.a_csr_graph, 0)
+
+        # Then
+        self.assertEqual([0, 1, 3, 2, 4], order)
+
+    def test_strongly_connected_components(self):
+        # When
+        labels = strongly_connected_components(self.a_csr_graph).tolist()
+
+        # Then
+        self.assertEqual(labels[0], labels[1])
+        self.assertEqual(labels[0], labels[2])
+        self.assertEqual(labels[0], labels[3])
+        self.assertEqual(3, len(set(labels)))
+        self.assertLess(labels[4], labels[0])
+
+    def test_topological_sort(self):
+        # When
+        order = topological_sort(self.a_dag)
+
+        # Then
+        self.assertEqual([4, 0, 1, 2, 3], order)
+        self.assertTrue(is_acyclic(self.a_dag))
+
+    def test_topological_sort_of_cyclic_graph_should_raise_exception(self):
+        # When
+        with self.assertRaises(CycleDetectedException) as custom_error:
+            topological_sort(self.a_csr_graph)
+
+        # Then
+        self.assertEqual('The graph contains a cycle, 5 vertices cannot be topologically sorted!',
+                         custom_error.exception.args[0])
+        self.assertFalse(is_acyclic(self.a_csr_graph))
+
+    def test_self_loop_is_a_cycle(self):
+        # Given
+        a_csr_graph = CSRGraph.from_adjacency_list({'a': ['a']})
+
+        # When
+        acyclic = is_acyclic(a_csr_graph)
+
+        # Then
+        self.assertFalse(acyclic)
+
+    def test_traversals_of_deep_graph_are_not_bound_by_recursion_limit(self):
+        # Given
+        number_of_vertices = 50000
+        a_chain = CSRGraph.from_adjacency_list(
+            {str(vertex): [str((vertex + 1) % number_of_vertices)] for vertex in range(number_of_vertices)})
+
+        # When
+        depth_first_order = depth_first_search(a_chain, 0)
+        labels = strongly_connected_components(a_chain)
+
+        # Then
+        self.assertEqual(list(range(number_of_vertices)), depth_first_order)
+        self.assertEqual(1, len(set(labels.tolist())))